@@ -1,10 +1,13 @@
 """
 Real-time engine sound synthesis using sounddevice and NumPy
 """
+import bisect
+import math
 import numpy as np
 import threading
-import queue
 import sys
+import time
+from collections import OrderedDict
 
 try:
     import sounddevice as sd
@@ -14,13 +17,223 @@ except ImportError:
     print("Warning: sounddevice not installed. Install with: pip install sounddevice")
 
 
+class ParameterSlot:
+    """
+    Latest-value store for synth parameters, one writer and one reader.
+    
+    The writer makes `sequence` odd while it stores the fields and even again
+    when done (a seqlock); the reader only accepts a read that saw the same
+    even sequence before and after, so it never mixes two updates. It never
+    waits either: a read that races a write returns None and the audio
+    callback keeps its current parameters for one more block. Updates the
+    reader never saw are overwritten and counted in `coalesced`.
+    """
+    
+    def __init__(self):
+        self.rpm = 0.0
+        self.boost = 0.0
+        self.throttle = 0.0
+        self.volume = 0.0
+        self.written_at = 0.0
+        self.sequence = 0
+        self.coalesced = 0
+        self._read_sequence = 0
+    
+    def write(self, rpm, boost, throttle, volume):
+        """Publish a new parameter set (producer thread)"""
+        self.sequence += 1
+        self.rpm = rpm
+        self.boost = boost
+        self.throttle = throttle
+        self.volume = volume
+        self.written_at = time.perf_counter()
+        self.sequence += 1
+    
+    def read(self):
+        """Newest (rpm, boost, throttle, volume), or None if nothing new or mid-write"""
+        sequence = self.sequence
+        if sequence == self._read_sequence or sequence & 1:
+            return None
+        values = (self.rpm, self.boost, self.throttle, self.volume)
+        if self.sequence != sequence:
+            return None
+        self.coalesced += (sequence - self._read_sequence) // 2 - 1
+        self._read_sequence = sequence
+        return values
+    
+    @property
+    def updates(self):
+        """Total updates written"""
+        return self.sequence // 2
+
+
+class CallbackHealth:
+    """
+    Audio callback health: xrun counters plus histograms of callback duration
+    (as a fraction of the block's time budget) and parameter staleness.
+    Updated from the callback with plain integer bumps; read from anywhere.
+    """
+    
+    # Histogram bucket upper edges; the last bucket is open-ended
+    LOAD_EDGES = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+    STALENESS_EDGES_MS = (5, 10, 20, 50, 100, 250, 1000)
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.callbacks = 0
+        self.errors = 0
+        self.underflows = 0
+        self.overflows = 0
+        self.overruns = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.max_load = 0.0
+        self.budget = 0.0
+        self.load_counts = [0] * (len(self.LOAD_EDGES) + 1)
+        self.staleness_counts = [0] * (len(self.STALENESS_EDGES_MS) + 1)
+        self.max_staleness_ms = 0.0
+    
+    def record_status(self, status):
+        """Count the xrun flags sounddevice reported for this block"""
+        if getattr(status, 'output_underflow', False):
+            self.underflows += 1
+        if getattr(status, 'output_overflow', False):
+            self.overflows += 1
+    
+    def record_block(self, duration, budget, staleness=None):
+        """Record one callback: its run time, its deadline and the parameter age"""
+        self.callbacks += 1
+        self.total_time += duration
+        self.budget = budget
+        load = duration / budget if budget > 0 else 0.0
+        self.load_counts[bisect.bisect_left(self.LOAD_EDGES, load)] += 1
+        if load > 1.0:
+            self.overruns += 1
+        if duration > self.max_time:
+            self.max_time = duration
+            self.max_load = load
+        if staleness is not None:
+            staleness_ms = staleness * 1000.0
+            self.staleness_counts[bisect.bisect_left(self.STALENESS_EDGES_MS, staleness_ms)] += 1
+            self.max_staleness_ms = max(self.max_staleness_ms, staleness_ms)
+    
+    @staticmethod
+    def _histogram(edges, counts):
+        labels = [f"<={edge}" for edge in edges] + [f">{edges[-1]}"]
+        return dict(zip(labels, counts))
+    
+    def snapshot(self):
+        """Counters and histograms as a plain dict"""
+        callbacks = self.callbacks
+        return {
+            'callbacks': callbacks,
+            'errors': self.errors,
+            'xruns': self.underflows + self.overflows,
+            'underflows': self.underflows,
+            'overflows': self.overflows,
+            'budget_ms': self.budget * 1000.0,
+            'mean_callback_ms': self.total_time / callbacks * 1000.0 if callbacks else 0.0,
+            'max_callback_ms': self.max_time * 1000.0,
+            'max_load': self.max_load,
+            'overruns': self.overruns,
+            'load_histogram': self._histogram(self.LOAD_EDGES, list(self.load_counts)),
+            'max_staleness_ms': self.max_staleness_ms,
+            'staleness_histogram_ms': self._histogram(self.STALENESS_EDGES_MS, list(self.staleness_counts)),
+        }
+
+
+class ExhaustWavetable:
+    """
+    Band-limited exhaust waveform: a square wave plus square harmonics at the
+    given frequency ratios, summed into one table.
+    
+    The table spans `period` fundamental cycles (2 for ratios of 1, 1.5 and 2)
+    so one lookup per sample yields the whole voice. It is mip-mapped by
+    fundamental: level k keeps only the partials that stay below Nyquist for
+    fundamentals up to base_freq * 2**k. Tables are built with an inverse FFT
+    and cached per (sample rate, harmonics), so every engine shares them.
+    """
+    
+    _cache = {}
+    
+    def __init__(self, sample_rate, harmonics, base_freq=100.0, max_freq=2000.0, size=4096):
+        self.sample_rate = sample_rate
+        self.base_freq = base_freq
+        self.size = size
+        self.period = 2.0
+        levels = int(math.ceil(math.log2(max_freq / base_freq))) + 1
+        nyquist = sample_rate / 2
+        
+        self.tables = []
+        self.slopes = []
+        for level in range(levels):
+            top_freq = base_freq * 2 ** level
+            spectrum = np.zeros(size // 2 + 1, dtype=np.complex128)
+            for ratio, amplitude in harmonics:
+                # Odd harmonics h of a +/-0.5 square: (2 / (pi * h)) * sin(2*pi*h*ratio*t)
+                h = 1
+                while h * ratio * top_freq < nyquist:
+                    k = int(round(h * ratio * self.period))
+                    if k >= size // 2:
+                        break
+                    spectrum[k] += -1j * amplitude * 2 / (np.pi * h) * size / 2
+                    h += 2
+            table = np.fft.irfft(spectrum, size)
+            # Guard sample so index + 1 never wraps during interpolation
+            table = np.append(table, table[0])
+            self.tables.append(table)
+            self.slopes.append(np.append(np.diff(table), 0.0))
+    
+    @classmethod
+    def shared(cls, sample_rate, harmonics):
+        """Return the cached table set for these settings, building it on first use"""
+        key = (sample_rate, tuple(harmonics))
+        if key not in cls._cache:
+            cls._cache[key] = cls(sample_rate, harmonics)
+        return cls._cache[key]
+    
+    def level_for(self, freq):
+        """Mip level whose partials all stay below Nyquist at this fundamental"""
+        if freq <= self.base_freq:
+            return 0
+        return min(len(self.tables) - 1, int(math.ceil(math.log2(freq / self.base_freq))))
+    
+    def lookup(self, phase, freq, out, index):
+        """
+        Read the table at `phase` (fundamental cycles) with linear interpolation.
+        `phase` is used as scratch and overwritten; `index` is an intp buffer.
+        """
+        table = self.tables[self.level_for(freq)]
+        slope = self.slopes[self.level_for(freq)]
+        np.mod(phase, self.period, out=phase)
+        phase *= self.size / self.period
+        np.copyto(index, phase, casting='unsafe')
+        np.subtract(phase, index, out=phase)
+        np.take(slope, index, out=out)
+        out *= phase
+        np.take(table, index, out=phase)
+        out += phase
+        return out
+
+
 class AudioEngine:
     """
     Real-time audio synthesis for engine sounds
-    Uses sine and square waves to simulate engine rumble, exhaust, and turbo whistle
+    Uses sine oscillators and a band-limited exhaust wavetable to simulate engine rumble,
+    exhaust, and turbo whistle
     """
     
-    def __init__(self, sample_rate=44100, blocksize=2048):
+    # Exhaust note harmonics: (frequency ratio, amplitude)
+    EXHAUST_HARMONICS = ((1.0, 0.2), (1.5, 0.12), (2.0, 0.06))
+    
+    # Synth state carried from block to block (see get_synth_state)
+    SYNTH_STATE = ('engine_rumble_freq', 'exhaust_freq', 'turbo_whistle_freq', 'volume',
+                   'current_rpm', 'current_throttle', 'is_idle',
+                   'lfo_phase', 'rumble_phase', 'exhaust_phase', 'turbo_phase')
+    
+    def __init__(self, sample_rate=44100, blocksize=512, realtime=True, synthesis='additive'):
         self.sample_rate = sample_rate
         self.blocksize = blocksize
         self.is_running = False
@@ -41,14 +254,38 @@ class AudioEngine:
         # Audio state tracking
         self.current_rpm = 0
         self.current_throttle = 0
+        self.current_boost = 0
         self.is_idle = True
         
+        # Oscillator phases (in cycles) carried across blocks so the waveforms
+        # stay continuous; the rumble phase wraps at 2 for its subharmonic and
+        # the exhaust phase at the wavetable period
+        self.lfo_phase = 0.0
+        self.rumble_phase = 0.0
+        self.exhaust_phase = 0.0
+        self.turbo_phase = 0.0
+        self.exhaust_table = ExhaustWavetable.shared(sample_rate, self.EXHAUST_HARMONICS)
+        self.rng = np.random.default_rng()
+        self._allocate_buffers(blocksize)
+        
+        # synthesis='granular' plays cached grains instead of running the
+        # oscillators every block
+        if synthesis not in ('additive', 'granular'):
+            raise ValueError(f"Unknown synthesis mode: {synthesis!r}")
+        self.grains = GrainCache(sample_rate) if synthesis == 'granular' else None
+        
         # sounddevice setup
         self.stream = None
         self.stop_event = threading.Event()
-        self.command_queue = queue.Queue()
+        self.params = ParameterSlot()
+        self.health = CallbackHealth()
+        self._stats_thread = None
         
-        if SOUNDDEVICE_AVAILABLE:
+        # Audio-clocked physics driver (see attach_physics)
+        self.physics = None
+        
+        # realtime=False builds the synth only (offline rendering, no stream)
+        if SOUNDDEVICE_AVAILABLE and realtime:
             self.init_audio()
     
     def init_audio(self):
@@ -70,137 +307,405 @@ class AudioEngine:
     
     def audio_callback(self, outdata, frames, time_info, status):
         """sounddevice callback - generates audio in real-time with smooth transitions"""
-        if self.is_running and not self.command_queue.empty():
-            try:
-                cmd = self.command_queue.get_nowait()
-                if cmd['type'] == 'parameters':
-                    # Store previous values for smooth interpolation
-                    self.prev_rumble_freq = self.engine_rumble_freq
-                    self.prev_exhaust_freq = self.exhaust_freq
-                    self.prev_turbo_freq = self.turbo_whistle_freq
-                    self.prev_volume = self.volume
-                    
-                    # Update state
-                    self.current_rpm = cmd['rpm']
-                    self.current_throttle = cmd['throttle']
-                    
-                    # Determine if idle or accelerating
-                    self.is_idle = (self.current_rpm < 1000 and self.current_throttle < 0.1)
-                    
-                    # Smooth frequency updates with bounds checking
-                    target_rumble = max(20, min(300, cmd['rpm'] * 0.08))  # Lower frequency for deeper rumble
-                    target_exhaust = max(100, min(2000, cmd['rpm'] * 0.25 + 150))
-                    target_turbo = max(1500, min(5000, 2000 + cmd['boost'] * 150))
-                    
-                    # Interpolate to prevent sudden jumps (exponential smoothing)
-                    smooth_factor = 0.3  # Lower = smoother transitions
-                    self.engine_rumble_freq = self.prev_rumble_freq + (target_rumble - self.prev_rumble_freq) * smooth_factor
-                    self.exhaust_freq = self.prev_exhaust_freq + (target_exhaust - self.prev_exhaust_freq) * smooth_factor
-                    self.turbo_whistle_freq = self.prev_turbo_freq + (target_turbo - self.prev_turbo_freq) * smooth_factor
-                    
-                    # Volume with smooth fade
-                    target_volume = max(0, min(1, cmd['volume']))
-                    self.volume = self.prev_volume + (target_volume - self.prev_volume) * 0.1
-            except queue.Empty:
-                pass
+        start = time.perf_counter()
+        if status:
+            self.health.record_status(status)
         
+        staleness = None
         try:
-            # Generate audio frames
-            audio_data = self.generate_audio(frames)
-            outdata[:] = audio_data.reshape(-1, 1)  # Reshape to (frames, 1) for mono output
+            if self.physics is not None:
+                self.render_physics_block(outdata[:, 0], frames)
+            else:
+                params = self.params.read() if self.is_running else None
+                if params is not None:
+                    self.apply_parameters(*params)
+                if self.params.sequence:
+                    staleness = start - self.params.written_at
+                
+                # Generate audio frames straight into the (frames, 1) mono output
+                self.synthesize(frames, outdata[:, 0])
         except Exception as e:
+            self.health.errors += 1
             print(f"Error in audio callback: {e}")
             outdata.fill(0)  # Silence on error
+        
+        self.health.record_block(time.perf_counter() - start, frames / self.sample_rate, staleness)
+    
+    def apply_parameters(self, rpm, boost, throttle, volume, smooth=True):
+        """
+        Move the synth toward a new parameter set (called once per block that
+        has one). smooth=False jumps straight to it, for callers that already
+        feed a smooth, high-rate signal.
+        """
+        # Store previous values for smooth interpolation
+        self.prev_rumble_freq = self.engine_rumble_freq
+        self.prev_exhaust_freq = self.exhaust_freq
+        self.prev_turbo_freq = self.turbo_whistle_freq
+        self.prev_volume = self.volume
+        
+        # Update state
+        self.current_rpm = rpm
+        self.current_throttle = throttle
+        self.current_boost = boost
+        
+        # Determine if idle or accelerating
+        self.is_idle = (self.current_rpm < 1000 and self.current_throttle < 0.1)
+        
+        # Smooth frequency updates with bounds checking
+        target_rumble = max(20, min(300, rpm * 0.08))  # Lower frequency for deeper rumble
+        target_exhaust = max(100, min(2000, rpm * 0.25 + 150))
+        target_turbo = max(1500, min(5000, 2000 + boost * 150))
+        
+        # Interpolate to prevent sudden jumps (exponential smoothing)
+        smooth_factor = 0.3 if smooth else 1.0  # Lower = smoother transitions
+        self.engine_rumble_freq = self.prev_rumble_freq + (target_rumble - self.prev_rumble_freq) * smooth_factor
+        self.exhaust_freq = self.prev_exhaust_freq + (target_exhaust - self.prev_exhaust_freq) * smooth_factor
+        self.turbo_whistle_freq = self.prev_turbo_freq + (target_turbo - self.prev_turbo_freq) * smooth_factor
+        
+        # Volume with smooth fade
+        target_volume = max(0, min(1, volume))
+        self.volume = self.prev_volume + (target_volume - self.prev_volume) * (0.1 if smooth else 1.0)
+    
+    def attach_physics(self, physics):
+        """
+        Audio-clocked mode: every callback advances `physics` (an
+        AudioClockedPhysics) by the block duration and synthesizes from its
+        sub-step states. update_parameters is ignored while attached; pass
+        None to detach.
+        """
+        self.physics = physics
+    
+    def render_physics_block(self, out, frames):
+        """Step the attached physics for one block and render it sub-step by sub-step"""
+        states = self.physics.advance(frames / self.sample_rate)
+        steps = len(states)
+        if steps == 0:
+            self.synthesize(frames, out)
+            return
+        
+        # Spread the block's samples evenly over its sub-steps; each segment
+        # is synthesized with the parameters of the sub-step it belongs to
+        volume = self.volume
+        start = 0
+        for i in range(steps):
+            end = (i + 1) * frames // steps
+            if end > start:
+                state = states[i]
+                self.apply_parameters(state['rpm'], state['boost'], state['throttle_position'],
+                                      volume, smooth=False)
+                self.synthesize(end - start, out[start:end])
+            start = end
+    
+    def get_synth_state(self):
+        """Snapshot of the block-to-block synth state (picklable)"""
+        return {name: getattr(self, name) for name in self.SYNTH_STATE}
+    
+    def set_synth_state(self, state):
+        """Restore a snapshot taken with get_synth_state"""
+        for name in self.SYNTH_STATE:
+            setattr(self, name, state[name])
+    
+    def _turbo_intensity(self):
+        """Turbo whistle level - only audible under boost, never at idle"""
+        if self.is_idle:
+            return 0.0
+        return max(0, min(0.25, (self.turbo_whistle_freq - 2000) / 3000 * 0.25))
+    
+    def advance_phases(self, frame_count):
+        """
+        Advance the oscillators by frame_count samples without synthesizing.
+        Ends in the same state generate_audio would (closed-form sums instead
+        of per-sample work), so a renderer can skip ahead cheaply.
+        """
+        n = frame_count
+        lfo_increment = 4.0 / self.sample_rate
+        rumble_increment = self.engine_rumble_freq / self.sample_rate
+        
+        # sum of sin(2*pi*(lfo_phase + k*lfo_increment)) for k < n
+        half_step = np.pi * lfo_increment
+        lfo_sum = (math.sin(n * half_step) / math.sin(half_step)
+                   * math.sin(2 * np.pi * self.lfo_phase + (n - 1) * half_step))
+        self.rumble_phase = (self.rumble_phase + rumble_increment * (n + 0.15 * lfo_sum)) % 2.0
+        self.lfo_phase = (self.lfo_phase + lfo_increment * n) % 1.0
+        
+        self.exhaust_phase = (self.exhaust_phase + self.exhaust_freq / self.sample_rate * n) % self.exhaust_table.period
+        if self._turbo_intensity() > 0:
+            self.turbo_phase = (self.turbo_phase + self.turbo_whistle_freq / self.sample_rate * n) % 1.0
+    
+    def _allocate_buffers(self, size):
+        """Allocate per-block work buffers for up to `size` frames"""
+        self.buffer_size = size
+        self._ramp = np.arange(size, dtype=np.float64)
+        self._phase = np.empty(size)
+        self._work = np.empty(size)
+        self._mix = np.empty(size)
+        self._scratch = np.empty(size)
+        self._index = np.empty(size, dtype=np.intp)
+        self._crackle_envelope = np.exp(-5 * self._ramp / self.sample_rate)
     
-    def generate_audio(self, frame_count):
-        """Generate engine sound audio with proper idle/accel/decel mapping"""
-        t = np.arange(frame_count) / self.sample_rate
+    def _linear_phase(self, phase, freq, n, out, period=1.0):
+        """Fill out with phase + freq*t for this block; return the phase after it"""
+        increment = freq / self.sample_rate
+        np.multiply(self._ramp[:n], increment, out=out)
+        out += phase
+        return (phase + increment * n) % period
+    
+    def synthesize(self, frame_count, out):
+        """Render the next frame_count samples into out with the selected synthesis mode"""
+        if self.grains is not None:
+            return self.grains.render(out[:frame_count], self.current_rpm, self.current_throttle,
+                                      self.current_boost, self.volume)
+        return self.generate_audio(frame_count, out=out)
+    
+    def generate_audio(self, frame_count, out=None):
+        """
+        Generate engine sound audio with proper idle/accel/decel mapping.
+        Oscillators run from persistent phase accumulators and all math is done
+        in place on preallocated buffers; pass `out` to avoid allocating the
+        result as well.
+        """
+        if frame_count > self.buffer_size:
+            self._allocate_buffers(frame_count)
+        if out is None:
+            out = np.empty(frame_count, dtype=np.float32)
+        n = frame_count
+        two_pi = 2 * np.pi
+        phase = self._phase[:n]
+        work = self._work[:n]
+        mix = self._mix[:n]
+        
+        # Engine rumble: 4 Hz firing-pattern LFO modulates the frequency by
+        # +/-15%; the phase is the running sum of per-sample increments
+        self.lfo_phase = self._linear_phase(self.lfo_phase, 4.0, n, work)
+        work *= two_pi
+        np.sin(work, out=work)
+        rumble_increment = self.engine_rumble_freq / self.sample_rate
+        work *= 0.15 * rumble_increment
+        work += rumble_increment
+        np.cumsum(work, out=phase)
+        phase += self.rumble_phase
+        self.rumble_phase = float(phase[-1]) % 2.0
         
-        # Engine rumble (low frequency sine wave with realistic variation)
-        # Add firing order variation for realism
-        rumble_variation = 1 + 0.15 * np.sin(2 * np.pi * 4 * t)  # 4-cylinder firing pattern
-        rumble_freq_varied = self.engine_rumble_freq * rumble_variation
-        rumble = 0.35 * np.sin(2 * np.pi * rumble_freq_varied * t)
+        np.multiply(phase, two_pi, out=mix)
+        np.sin(mix, out=mix)
+        mix *= 0.35
         
         # Add subharmonic for deeper bass (only at higher RPM)
         if self.current_rpm > 2000:
             subharmonic_intensity = min(0.2, (self.current_rpm - 2000) / 5000 * 0.2)
-            subharmonic = subharmonic_intensity * np.sin(2 * np.pi * (rumble_freq_varied * 0.5) * t)
-            rumble += subharmonic
+            np.multiply(phase, np.pi, out=work)
+            np.sin(work, out=work)
+            work *= subharmonic_intensity
+            mix += work
+        
+        # Idle sound - gentler, more consistent rumble and a quieter exhaust
+        if self.is_idle:
+            mix *= 0.7
+        exhaust_gain = 0.3 if self.is_idle else 1.0
         
         # Exhaust note (square wave with harmonics) - varies with throttle
         throttle_factor = 0.5 + self.current_throttle * 0.5
-        exhaust = 0.2 * throttle_factor * self.square_wave(self.exhaust_freq * t)
-        exhaust += 0.12 * throttle_factor * self.square_wave(self.exhaust_freq * 1.5 * t)  # 1st harmonic
-        exhaust += 0.06 * throttle_factor * self.square_wave(self.exhaust_freq * 2.0 * t)  # 2nd harmonic
-        
-        # Turbo whistle (high frequency sine) - only audible under boost
-        turbo_intensity = max(0, min(0.25, (self.turbo_whistle_freq - 2000) / 3000 * 0.25))
-        whistle = turbo_intensity * np.sin(2 * np.pi * self.turbo_whistle_freq * t)
+        scratch = self._scratch[:n]
+        self.exhaust_phase = self._linear_phase(self.exhaust_phase, self.exhaust_freq, n, scratch,
+                                                self.exhaust_table.period)
+        self.exhaust_table.lookup(scratch, self.exhaust_freq, work, self._index[:n])
+        work *= throttle_factor * exhaust_gain
+        mix += work
         
         # Deceleration sound (slight overrun crackle at high RPM when throttle closes)
         if self.current_rpm > 3000 and self.current_throttle < 0.1:
-            # Add subtle crackle/pop effect
-            crackle_noise = 0.05 * np.random.uniform(-1, 1, frame_count)
-            crackle_envelope = np.exp(-5 * t)  # Decay envelope
-            exhaust += crackle_noise * crackle_envelope
+            self.rng.random(out=work)
+            work *= 0.1
+            work -= 0.05
+            work *= self._crackle_envelope[:n]
+            mix += work
         
-        # Idle sound - different character at idle
-        if self.is_idle:
-            # Gentler, more consistent idle
-            idle_mix = 0.7
-            rumble *= idle_mix
-            exhaust *= 0.3
-            whistle *= 0.0  # No turbo whistle at idle
-        
-        # Mix all components with proper balance
-        audio = (rumble + exhaust + whistle) * self.volume * 0.25
-        
-        # Soft clipping to prevent distortion (tanh provides smooth limiting)
-        audio = np.tanh(audio)
+        # Turbo whistle (high frequency sine) - only audible under boost, never at idle
+        turbo_intensity = self._turbo_intensity()
+        if turbo_intensity > 0:
+            self.turbo_phase = self._linear_phase(self.turbo_phase, self.turbo_whistle_freq, n, work)
+            work *= two_pi
+            np.sin(work, out=work)
+            work *= turbo_intensity
+            mix += work
         
-        # Apply fade in/out to prevent clicking (very short, just at boundaries)
-        fade_samples = min(10, frame_count // 10)
-        if fade_samples > 0:
-            fade_in = np.linspace(0, 1, fade_samples)
-            fade_out = np.linspace(1, 0, fade_samples)
-            audio[:fade_samples] *= fade_in
-            audio[-fade_samples:] *= fade_out
-        
-        return audio
-    
-    @staticmethod
-    def square_wave(phase):
-        """Generate square wave from phase"""
-        return np.where(np.sin(2 * np.pi * phase) > 0, 0.5, -0.5)
+        # Mix with overall volume, then soft clip (tanh provides smooth limiting)
+        mix *= self.volume * 0.25
+        np.tanh(mix, out=out)
+        return out
     
     def update_parameters(self, rpm, boost, throttle, volume):
-        """Queue audio parameter updates"""
+        """Publish the latest audio parameters (replaces any the callback has not read yet)"""
         if self.is_running and SOUNDDEVICE_AVAILABLE:
-            self.command_queue.put({
-                'type': 'parameters',
-                'rpm': rpm,
-                'boost': boost,
-                'throttle': throttle,
-                'volume': volume
-            })
+            self.params.write(rpm, boost, throttle, volume)
     
     def set_volume(self, volume):
         """Set audio volume (0-1)"""
         self.volume = max(0, min(1, volume))
     
+    def stats(self):
+        """
+        Callback health since start (or the last reset_stats): xruns, callback
+        time against the blocksize/sample_rate budget, parameter staleness and
+        how many parameter updates were coalesced.
+        """
+        stats = self.health.snapshot()
+        stats['blocksize'] = self.blocksize
+        stats['sample_rate'] = self.sample_rate
+        stats['parameter_updates'] = self.params.updates
+        stats['coalesced_updates'] = self.params.coalesced
+        if self.grains is not None:
+            stats['grain_hits'] = self.grains.hits
+            stats['grain_misses'] = self.grains.misses
+        return stats
+    
+    def reset_stats(self):
+        self.health.reset()
+    
+    def format_stats(self):
+        """One-line stats summary"""
+        s = self.stats()
+        return (f"audio: {s['callbacks']} blocks of {s['blocksize']} | xruns {s['xruns']} | "
+                f"callback mean {s['mean_callback_ms']:.2f} / max {s['max_callback_ms']:.2f} ms "
+                f"of {s['budget_ms']:.2f} ms budget ({s['overruns']} over) | "
+                f"staleness max {s['max_staleness_ms']:.0f} ms | coalesced {s['coalesced_updates']}")
+    
+    def start_stats_log(self, interval=10.0, log=print):
+        """Log format_stats() every `interval` seconds from a daemon thread until stop()"""
+        if self._stats_thread is not None:
+            return
+        
+        def run():
+            while not self.stop_event.wait(interval):
+                log(self.format_stats())
+        
+        self._stats_thread = threading.Thread(target=run, name='audio-stats', daemon=True)
+        self._stats_thread.start()
+    
     def stop(self):
         """Stop audio playback"""
+        self.stop_event.set()
         if SOUNDDEVICE_AVAILABLE:
             self.is_running = False
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
+                self.stream = None
     
     def __del__(self):
         self.stop()
 
 
+class GrainCache:
+    """
+    Granular engine sound built from cached grains.
+    
+    Engine parameters are quantized into (rpm, throttle, boost, idle, volume)
+    bins. The first time a bin is heard, a private additive synth renders a
+    short grain for it; grains live in an LRU cache bounded by max_bytes.
+    Playback loops the current grain and crossfades (equal power) into the
+    next one at every loop point or bin change, so a steady engine costs only
+    a few array copies per block.
+    """
+    
+    RPM_STEP = 100.0
+    THROTTLE_STEP = 0.1
+    BOOST_STEP = 1.0
+    VOLUME_STEP = 0.05
+    
+    def __init__(self, sample_rate=44100, grain_length=2048, crossfade=256, max_bytes=8 * 1024 * 1024):
+        self.length = grain_length
+        self.crossfade = crossfade
+        grain_bytes = (grain_length + crossfade) * np.dtype(np.float32).itemsize
+        self.max_grains = max(2, max_bytes // grain_bytes)
+        self.synth = AudioEngine(sample_rate, grain_length + crossfade, realtime=False)
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        
+        ramp = (np.arange(crossfade) + 0.5) / crossfade * (np.pi / 2)
+        self._fade_in = np.sin(ramp).astype(np.float32)
+        self._fade_out = np.cos(ramp).astype(np.float32)
+        self._scratch = np.empty(crossfade, dtype=np.float32)
+        
+        # Playback state: fading from previous[previous_pos:] into current[0:]
+        silence = np.zeros(grain_length + crossfade, dtype=np.float32)
+        self.current = silence
+        self.current_key = None
+        self.previous = silence
+        self.previous_pos = 0
+        self.pos = grain_length
+    
+    def key(self, rpm, throttle, boost, volume):
+        """Quantize engine parameters to a cache key"""
+        return (int(rpm // self.RPM_STEP), int(round(throttle / self.THROTTLE_STEP)),
+                int(round(boost / self.BOOST_STEP)), bool(rpm < 1000 and throttle < 0.1),
+                int(round(volume / self.VOLUME_STEP)))
+    
+    def grain(self, key):
+        """Cached grain for a key, rendering (and evicting the oldest) on a miss"""
+        grain = self.cache.get(key)
+        if grain is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return grain
+        
+        self.misses += 1
+        rpm_bin, throttle_bin, boost_bin, idle, volume_bin = key
+        synth = self.synth
+        synth.apply_parameters((rpm_bin + 0.5) * self.RPM_STEP, boost_bin * self.BOOST_STEP,
+                               throttle_bin * self.THROTTLE_STEP, volume_bin * self.VOLUME_STEP, smooth=False)
+        synth.is_idle = idle
+        grain = synth.generate_audio(self.length + self.crossfade)
+        
+        self.cache[key] = grain
+        if len(self.cache) > self.max_grains:
+            self.cache.popitem(last=False)
+        return grain
+    
+    def _switch(self, key):
+        """Start crossfading from the current playback position into a grain"""
+        self.previous = self.current
+        self.previous_pos = self.pos
+        self.current = self.grain(key)
+        self.current_key = key
+        self.pos = 0
+    
+    def render(self, out, rpm, throttle, boost, volume):
+        """Fill out with grain playback for the given engine parameters"""
+        key = self.key(rpm, throttle, boost, volume)
+        # Bin changes wait for a running crossfade to finish
+        if key != self.current_key and self.pos >= self.crossfade:
+            self._switch(key)
+        
+        n = len(out)
+        filled = 0
+        while filled < n:
+            if self.pos >= self.length:
+                self._switch(key)
+            count = min(n - filled, self.length - self.pos)
+            segment = out[filled:filled + count]
+            source = self.current[self.pos:self.pos + count]
+            
+            fade = max(0, min(count, self.crossfade - self.pos))
+            if fade:
+                start = self.pos
+                tail = self.previous[self.previous_pos + start:self.previous_pos + start + fade]
+                np.multiply(source[:fade], self._fade_in[start:start + fade], out=segment[:fade])
+                np.multiply(tail, self._fade_out[start:start + fade], out=self._scratch[:fade])
+                segment[:fade] += self._scratch[:fade]
+            segment[fade:] = source[fade:]
+            
+            self.pos += count
+            filled += count
+        return out
+    
+    @property
+    def memory_bytes(self):
+        """Bytes held by cached grains"""
+        return sum(grain.nbytes for grain in self.cache.values())
+
+
 class SimpleAudioGenerator:
     """Fallback audio generator for systems without PyAudio"""
     
@@ -221,11 +726,11 @@ class SimpleAudioGenerator:
         self.is_running = False
 
 
-def get_audio_engine():
-    """Factory function to get the appropriate audio engine"""
+def get_audio_engine(**kwargs):
+    """Factory function to get the appropriate audio engine (kwargs go to AudioEngine)"""
     if SOUNDDEVICE_AVAILABLE:
         try:
-            return AudioEngine()
+            return AudioEngine(**kwargs)
         except Exception as e:
             print(f"Could not initialize sounddevice: {e}")
             print("Using simple audio generator (visual only)")
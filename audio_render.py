@@ -0,0 +1,168 @@
+"""
+Offline engine audio renderer
+Synthesizes an rpm/boost/throttle trace with the same AudioEngine synth used live
+and writes a WAV file, optionally splitting long traces across a process pool
+"""
+import argparse
+import os
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from audio_engine import AudioEngine
+
+
+def load_trace(path):
+    """Load a headless_runner CSV trace as {'time', 'rpm', 'boost', 'throttle'} arrays"""
+    data = np.genfromtxt(path, delimiter=',', names=True)
+    return {
+        'time': np.asarray(data['time'], dtype=np.float64),
+        'rpm': np.asarray(data['rpm'], dtype=np.float64),
+        'boost': np.asarray(data['boost'], dtype=np.float64),
+        'throttle': np.asarray(data['throttle_position'], dtype=np.float64),
+    }
+
+
+def scenario_trace(name_or_path, sample_interval, dt=0.001):
+    """Run a headless_runner scenario and return its trace in load_trace() form"""
+    from headless_runner import load_scenario, run_scenario
+    from engine_wrapper import get_engine_physics
+    result = run_scenario(get_engine_physics(), load_scenario(name_or_path), dt, sample_interval)
+    state = result['trace']['state']
+    return {
+        'time': result['trace']['time'],
+        'rpm': state['rpm'].astype(np.float64),
+        'boost': state['boost'].astype(np.float64),
+        'throttle': state['throttle_position'].astype(np.float64),
+    }
+
+
+def block_parameters(trace, duration, sample_rate, blocksize):
+    """Trace values at the start of every audio block (what the live callback would see)"""
+    total_samples = int(round(duration * sample_rate))
+    block_count = -(-total_samples // blocksize)
+    block_times = np.arange(block_count) * (blocksize / sample_rate)
+    params = np.column_stack([np.interp(block_times, trace['time'], trace[name])
+                              for name in ('rpm', 'boost', 'throttle')])
+    return params, total_samples
+
+
+def render_chunk(job):
+    """Render one chunk of blocks starting from a saved synth state (runs in a worker)"""
+    synth = AudioEngine(job['sample_rate'], job['blocksize'], realtime=False)
+    synth.set_synth_state(job['state'])
+    synth.rng = np.random.default_rng(job['seed'])
+    
+    blocksize = job['blocksize']
+    out = np.empty(job['samples'], dtype=np.float32)
+    volume = job['volume']
+    start = 0
+    for rpm, boost, throttle in job['params']:
+        n = min(blocksize, job['samples'] - start)
+        synth.apply_parameters(rpm, boost, throttle, volume)
+        synth.generate_audio(n, out=out[start:start + n])
+        start += n
+    return out
+
+
+def plan_chunks(params, total_samples, sample_rate=44100, blocksize=512, volume=0.5,
+                chunk_seconds=60.0, seed=0):
+    """
+    Split the render into independent chunk jobs.
+    
+    A serial pass runs the cheap per-block part of the synth (parameter
+    smoothing and closed-form phase advance) to find the exact synth state at
+    each chunk boundary, so chunks rendered separately join up seamlessly.
+    """
+    blocks_per_chunk = max(1, int(chunk_seconds * sample_rate) // blocksize)
+    synth = AudioEngine(sample_rate, blocksize, realtime=False)
+    jobs = []
+    for first in range(0, len(params), blocks_per_chunk):
+        chunk_params = params[first:first + blocks_per_chunk]
+        start_sample = first * blocksize
+        samples = min(len(chunk_params) * blocksize, total_samples - start_sample)
+        jobs.append({
+            'state': synth.get_synth_state(),
+            'params': chunk_params,
+            'samples': samples,
+            'sample_rate': sample_rate,
+            'blocksize': blocksize,
+            'volume': volume,
+            'seed': (seed, len(jobs)),
+        })
+        
+        # Skip ahead to the next boundary
+        for i, (rpm, boost, throttle) in enumerate(chunk_params):
+            synth.apply_parameters(rpm, boost, throttle, volume)
+            synth.advance_phases(min(blocksize, samples - i * blocksize))
+    return jobs
+
+
+def render_to_wav(trace, path, sample_rate=44100, blocksize=512, volume=0.5,
+                  chunk_seconds=60.0, workers=1, seed=0):
+    """
+    Render a trace to a 16-bit mono WAV file.
+    
+    Chunks are written in order as they finish, so memory stays bounded by
+    the chunks in flight rather than the whole file. Returns the number of
+    samples written.
+    """
+    duration = float(trace['time'][-1])
+    params, total_samples = block_parameters(trace, duration, sample_rate, blocksize)
+    jobs = plan_chunks(params, total_samples, sample_rate, blocksize, volume, chunk_seconds, seed)
+    
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        
+        if workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for chunk in pool.map(render_chunk, jobs):
+                    wav.writeframes(to_pcm16(chunk))
+        else:
+            for job in jobs:
+                wav.writeframes(to_pcm16(render_chunk(job)))
+    return total_samples
+
+
+def to_pcm16(samples):
+    """Float samples in [-1, 1] to little-endian 16-bit PCM bytes"""
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render engine audio from a telemetry trace to WAV")
+    parser.add_argument('source', help="trace CSV from headless_runner.py --trace, or a scenario name/JSON script")
+    parser.add_argument('-o', '--output', default='engine_audio.wav', help="output WAV file")
+    parser.add_argument('--sample-rate', type=int, default=44100)
+    parser.add_argument('--blocksize', type=int, default=512, help="synth block size (match the live engine)")
+    parser.add_argument('--volume', type=float, default=0.5)
+    parser.add_argument('--chunk', type=float, default=60.0, metavar='SECONDS',
+                        help="seconds of audio per worker job (default 60)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the crackle noise")
+    args = parser.parse_args(argv)
+    
+    if args.source.lower().endswith('.csv'):
+        trace = load_trace(args.source)
+    else:
+        trace = scenario_trace(args.source, args.blocksize / args.sample_rate)
+    
+    wall_start = time.perf_counter()
+    samples = render_to_wav(trace, args.output, args.sample_rate, args.blocksize, args.volume,
+                            args.chunk, args.workers, args.seed)
+    wall_time = time.perf_counter() - wall_start
+    
+    audio_time = samples / args.sample_rate
+    print(f"Wrote {args.output}: {audio_time:.1f} s of audio in {wall_time:.2f} s "
+          f"({audio_time / wall_time if wall_time > 0 else float('inf'):.0f}x realtime, {args.workers} workers)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Binding-layer microbenchmark
+Calls/sec for the engine getters, get_state, set_throttle and update through the
+old per-call ctypes pattern and through the pre-bound engine_bindings calls
+"""
+import argparse
+import ctypes
+import json
+import sys
+import timeit
+from ctypes import c_double
+
+from engine_bindings import EngineState
+from engine_wrapper import EnginePhysics, engine_lib, library
+
+
+class LegacyEngine:
+    """The call pattern engine_wrapper used before engine_bindings (for comparison only)"""
+    
+    def __init__(self):
+        self.engine = engine_lib.EnginePhysics_new()
+        self._state = EngineState()
+        self._state_ref = ctypes.byref(self._state)
+    
+    def __del__(self):
+        engine_lib.EnginePhysics_delete(self.engine)
+    
+    def set_throttle(self, throttle):
+        engine_lib.EnginePhysics_setThrottle(self.engine, c_double(throttle))
+    
+    def update(self, delta_time):
+        engine_lib.EnginePhysics_update(self.engine, c_double(delta_time))
+    
+    @property
+    def rpm(self):
+        return engine_lib.EnginePhysics_getRPM(self.engine)
+    
+    @property
+    def coolant_temp(self):
+        return engine_lib.EnginePhysics_getCoolantTemp(self.engine)
+    
+    @property
+    def current_gear(self):
+        return engine_lib.EnginePhysics_getCurrentGear(self.engine)
+    
+    def get_state(self):
+        engine_lib.EnginePhysics_getState(self.engine, self._state_ref)
+        return self._state
+
+
+# (label, (setup, statement) before, (setup, statement) after), timed with
+# `engine` in scope. The first group goes through the wrapper API; the
+# hoisted group is what a tight loop can do with the function looked up
+# once: the prototyped CDLL function before, the bound callable after.
+CALLS = (
+    ('rpm', ('', 'engine.rpm'), ('', 'engine.rpm')),
+    ('coolant_temp', ('', 'engine.coolant_temp'), ('', 'engine.coolant_temp')),
+    ('current_gear', ('', 'engine.current_gear'), ('', 'engine.current_gear')),
+    ('get_state()', ('', 'engine.get_state()'), ('', 'engine.get_state()')),
+    ('set_throttle(x)', ('', 'engine.set_throttle(0.5)'), ('', 'engine.set_throttle(0.5)')),
+    ('update(dt)', ('', 'engine.update(0.001)'), ('', 'engine.update(0.001)')),
+    ('hoisted getRPM',
+     ('fn = engine_lib.EnginePhysics_getRPM; h = engine.engine', 'fn(h)'),
+     ('fn = engine.calls.getRPM', 'fn()')),
+    ('hoisted getState',
+     ('fn = engine_lib.EnginePhysics_getState; h = engine.engine; ref = engine._state_ref', 'fn(h, ref)'),
+     ('fn = engine._fill_state', 'fn()')),
+    ('hoisted update',
+     ('fn = engine_lib.EnginePhysics_update; h = engine.engine', 'fn(h, c_double(0.001))'),
+     ('fn = engine.calls.update', 'fn(0.001)')),
+)
+
+
+def compare(before_call, after_call, before, after, number, repeat):
+    """
+    Best-of-`repeat` calls/sec of each (setup, statement) against its engine.
+    
+    The two are timed alternately within every repeat so clock and load
+    drift on a busy machine hits both sides alike.
+    """
+    timers = [timeit.Timer(statement, setup, globals={'engine': engine, 'engine_lib': engine_lib,
+                                                      'c_double': c_double})
+              for (setup, statement), engine in ((before_call, before), (after_call, after))]
+    best = [float('inf'), float('inf')]
+    for _ in range(repeat):
+        for i, timer in enumerate(timers):
+            best[i] = min(best[i], timer.timeit(number))
+    return number / best[0], number / best[1]
+
+
+def run_benchmark(number=200000, repeat=5):
+    """calls/sec before and after for every entry of CALLS"""
+    before = LegacyEngine()
+    after = EnginePhysics()
+    for engine in (before, after):
+        engine.set_throttle(0.5)
+    results = []
+    for label, before_call, after_call in CALLS:
+        old, new = compare(before_call, after_call, before, after, number, repeat)
+        results.append({'call': label, 'before': old, 'after': new, 'speedup': new / old})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare ctypes call overhead before/after engine_bindings")
+    parser.add_argument('--number', type=int, default=200000, help="calls per timing run (default 200000)")
+    parser.add_argument('--repeat', type=int, default=5, help="timing runs per call, best is kept (default 5)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    
+    if library is None:
+        parser.error("engine_physics.dll is needed for the binding benchmark")
+    
+    results = run_benchmark(args.number, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    
+    print("=" * 56)
+    print("BINDING OVERHEAD - calls/sec (best of %d x %d)" % (args.repeat, args.number))
+    print("=" * 56)
+    print(f"{'call':<18}{'before':>14}{'after':>14}{'speedup':>10}")
+    for r in results:
+        print(f"{r['call']:<18}{r['before']:>14,.0f}{r['after']:>14,.0f}{r['speedup']:>9.2f}x")
+    print("=" * 56)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+ctypes bindings for engine_physics.dll
+One prototype table for every export, applied once per loaded library and shared
+by engine_wrapper.py and main_app.py, plus per-engine pre-bound call tables
+"""
+import ctypes
+import functools
+import os
+import types
+from ctypes import c_double, c_int, c_int32, c_bool, c_uint64, c_void_p, POINTER
+
+
+class EngineState(ctypes.Structure):
+    """Mirror of the packed C++ EngineState telemetry snapshot (engine_physics.h)"""
+    _pack_ = 1
+    _fields_ = [
+        ('rpm', c_double),
+        ('target_rpm', c_double),
+        ('speed', c_double),
+        ('torque', c_double),
+        ('power', c_double),
+        ('boost', c_double),
+        ('throttle_position', c_double),
+        ('oil_temp', c_double),
+        ('coolant_temp', c_double),
+        ('intake_temp', c_double),
+        ('fuel_level', c_double),
+        ('fuel_consumption', c_double),
+        ('engine_wear', c_double),
+        ('best_0_100_time', c_double),
+        ('best_quarter_mile_time', c_double),
+        ('total_distance', c_double),
+        ('runtime', c_double),
+        ('current_gear', c_int32),
+        ('clutch_engaged', c_int32),
+        ('engine_running', c_int32),
+        ('is_shifting', c_int32),
+    ]
+
+
+# Every export as name -> (restype, argtypes). Exports an older build of the
+# library lacks are skipped; the EngineLibrary feature flags say what is there.
+PROTOTYPES = {
+    # Constructor and destructor
+    'EnginePhysics_new': (c_void_p, []),
+    'EnginePhysics_delete': (None, [c_void_p]),
+    'EnginePhysics_clone': (c_void_p, [c_void_p]),
+    
+    # Core control methods
+    'EnginePhysics_startEngine': (None, [c_void_p]),
+    'EnginePhysics_stopEngine': (None, [c_void_p]),
+    'EnginePhysics_setThrottle': (None, [c_void_p, c_double]),
+    'EnginePhysics_setBrake': (None, [c_void_p, c_double]),
+    'EnginePhysics_shiftUp': (None, [c_void_p]),
+    'EnginePhysics_shiftDown': (None, [c_void_p]),
+    'EnginePhysics_toggleClutch': (None, [c_void_p]),
+    'EnginePhysics_setGear': (None, [c_void_p, c_int]),
+    'EnginePhysics_resetSession': (None, [c_void_p]),
+    
+    # Configuration
+    'EnginePhysics_setRevLimiter': (None, [c_void_p, c_int]),
+    'EnginePhysics_setBoostPressure': (None, [c_void_p, c_double]),
+    'EnginePhysics_setIntegrationMode': (None, [c_void_p, c_int]),
+    'EnginePhysics_getIntegrationMode': (c_int, [c_void_p]),
+    'EnginePhysics_setSubsystemRate': (None, [c_void_p, c_int, c_double]),
+    'EnginePhysics_setSeed': (None, [c_void_p, c_uint64]),
+    
+    # Simulation
+    'EnginePhysics_update': (None, [c_void_p, c_double]),
+    'EnginePhysics_stepN': (c_int, [c_void_p, c_int, c_double, c_void_p, c_void_p, c_void_p, c_void_p]),
+    
+    # Getters
+    'EnginePhysics_getRPM': (c_double, [c_void_p]),
+    'EnginePhysics_getSpeed': (c_double, [c_void_p]),
+    'EnginePhysics_getTorque': (c_double, [c_void_p]),
+    'EnginePhysics_getPower': (c_double, [c_void_p]),
+    'EnginePhysics_getBoost': (c_double, [c_void_p]),
+    'EnginePhysics_getCurrentGear': (c_int, [c_void_p]),
+    'EnginePhysics_isEngineRunning': (c_bool, [c_void_p]),
+    'EnginePhysics_getThrottlePosition': (c_double, [c_void_p]),
+    'EnginePhysics_getOilTemp': (c_double, [c_void_p]),
+    'EnginePhysics_getCoolantTemp': (c_double, [c_void_p]),
+    'EnginePhysics_getIntakeTemp': (c_double, [c_void_p]),
+    'EnginePhysics_getFuelLevel': (c_double, [c_void_p]),
+    'EnginePhysics_getFuelConsumption': (c_double, [c_void_p]),
+    'EnginePhysics_getEngineWear': (c_double, [c_void_p]),
+    'EnginePhysics_getBest0To100Time': (c_double, [c_void_p]),
+    'EnginePhysics_getTotalDistance': (c_double, [c_void_p]),
+    'EnginePhysics_getRuntime': (c_double, [c_void_p]),
+    
+    # Telemetry snapshot
+    'EnginePhysics_getStateSize': (c_int, []),
+    'EnginePhysics_getState': (None, [c_void_p, POINTER(EngineState)]),
+    
+    # Checkpoint/restore
+    'EnginePhysics_getCheckpointSize': (c_int, []),
+    'EnginePhysics_saveState': (c_int, [c_void_p, c_void_p, c_int]),
+    'EnginePhysics_loadState': (c_int, [c_void_p, c_void_p, c_int]),
+    
+    # Struct-of-arrays fleet simulator
+    'EngineFleet_new': (c_void_p, [c_int]),
+    'EngineFleet_delete': (None, [c_void_p]),
+    'EngineFleet_size': (c_int, [c_void_p]),
+    'EngineFleet_setThreadCount': (None, [c_void_p, c_int]),
+    'EngineFleet_setSeed': (None, [c_void_p, c_uint64]),
+    'EngineFleet_setRevLimiter': (None, [c_void_p, c_int]),
+    'EngineFleet_setBoostPressure': (None, [c_void_p, c_double]),
+    'EngineFleet_setIntegrationMode': (None, [c_void_p, c_int]),
+    'EngineFleet_setSubsystemRate': (None, [c_void_p, c_int, c_double]),
+    'EngineFleet_startEngines': (None, [c_void_p, c_void_p]),
+    'EngineFleet_stopEngines': (None, [c_void_p, c_void_p]),
+    'EngineFleet_setInputs': (None, [c_void_p, c_void_p, c_void_p, c_void_p]),
+    'EngineFleet_step': (None, [c_void_p, c_double, c_int]),
+    'EngineFleet_copyField': (c_int, [c_void_p, c_int, c_void_p]),
+    'EngineFleet_copyGears': (None, [c_void_p, c_void_p]),
+    'EngineFleet_getState': (None, [c_void_p, c_void_p]),
+}
+
+
+def _passes_through(argtypes):
+    """True when a handle-first call's other arguments are all typed pointers"""
+    return all(isinstance(t, type) and issubclass(t, ctypes._Pointer) for t in argtypes[1:])
+
+
+class EngineLibrary:
+    """
+    A loaded engine_physics library with PROTOTYPES applied.
+    
+    Prototyped exports are reachable as attributes of `dll` (as before) and
+    in `exports` by name; the has_* flags report optional features and
+    `missing` lists the PROTOTYPES the library does not export. Use
+    load_library() rather than constructing this directly, so every wrapper
+    in the process shares one instance per file.
+    """
+    
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.dll = ctypes.CDLL(self.path)
+        self.exports = {}
+        for name, (restype, argtypes) in PROTOTYPES.items():
+            if not hasattr(self.dll, name):
+                continue
+            function = getattr(self.dll, name)
+            function.restype = restype
+            function.argtypes = argtypes
+            self.exports[name] = function
+        self._raw = {}
+        
+        # A library older than its sources still loads; the has_* flags below
+        # then quietly fall back, so say which exports it is missing
+        self.missing = [name for name in PROTOTYPES if name not in self.exports]
+        if self.missing:
+            print("Warning: %s lacks %d expected export(s) (%s), rebuild engine_physics.dll"
+                  % (os.path.basename(self.path), len(self.missing), ', '.join(self.missing)))
+        
+        exported = self.exports.__contains__
+        self.has_integration_mode = exported('EnginePhysics_setIntegrationMode')
+        self.has_subsystem_rates = exported('EnginePhysics_setSubsystemRate')
+        self.has_seed = exported('EnginePhysics_setSeed')
+        self.has_checkpoint = exported('EnginePhysics_saveState')
+        self.checkpoint_size = self.dll.EnginePhysics_getCheckpointSize() if self.has_checkpoint else 0
+        self.has_state_snapshot = exported('EnginePhysics_getState')
+        if self.has_state_snapshot and self.dll.EnginePhysics_getStateSize() != ctypes.sizeof(EngineState):
+            print("Warning: EngineState layout mismatch, rebuild engine_physics.dll")
+            self.has_state_snapshot = False
+        self.has_step_n = self.has_state_snapshot and exported('EnginePhysics_stepN')
+        self.has_fleet = self.has_state_snapshot and exported('EngineFleet_new')
+    
+    def raw(self, name):
+        """
+        Second function pointer for `name` with the restype but no argtypes.
+        
+        ctypes then passes ctypes objects straight through instead of
+        converting each argument per call; only for arguments that are
+        already c_void_p handles, byref() or pointer objects.
+        """
+        function = self._raw.get(name)
+        if function is None:
+            function = type(self.exports[name])((name, self.dll))
+            function.restype = self.exports[name].restype
+            self._raw[name] = function
+        return function
+    
+    def bind(self, handle, prefix='EnginePhysics_'):
+        """Calls for one engine (or fleet, with prefix='EngineFleet_') with the handle pre-bound"""
+        return BoundEngine(self, handle, prefix)
+
+
+class BoundEngine:
+    """
+    The exports for one handle as ready-made callables.
+    
+    Attribute names drop the prefix: calls.setThrottle(0.5), calls.getRPM(),
+    calls.getState(ctypes.byref(state)). The handle is pre-bound as one
+    c_void_p, so a call runs no Python frame and allocates no handle object.
+    Calls whose remaining arguments are all typed pointers (the getters,
+    getState, shift/start/stop) are partials over the argtypes-free raw()
+    pointer and skip conversion entirely. The rest keep their prototype,
+    which converts plain floats and ints, and are bound as methods of the
+    handle, which passes it on without rebuilding the argument list.
+    """
+    
+    def __init__(self, library, handle, prefix='EnginePhysics_'):
+        self.handle = c_void_p(handle)
+        for name, function in library.exports.items():
+            argtypes = function.argtypes
+            if not name.startswith(prefix) or not argtypes or argtypes[0] is not c_void_p:
+                continue
+            if _passes_through(argtypes):
+                bound = functools.partial(library.raw(name), self.handle)
+            else:
+                bound = types.MethodType(function, self.handle)
+            setattr(self, name[len(prefix):], bound)
+
+
+_libraries = {}
+
+
+def load_library(path):
+    """Load (once per file) and prototype the engine library at `path`; raises OSError if it can't load"""
+    key = os.path.abspath(path)
+    library = _libraries.get(key)
+    if library is None:
+        library = _libraries[key] = EngineLibrary(key)
+    return library
@@ -1,6 +1,474 @@
 #include "engine_physics.h"
 #include <chrono>
-#include <random>
+#include <cstring>
+#include <thread>
+
+// ============================================================================
+// Shared physics helpers (used by EnginePhysics and EngineFleet)
+// ============================================================================
+
+// Target RPM requested by a throttle position in the given gear
+static double throttleTargetRPM(const EngineConfig& engine, int gear, double throttle) {
+    if (throttle < 0.05) {
+        return engine.idle_rpm;
+    }
+    if (gear == 0) {
+        // Neutral - full range from idle to redline with 5% safety margin
+        return engine.idle_rpm + throttle * (engine.redline_rpm * 0.95 - engine.idle_rpm);
+    }
+    // In gear - RPM depends on speed, gear ratio, and throttle
+    double load_factor = (gear > 0) ? 1.0 : 0.8;
+    return engine.idle_rpm + throttle * (engine.redline_rpm - engine.idle_rpm) * load_factor;
+}
+
+// Boost torque gain: 60% more torque at 14.7 PSI
+static const double BOOST_TORQUE_GAIN = 0.6 / 14.7;
+
+// Power (HP) from torque (Nm): kW = Nm x RPM / 9549, HP = kW x 1.341
+static inline double powerFromTorque(double torque, double rpm) {
+    return (torque * rpm) / 9549.0 * 1.341;
+}
+
+// 1 - exp(-x) for x >= 0 without calling exp(): a short series for small x,
+// otherwise exp(-x) = 2^-n * exp(-r) with r in [0, ln 2) and a degree-9 polynomial
+static inline double fastOneMinusExpNeg(double x) {
+    if (x < 0.125) {
+        return x * (1.0 - x * (1.0 / 2 - x * (1.0 / 6 - x * (1.0 / 24 - x * (1.0 / 120)))));
+    }
+    if (x > 40.0) {
+        return 1.0;
+    }
+    int n = static_cast<int>(x * M_LOG2E);
+    double r = x - n * M_LN2;
+    double e = 1.0 - r * (1.0 - r * (1.0 / 2 - r * (1.0 / 6 - r * (1.0 / 24 - r * (1.0 / 120
+                     - r * (1.0 / 720 - r * (1.0 / 5040 - r * (1.0 / 40320 - r * (1.0 / 362880)))))))));
+    return 1.0 - std::ldexp(e, -n);
+}
+
+// Fraction of the gap to the target closed in one step of a first-order lag
+static inline double lagGain(int mode, double rate, double delta_time) {
+    double k = rate * delta_time;
+    switch (mode) {
+        case INTEGRATION_EXPONENTIAL:      return -std::expm1(-k);
+        case INTEGRATION_EXPONENTIAL_FAST: return fastOneMinusExpNeg(k);
+        default:                           return k;
+    }
+}
+
+void TorqueTable::build(const EngineConfig& engine) {
+    rpm_max = engine.redline_rpm * 1.25;
+    inv_step = SIZE / rpm_max;
+    inv_peak_rpm = 1.0 / engine.peak_torque_rpm;
+    double fall_rate = (engine.redline_rpm - engine.peak_torque_rpm) / (double)engine.peak_torque_rpm;
+    fall_slope = 0.6 / fall_rate;
+    for (int i = 0; i <= SIZE; i++) {
+        values[i] = curve(i / inv_step);
+    }
+}
+
+// Normalised torque curve (0.1 - 1.0) with peak at peak_torque_rpm
+double TorqueTable::curve(double rpm) const {
+    double rpm_ratio = rpm * inv_peak_rpm;
+    double torque_multiplier;
+    
+    if (rpm_ratio < 1.0) {
+        // Rising torque before peak
+        torque_multiplier = 0.3 + 0.7 * rpm_ratio;
+    } else {
+        // Falling torque after peak
+        torque_multiplier = 1.0 - fall_slope * (rpm_ratio - 1.0);
+    }
+    
+    return std::max(0.1, std::min(1.0, torque_multiplier));
+}
+
+double TorqueTable::lookup(double rpm) const {
+    if (rpm < 0 || rpm >= rpm_max) {
+        return curve(rpm);
+    }
+    double pos = rpm * inv_step;
+    int index = static_cast<int>(pos);
+    double frac = pos - index;
+    return values[index] + (values[index + 1] - values[index]) * frac;
+}
+
+void CompiledConfig::build(const EngineConfig& engine, const TransmissionConfig& transmission,
+                           const ForcedInductionConfig& forced_induction, const VehicleConfig& vehicle) {
+    redline = engine.redline_rpm;
+    inv_redline = 1.0 / redline;
+    rpm_wear_threshold = redline * 0.9;
+    
+    // RPM response: neutral is 8x the base rate, in gear it is slowed by
+    // vehicle mass and a 15% load per gear
+    double base_accel_rate = 1.0 / (engine.engine_inertia * 6.0);
+    double mass_factor = vehicle.vehicle_mass / 1000.0;
+    neutral_accel_rate = base_accel_rate * 8.0;
+    
+    // Road speed per engine RPM: wheel RPM x circumference, m/min to km/h
+    double speed_per_wheel_rpm = M_PI * transmission.wheel_diameter * 60.0 / 1000.0;
+    reverse_speed_per_rpm = speed_per_wheel_rpm / (3.5 * transmission.final_drive);
+    
+    fuel_per_rpm = engine.fuel_base * engine.displacement * 0.5 * inv_redline;
+    fuel_load[0] = 1.0;
+    speed_per_rpm[0] = 0.0;
+    gear_accel_rate[0] = engine_braking[0] = 0.0;
+    for (int gear = 1; gear <= MAX_GEAR; gear++) {
+        double gear_load = 1.0 + gear * 0.15;
+        gear_accel_rate[gear] = base_accel_rate / (engine.engine_inertia * mass_factor * gear_load);
+        engine_braking[gear] = 15.0 * gear * inv_redline;
+        fuel_load[gear] = 1.0 + 0.3 / (gear + 1.0);
+        speed_per_rpm[gear] = (gear <= (int)transmission.gear_ratios.size())
+            ? speed_per_wheel_rpm / (transmission.gear_ratios[gear - 1] * transmission.final_drive)
+            : 0.0;
+    }
+    
+    boost_fuel_gain = (forced_induction.max_boost > 0) ? 0.6 / forced_induction.max_boost : 0.0;
+    boost_wear_threshold = forced_induction.max_boost * 0.9;
+    inv_turbo_span = 1.0 / (redline - 2000.0);
+}
+
+void SubsystemSchedule::reset() {
+    for (int s = 0; s < SUBSYSTEM_COUNT; s++) {
+        interval[s] = 0.0;
+        pending[s] = 0.0;
+    }
+}
+
+void SubsystemSchedule::setRate(int subsystem, double hz) {
+    if (subsystem < 0 || subsystem >= SUBSYSTEM_COUNT) return;
+    interval[subsystem] = (hz > 0) ? 1.0 / hz : 0.0;
+}
+
+void SubsystemSchedule::advance(double delta_time, double* due) {
+    for (int s = 0; s < SUBSYSTEM_COUNT; s++) {
+        pending[s] += delta_time;
+        // Tolerance so an interval of a whole number of ticks is not pushed
+        // one tick late by rounding in the accumulated sum
+        if (pending[s] >= interval[s] * (1.0 - 1e-9)) {
+            due[s] = pending[s];
+            pending[s] = 0.0;
+        } else {
+            due[s] = 0.0;
+        }
+    }
+}
+
+void SubsystemAccumulator::reset() {
+    fuel = 0.0;
+    wear = 0.0;
+    for (int c = 0; c < THERMAL_CHANNEL_COUNT; c++) {
+        heat_rate[c] = 0.0;
+        heat_target[c] = 0.0;
+    }
+}
+
+// xorshift64* step - small per-instance generator for idle fluctuation
+static inline uint64_t nextRandom(uint64_t& state) {
+    state ^= state >> 12;
+    state ^= state << 25;
+    state ^= state >> 27;
+    return state * 2685821657736338717ULL;
+}
+
+// splitmix64 - spreads consecutive seeds into well-mixed generator states
+static inline uint64_t mixSeed(uint64_t seed) {
+    seed += 0x9E3779B97F4A7C15ULL;
+    seed = (seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    seed = (seed ^ (seed >> 27)) * 0x94D049BB133111EBULL;
+    seed ^= seed >> 31;
+    return seed ? seed : 0x9E3779B97F4A7C15ULL;
+}
+
+// Boosted torque (Nm) at an RPM for a throttle position and boost pressure
+static inline double boostedTorque(const EngineConfig& engine, const TorqueTable& torque_table,
+                                   double rpm, double throttle, double boost) {
+    if (rpm <= 0) return 0.0;
+    return engine.peak_torque * torque_table.lookup(rpm) * throttle * (1.0 + boost * BOOST_TORQUE_GAIN);
+}
+
+// One temperature lag of the thermal subsystem, towards `target` at `rate`.
+// Every tick adds its rate and rate-weighted target to the accumulator; when
+// the subsystem is due the temperature steps towards the rate-weighted mean
+// target over the whole accumulated lag, with the exact gain even in Euler
+// mode (many small Euler ticks compound to it). With nothing accumulated
+// before a due tick (the every-tick default) it is the plain per-tick step.
+static inline void stepThermalLag(int mode, double& temp, double target, double rate, double delta_time,
+                                  bool due, double& acc_rate, double& acc_target) {
+    if (due && acc_rate == 0.0) {
+        temp += (target - temp) * lagGain(mode, rate, delta_time);
+        return;
+    }
+    acc_rate += rate * delta_time;
+    acc_target += rate * target * delta_time;
+    if (due) {
+        int catch_up_mode = (mode == INTEGRATION_EULER) ? INTEGRATION_EXPONENTIAL : mode;
+        temp += (acc_target / acc_rate - temp) * lagGain(catch_up_mode, acc_rate, 1.0);
+        acc_rate = 0.0;
+        acc_target = 0.0;
+    }
+}
+
+// Configuration one tick reads: an EnginePhysics' own, or shared by a whole EngineFleet
+struct TickConfig {
+    const EngineConfig& engine;
+    const ForcedInductionConfig& forced_induction;
+    const TorqueTable& torque_table;
+    const CompiledConfig& compiled;
+    int integration_mode;
+};
+
+// One engine's simulation state for a tick: references to the members of an
+// EnginePhysics or to one index of the EngineFleet arrays (Flag is bool or
+// uint8_t), plus the inputs the tick reads but never changes
+template <typename Flag>
+struct TickState {
+    double& current_rpm;
+    double& target_rpm;
+    double& shift_timer;
+    Flag& is_shifting;
+    double& current_speed;
+    double& current_torque;
+    double& current_power;
+    double& current_boost;
+    double& oil_temp;
+    double& coolant_temp;
+    double& intake_temp;
+    double& fuel_level;
+    double& fuel_consumption;
+    double& engine_wear;
+    SubsystemAccumulator& accumulated;
+    double& acceleration_start_time;
+    double& quarter_mile_start_time;
+    Flag& timing_0_100;
+    Flag& timing_quarter_mile;
+    double& best_0_100_time;
+    double& best_quarter_mile_time;
+    double& total_distance;
+    double& runtime;
+    uint32_t& fluctuation_counter;
+    uint64_t& rng_state;
+    
+    double throttle_position;
+    int current_gear;
+    bool clutch_engaged;
+    bool engine_running;
+};
+
+// The per-tick physics shared by EnginePhysics::update and EngineFleet::step.
+// `due` is non-zero for the slow subsystems that run this tick (see
+// SubsystemSchedule::advance); the hot values are kept in locals and
+// written back once at the end.
+template <typename Flag>
+static inline void stepEngine(const TickConfig& config, TickState<Flag>& s, double delta_time, const double* due) {
+    const EngineConfig& engine = config.engine;
+    const ForcedInductionConfig& forced_induction = config.forced_induction;
+    const CompiledConfig& cc = config.compiled;
+    const int mode = config.integration_mode;
+    const bool running = s.engine_running;
+    const int gear = s.current_gear;
+    const double throttle = s.throttle_position;
+    double rpm = s.current_rpm;
+    double speed = s.current_speed;
+    double boost = s.current_boost;
+    
+    if (!running && rpm > 0) {
+        // Engine off - spin down at 300 + 0.2 * rpm per second, i.e. a lag
+        // with rate 0.2 towards -1500 RPM, stopped at zero
+        rpm = std::max(0.0, rpm - (rpm + 1500.0) * lagGain(mode, 0.2, delta_time));
+    } else if (running) {
+        // Engine running - update RPM with realistic acceleration
+        double rpm_diff = s.target_rpm - rpm;
+        
+        if (gear == 0) {
+            // Neutral - fast response (8x faster than base)
+            rpm += rpm_diff * lagGain(mode, cc.neutral_accel_rate, delta_time);
+        } else {
+            // In gear - slower due to vehicle mass and drivetrain
+            int gear_index = std::abs(gear);
+            rpm += rpm_diff * lagGain(mode, cc.gear_accel_rate[gear_index], delta_time);
+            
+            // Apply engine braking when throttle is released in gear
+            if (throttle < 0.05 && speed > 1.0) {
+                // Engine braking force proportional to RPM and gear
+                double engine_braking = rpm * cc.engine_braking[gear_index];
+                speed = std::max(0.0, speed - engine_braking * delta_time);
+            }
+        }
+        
+        // Idle stability with slight fluctuation
+        if (throttle < 0.05 && std::abs(rpm - engine.idle_rpm) < 50) {
+            if (++s.fluctuation_counter % 30 == 0) {
+                double random_offset = (double)(nextRandom(s.rng_state) % 20) - 10.0;
+                rpm = engine.idle_rpm + random_offset;
+            }
+        }
+        
+        // Rev limiter with hard cut
+        if (rpm > cc.redline) {
+            rpm = cc.redline;
+            s.target_rpm = cc.redline * 0.95;
+        }
+        
+        s.runtime += delta_time;
+    }
+    
+    // Handle shifting delay
+    if (s.is_shifting) {
+        s.shift_timer -= delta_time;
+        if (s.shift_timer <= 0) {
+            s.is_shifting = false;
+            s.shift_timer = 0;
+            
+            // After shift completes, recalculate target RPM based on current throttle
+            if (running && gear != 0) {
+                s.target_rpm = throttleTargetRPM(engine, gear, throttle);
+            }
+        }
+    }
+    
+    // Derived values (one torque evaluation; power follows from it)
+    double torque = boostedTorque(engine, config.torque_table, rpm, throttle, boost);
+    double power = powerFromTorque(torque, rpm);
+    
+    // Fuel consumption. The slow subsystems (fuel, thermal, wear) gather
+    // their inputs every tick in s.accumulated and apply them when due
+    // (every tick by default)
+    SubsystemAccumulator& acc = s.accumulated;
+    double consumption = 0.0;
+    if (running) {
+        double throttle_factor = 0.2 + throttle * throttle * 0.8;
+        double boost_factor = 1.0 + boost * cc.boost_fuel_gain;
+        consumption = cc.fuel_per_rpm * rpm * throttle_factor * cc.fuel_load[std::abs(gear)] * boost_factor;
+    }
+    
+    // Update speed based on gear and RPM
+    if (gear > 0 && s.clutch_engaged && running) {
+        // Smooth speed changes to prevent instant jumps (0.5 per 60 FPS frame)
+        double target_speed = rpm * cc.speed_per_rpm[gear];
+        speed += (target_speed - speed) * lagGain(mode, 0.5 * 60.0, delta_time);
+    } else if (gear < 0 && s.clutch_engaged && running) {
+        speed = -rpm * cc.reverse_speed_per_rpm;
+    } else if (gear == 0 && speed > 0) {
+        // In neutral, apply rolling resistance to slow down
+        speed = std::max(0.0, speed - 5.0 * delta_time);
+    }
+    
+    // Update distance and fuel level
+    if (speed > 0) {
+        s.total_distance += (speed * delta_time) / 3600.0;
+    }
+    acc.fuel += consumption * delta_time;
+    if (due[SUBSYSTEM_FUEL] > 0 && acc.fuel > 0) {
+        double fuel_used = acc.fuel / 3600.0;
+        s.fuel_level = std::max(0.0, s.fuel_level - (fuel_used / 50.0) * 100.0);
+        acc.fuel = 0.0;
+    }
+    
+    // Temperatures
+    double target_oil_temp, target_coolant_temp, target_intake_temp;
+    double oil_heat_rate, coolant_heat_rate, intake_heat_rate;
+    if (!running) {
+        // Cool down to ambient when engine is off
+        target_oil_temp = target_coolant_temp = target_intake_temp = 20.0;
+        oil_heat_rate = 0.1;
+        coolant_heat_rate = 0.15;
+        intake_heat_rate = 0.3;
+    } else {
+        double rpm_factor = rpm * cc.inv_redline;
+        double load_factor = rpm_factor * throttle;
+        
+        target_oil_temp = 20 + load_factor * 80 + rpm_factor * 20;
+        oil_heat_rate = (target_oil_temp > s.oil_temp) ? 0.15 : 0.08;
+        
+        target_coolant_temp = 20 + load_factor * 60 + rpm_factor * 15;
+        coolant_heat_rate = (target_coolant_temp > s.coolant_temp) ? 0.12 : 0.1;
+        
+        // Intake temperature (affected by boost)
+        target_intake_temp = 20 + load_factor * 25 + boost * 3.5;
+        intake_heat_rate = (target_intake_temp > s.intake_temp) ? 0.25 : 0.35;
+    }
+    const bool thermal_due = due[SUBSYSTEM_THERMAL] > 0;
+    stepThermalLag(mode, s.oil_temp, target_oil_temp, oil_heat_rate, delta_time, thermal_due,
+                   acc.heat_rate[THERMAL_OIL], acc.heat_target[THERMAL_OIL]);
+    stepThermalLag(mode, s.coolant_temp, target_coolant_temp, coolant_heat_rate, delta_time, thermal_due,
+                   acc.heat_rate[THERMAL_COOLANT], acc.heat_target[THERMAL_COOLANT]);
+    stepThermalLag(mode, s.intake_temp, target_intake_temp, intake_heat_rate, delta_time, thermal_due,
+                   acc.heat_rate[THERMAL_INTAKE], acc.heat_target[THERMAL_INTAKE]);
+    
+    if (running) {
+        // Overheating penalty - every tick (torque and power are recomputed
+        // every tick), whatever the thermal rate
+        if (s.coolant_temp > 105.0) {
+            double overheat_penalty = 1.0 - ((s.coolant_temp - 105.0) / 20.0) * 0.3;
+            overheat_penalty = std::max(0.7, std::min(1.0, overheat_penalty));
+            power *= overheat_penalty;
+            torque *= overheat_penalty;
+        }
+        
+        // Engine wear
+        double wear_rate = 0.001 * delta_time;
+        if (rpm > cc.rpm_wear_threshold) wear_rate *= 3.0;
+        if (s.oil_temp > 110) wear_rate *= 2.0;
+        if (s.coolant_temp > 100) wear_rate *= 2.5;
+        if (boost > cc.boost_wear_threshold) wear_rate *= 1.5;
+        acc.wear += wear_rate;
+    }
+    if (due[SUBSYSTEM_WEAR] > 0 && acc.wear > 0) {
+        s.engine_wear = std::min(100.0, s.engine_wear + acc.wear);
+        acc.wear = 0.0;
+    }
+    
+    // Boost
+    if (forced_induction.type == ForcedInductionConfig::NONE) {
+        boost = 0;
+    } else {
+        double target_boost = 0;
+        if (running && throttle > 0.1) {
+            double rpm_factor = (forced_induction.type == ForcedInductionConfig::SUPERCHARGER)
+                ? rpm * cc.inv_redline
+                : std::max(0.0, (rpm - 2000.0) * cc.inv_turbo_span);
+            target_boost = forced_induction.max_boost * rpm_factor * throttle;
+        }
+        double response_rate = 5.0;
+        if (forced_induction.type == ForcedInductionConfig::TURBO) {
+            response_rate = (target_boost > boost) ? forced_induction.spool_rate : forced_induction.spool_rate * 2.0;
+        }
+        boost += (target_boost - boost) * lagGain(mode, response_rate, delta_time);
+        boost = std::max(0.0, std::min(forced_induction.max_boost, boost));
+    }
+    
+    // Performance tracking
+    if (speed >= 100.0 && !s.timing_0_100 && s.acceleration_start_time > 0) {
+        double time_0_100 = s.runtime - s.acceleration_start_time;
+        if (s.best_0_100_time == 0 || time_0_100 < s.best_0_100_time) {
+            s.best_0_100_time = time_0_100;
+        }
+        s.timing_0_100 = true;
+    }
+    if (speed > 5.0 && s.acceleration_start_time == 0) {
+        s.acceleration_start_time = s.runtime;
+        s.timing_0_100 = false;
+    } else if (speed < 2.0) {
+        s.acceleration_start_time = 0;
+        s.timing_0_100 = false;
+    }
+    
+    // Quarter mile timing
+    if (s.total_distance >= 0.402 && !s.timing_quarter_mile && s.quarter_mile_start_time > 0) {
+        double quarter_time = s.runtime - s.quarter_mile_start_time;
+        if (s.best_quarter_mile_time == 0 || quarter_time < s.best_quarter_mile_time) {
+            s.best_quarter_mile_time = quarter_time;
+        }
+        s.timing_quarter_mile = true;
+    }
+    
+    s.current_rpm = rpm;
+    s.current_speed = speed;
+    s.current_boost = boost;
+    s.current_torque = torque;
+    s.current_power = power;
+    s.fuel_consumption = consumption;
+}
 
 EnginePhysics::EnginePhysics() {
     // Initialize with default inline-4 turbo engine
@@ -8,6 +476,10 @@ EnginePhysics::EnginePhysics() {
     transmission = getDefault6Speed();
     forced_induction = {ForcedInductionConfig::TURBO, 15.0, 0.1};
     vehicle = {1400.0, 0.15, 0.32, 0.015};
+    compileConfig();
+    integration_mode = INTEGRATION_EULER;
+    schedule.reset();
+    accumulated.reset();
     
     // Initialize engine state
     current_rpm = 0;
@@ -46,6 +518,9 @@ EnginePhysics::EnginePhysics() {
     // Initialize session data
     total_distance = 0;
     runtime = 0;
+    
+    fluctuation_counter = 0;
+    setSeed(0);
 }
 
 EnginePhysics::~EnginePhysics() {}
@@ -69,32 +544,21 @@ void EnginePhysics::setThrottle(double throttle) {
     throttle_position = std::max(0.0, std::min(1.0, throttle));
     
     if (engine_running) {
-        if (current_gear == 0) {
-            // Neutral - allow full RPM range
-            if (throttle_position < 0.05) {
-                target_rpm = engine.idle_rpm;
-            } else {
-                // Full range from idle to redline with 5% safety margin
-                target_rpm = engine.idle_rpm + throttle_position * (engine.redline_rpm * 0.95 - engine.idle_rpm);
-            }
-        } else {
-            // In gear - RPM depends on speed, gear ratio, and throttle
-            double load_factor = (current_gear > 0) ? 1.0 : 0.8;
-            if (throttle_position < 0.05) {
-                target_rpm = engine.idle_rpm;
-            } else {
-                target_rpm = engine.idle_rpm + throttle_position * (engine.redline_rpm - engine.idle_rpm) * load_factor;
-            }
-        }
+        target_rpm = throttleTargetRPM(engine, current_gear, throttle_position);
     }
 }
 
 void EnginePhysics::setBrake(double brake) {
+    // Single brake event, sized for one 60 FPS frame
+    applyBrake(brake, 0.016);
+}
+
+void EnginePhysics::applyBrake(double brake, double delta_time) {
     brake = std::max(0.0, std::min(1.0, brake));
     
     if (brake > 0 && current_speed > 0) {
         double brake_force = brake * 50.0;
-        current_speed = std::max(0.0, current_speed - brake_force * 0.016);
+        current_speed = std::max(0.0, current_speed - brake_force * delta_time);
     }
 }
 
@@ -195,294 +659,269 @@ void EnginePhysics::setGear(int gear) {
 }
 
 double EnginePhysics::calculateTorqueAtRPM(double rpm) {
-    if (rpm <= 0) return 0;
-    
-    // Realistic torque curve with peak at specified RPM
-    double rpm_ratio = rpm / engine.peak_torque_rpm;
-    double torque_multiplier;
-    
-    if (rpm < engine.peak_torque_rpm) {
-        // Rising torque before peak
-        torque_multiplier = 0.3 + 0.7 * rpm_ratio;
-    } else {
-        // Falling torque after peak
-        double fall_rate = (engine.redline_rpm - engine.peak_torque_rpm) / (double)engine.peak_torque_rpm;
-        torque_multiplier = 1.0 - 0.6 * ((rpm_ratio - 1.0) / fall_rate);
-    }
-    
-    torque_multiplier = std::max(0.1, std::min(1.0, torque_multiplier));
-    
-    double base_torque = engine.peak_torque * torque_multiplier * throttle_position;
-    
-    // Apply boost multiplier (60% increase at max boost)
-    double boost_multiplier = 1.0 + (current_boost / 14.7) * 0.6;
-    
-    return base_torque * boost_multiplier;
+    return boostedTorque(engine, torque_table, rpm, throttle_position, current_boost);
 }
 
 double EnginePhysics::calculatePowerAtRPM(double rpm) {
-    double torque = calculateTorqueAtRPM(rpm);
-    // Power (kW) = Torque (Nm) × RPM / 9549
-    // Power (HP) = Power (kW) × 1.341
-    double power_kw = (torque * rpm) / 9549.0;
-    return power_kw * 1.341;
-}
-
-double EnginePhysics::calculateFuelConsumption() {
-    if (!engine_running) return 0;
-    
-    double rpm_factor = current_rpm / (double)engine.redline_rpm;
-    double throttle_factor = 0.2 + throttle_position * throttle_position * 0.8;
-    
-    double load_factor = 1.0;
-    if (current_gear != 0) {
-        load_factor = 1.0 + (0.3 / (std::abs(current_gear) + 1.0));
-    }
-    
-    double boost_factor = 1.0 + (current_boost / forced_induction.max_boost) * 0.6;
-    
-    double base_consumption = engine.fuel_base * engine.displacement * 0.5;
-    
-    return base_consumption * rpm_factor * throttle_factor * load_factor * boost_factor;
+    return powerFromTorque(calculateTorqueAtRPM(rpm), rpm);
 }
 
-void EnginePhysics::updateTemperatures(double delta_time) {
-    if (!engine_running) {
-        // Cool down when engine is off
-        double ambient_temp = 20.0;
-        oil_temp += (ambient_temp - oil_temp) * 0.1 * delta_time;
-        coolant_temp += (ambient_temp - coolant_temp) * 0.15 * delta_time;
-        intake_temp += (ambient_temp - intake_temp) * 0.3 * delta_time;
-        return;
-    }
-    
-    double load_factor = (current_rpm / (double)engine.redline_rpm) * throttle_position;
-    
-    // Oil temperature
-    double target_oil_temp = 20 + load_factor * 80 + (current_rpm / engine.redline_rpm) * 20;
-    double oil_heat_rate = (target_oil_temp > oil_temp) ? 0.15 : 0.08;
-    oil_temp += (target_oil_temp - oil_temp) * oil_heat_rate * delta_time;
-    
-    // Coolant temperature
-    double target_coolant_temp = 20 + load_factor * 60 + (current_rpm / engine.redline_rpm) * 15;
-    double coolant_heat_rate = (target_coolant_temp > coolant_temp) ? 0.12 : 0.1;
-    coolant_temp += (target_coolant_temp - coolant_temp) * coolant_heat_rate * delta_time;
-    
-    // Intake temperature (affected by boost)
-    double boost_heat = current_boost * 3.5;
-    double target_intake_temp = 20 + load_factor * 25 + boost_heat;
-    double intake_heat_rate = (target_intake_temp > intake_temp) ? 0.25 : 0.35;
-    intake_temp += (target_intake_temp - intake_temp) * intake_heat_rate * delta_time;
+void EnginePhysics::update(double delta_time) {
+    double due[SUBSYSTEM_COUNT];
+    schedule.advance(delta_time, due);
     
-    // Overheating penalty
-    if (coolant_temp > 105.0) {
-        double overheat_penalty = 1.0 - ((coolant_temp - 105.0) / 20.0) * 0.3;
-        overheat_penalty = std::max(0.7, std::min(1.0, overheat_penalty));
-        current_power *= overheat_penalty;
-        current_torque *= overheat_penalty;
-    }
+    const TickConfig config = {engine, forced_induction, torque_table, compiled, integration_mode};
+    TickState<bool> state = {
+        current_rpm, target_rpm, shift_timer, is_shifting,
+        current_speed, current_torque, current_power, current_boost,
+        oil_temp, coolant_temp, intake_temp, fuel_level, fuel_consumption, engine_wear, accumulated,
+        acceleration_start_time, quarter_mile_start_time, timing_0_100, timing_quarter_mile,
+        best_0_100_time, best_quarter_mile_time, total_distance, runtime,
+        fluctuation_counter, rng_state,
+        throttle_position, current_gear, clutch_engaged, engine_running,
+    };
+    stepEngine(config, state, delta_time, due);
 }
 
-void EnginePhysics::updateEngineWear(double delta_time) {
-    if (!engine_running) return;
-    
-    double wear_rate = 0.001 * delta_time;
-    
-    if (current_rpm > engine.redline_rpm * 0.9) wear_rate *= 3.0;
-    if (oil_temp > 110) wear_rate *= 2.0;
-    if (coolant_temp > 100) wear_rate *= 2.5;
-    if (current_boost > forced_induction.max_boost * 0.9) wear_rate *= 1.5;
+int EnginePhysics::stepN(int n, double delta_time, const double* throttle, const double* brake,
+                         const int* gear, EngineState* out) {
+    if (n <= 0) return 0;
     
-    engine_wear = std::min(100.0, engine_wear + wear_rate);
-}
-
-void EnginePhysics::updateBoost(double delta_time) {
-    if (forced_induction.type == ForcedInductionConfig::NONE) {
-        current_boost = 0;
-        return;
-    }
+    double last_throttle = throttle_position;
     
-    double target_boost = 0;
-    if (engine_running && throttle_position > 0.1) {
-        if (forced_induction.type == ForcedInductionConfig::SUPERCHARGER) {
-            double rpm_factor = current_rpm / (double)engine.redline_rpm;
-            target_boost = forced_induction.max_boost * rpm_factor * throttle_position;
-        } else if (forced_induction.type == ForcedInductionConfig::TURBO) {
-            double rpm_factor = std::max(0.0, (current_rpm - 2000.0) / (engine.redline_rpm - 2000.0));
-            target_boost = forced_induction.max_boost * rpm_factor * throttle_position;
+    for (int i = 0; i < n; i++) {
+        if (throttle && throttle[i] != last_throttle) {
+            setThrottle(throttle[i]);
+            last_throttle = throttle[i];
         }
-    }
-    
-    double response_rate;
-    if (forced_induction.type == ForcedInductionConfig::TURBO) {
-        response_rate = (target_boost > current_boost) ? forced_induction.spool_rate : forced_induction.spool_rate * 2.0;
-    } else {
-        response_rate = 5.0;
-    }
-    
-    current_boost += (target_boost - current_boost) * response_rate * delta_time;
-    current_boost = std::max(0.0, std::min(forced_induction.max_boost, current_boost));
-}
-
-void EnginePhysics::update(double delta_time) {
-    if (!engine_running && current_rpm > 0) {
-        // Engine off - spin down
-        double spindown_rate = 300.0 + (current_rpm * 0.2);
-        current_rpm = std::max(0.0, current_rpm - spindown_rate * delta_time);
-    } else if (engine_running) {
-        // Engine running - update RPM with realistic acceleration
-        double rpm_diff = target_rpm - current_rpm;
-        double base_accel_rate = 1.0 / (engine.engine_inertia * 6.0);
-        
-        if (current_gear == 0) {
-            // Neutral - fast response (8x faster than base)
-            double accel_rate = base_accel_rate * 8.0;
-            current_rpm += rpm_diff * accel_rate * delta_time;
-        } else {
-            // In gear - slower due to vehicle mass and drivetrain
-            double mass_factor = vehicle.vehicle_mass / 1000.0;
-            double gear_load = 1.0 + (std::abs(current_gear) * 0.15);
-            double total_inertia = engine.engine_inertia * mass_factor * gear_load;
-            double accel_rate = base_accel_rate * 1.0 / total_inertia;
-            current_rpm += rpm_diff * accel_rate * delta_time;
-            
-            // Apply engine braking when throttle is released in gear
-            if (throttle_position < 0.05 && current_speed > 1.0) {
-                // Engine braking force proportional to RPM and gear
-                double engine_braking = (current_rpm / engine.redline_rpm) * 15.0 * std::abs(current_gear);
-                current_speed = std::max(0.0, current_speed - engine_braking * delta_time);
-            }
+        if (gear && gear[i] != current_gear && !is_shifting) {
+            // setGear is refused mid-shift, so the requested gear is
+            // retried on later steps until it engages
+            setGear(gear[i]);
         }
-        
-        // Idle stability with slight fluctuation
-        if (throttle_position < 0.05 && std::abs(current_rpm - engine.idle_rpm) < 50) {
-            static int fluctuation_counter = 0;
-            fluctuation_counter++;
-            if (fluctuation_counter % 30 == 0) {
-                double random_offset = ((rand() % 20) - 10);
-                current_rpm = engine.idle_rpm + random_offset;
-            }
+        if (brake && brake[i] > 0) {
+            applyBrake(brake[i], delta_time);
         }
         
-        // Rev limiter with hard cut
-        if (current_rpm > engine.redline_rpm) {
-            current_rpm = engine.redline_rpm;
-            target_rpm = engine.redline_rpm * 0.95;
-        }
+        update(delta_time);
         
-        runtime += delta_time;
-    }
-    
-    // Handle shifting delay
-    if (is_shifting) {
-        shift_timer -= delta_time;
-        if (shift_timer <= 0) {
-            is_shifting = false;
-            shift_timer = 0;
-            
-            // After shift completes, recalculate target RPM based on current throttle
-            if (engine_running && current_gear != 0) {
-                double load_factor = (current_gear > 0) ? 1.0 : 0.8;
-                if (throttle_position < 0.05) {
-                    target_rpm = engine.idle_rpm;
-                } else {
-                    target_rpm = engine.idle_rpm + throttle_position * (engine.redline_rpm - engine.idle_rpm) * load_factor;
-                }
-            }
+        if (out) {
+            getState(out[i]);
         }
     }
+    return n;
+}
+
+void EnginePhysics::getState(EngineState& out) const {
+    out.rpm = current_rpm;
+    out.target_rpm = target_rpm;
+    out.speed = current_speed;
+    out.torque = current_torque;
+    out.power = current_power;
+    out.boost = current_boost;
+    out.throttle_position = throttle_position;
+    out.oil_temp = oil_temp;
+    out.coolant_temp = coolant_temp;
+    out.intake_temp = intake_temp;
+    out.fuel_level = fuel_level;
+    out.fuel_consumption = fuel_consumption;
+    out.engine_wear = engine_wear;
+    out.best_0_100_time = best_0_100_time;
+    out.best_quarter_mile_time = best_quarter_mile_time;
+    out.total_distance = total_distance;
+    out.runtime = runtime;
+    out.current_gear = current_gear;
+    out.clutch_engaged = clutch_engaged ? 1 : 0;
+    out.engine_running = engine_running ? 1 : 0;
+    out.is_shifting = is_shifting ? 1 : 0;
+}
+
+// Copy a string into a fixed, always NUL-terminated field
+static void copyName(char* out, size_t size, const std::string& in) {
+    std::memset(out, 0, size);
+    std::strncpy(out, in.c_str(), size - 1);
+}
+
+void EnginePhysics::saveState(EngineCheckpoint& out) const {
+    std::memset(&out, 0, sizeof(out));
+    out.magic = EngineCheckpoint::MAGIC;
+    out.version = EngineCheckpoint::VERSION;
     
-    // Update derived values
-    current_torque = calculateTorqueAtRPM(current_rpm);
-    current_power = calculatePowerAtRPM(current_rpm);
-    fuel_consumption = calculateFuelConsumption();
+    copyName(out.name, sizeof(out.name), engine.name);
+    copyName(out.fuel_type, sizeof(out.fuel_type), engine.fuel_type);
+    out.displacement = engine.displacement;
+    out.cylinders = engine.cylinders;
+    out.idle_rpm = engine.idle_rpm;
+    out.redline_rpm = engine.redline_rpm;
+    out.peak_torque = engine.peak_torque;
+    out.peak_torque_rpm = engine.peak_torque_rpm;
+    out.peak_power = engine.peak_power;
+    out.peak_power_rpm = engine.peak_power_rpm;
+    out.engine_inertia = engine.engine_inertia;
+    out.fuel_base = engine.fuel_base;
     
-    // Update speed based on gear and RPM
-    if (current_gear > 0 && clutch_engaged && engine_running) {
-        double gear_ratio = transmission.gear_ratios[current_gear - 1];
-        double wheel_circumference = M_PI * transmission.wheel_diameter;
-        double wheel_rpm = current_rpm / (gear_ratio * transmission.final_drive);
-        double target_speed = (wheel_rpm * wheel_circumference * 60.0) / 1000.0;
-        
-        // Smooth speed changes to prevent instant jumps
-        double speed_diff = target_speed - current_speed;
-        double speed_accel_rate = 0.5; // Smooth acceleration/deceleration
-        current_speed += speed_diff * speed_accel_rate * delta_time * 60.0;
-        
-    } else if (current_gear < 0 && clutch_engaged && engine_running) {
-        double gear_ratio = 3.5;
-        double wheel_circumference = M_PI * transmission.wheel_diameter;
-        double wheel_rpm = current_rpm / (gear_ratio * transmission.final_drive);
-        current_speed = -(wheel_rpm * wheel_circumference * 60.0) / 1000.0;
-    } else if (current_gear == 0 && current_speed > 0) {
-        // In neutral, apply rolling resistance to slow down
-        double rolling_decel = 5.0; // Gradual slowdown in neutral
-        current_speed = std::max(0.0, current_speed - rolling_decel * delta_time);
+    out.gear_count = static_cast<int32_t>(std::min<size_t>(transmission.gear_ratios.size(), EngineCheckpoint::MAX_GEARS));
+    for (int i = 0; i < out.gear_count; i++) {
+        out.gear_ratios[i] = transmission.gear_ratios[i];
     }
+    out.final_drive = transmission.final_drive;
+    out.wheel_diameter = transmission.wheel_diameter;
+    out.forced_induction_type = forced_induction.type;
+    out.max_boost = forced_induction.max_boost;
+    out.spool_rate = forced_induction.spool_rate;
+    out.vehicle_mass = vehicle.vehicle_mass;
+    out.drivetrain_loss = vehicle.drivetrain_loss;
+    out.drag_coefficient = vehicle.drag_coefficient;
+    out.rolling_resistance = vehicle.rolling_resistance;
     
-    // Update distance
-    if (current_speed > 0) {
-        total_distance += (current_speed * delta_time) / 3600.0;
+    out.integration_mode = integration_mode;
+    for (int s = 0; s < SUBSYSTEM_COUNT; s++) {
+        out.subsystem_interval[s] = schedule.interval[s];
+        out.subsystem_pending[s] = schedule.pending[s];
     }
+    out.subsystem_accumulated = accumulated;
     
-    // Update fuel level
-    if (fuel_consumption > 0) {
-        double fuel_used = (fuel_consumption * delta_time) / 3600.0;
-        fuel_level = std::max(0.0, fuel_level - (fuel_used / 50.0) * 100.0);
+    out.current_rpm = current_rpm;
+    out.target_rpm = target_rpm;
+    out.throttle_position = throttle_position;
+    out.current_gear = current_gear;
+    out.clutch_engaged = clutch_engaged;
+    out.engine_running = engine_running;
+    out.is_shifting = is_shifting;
+    out.shift_timer = shift_timer;
+    out.current_speed = current_speed;
+    out.current_torque = current_torque;
+    out.current_power = current_power;
+    out.current_boost = current_boost;
+    out.oil_temp = oil_temp;
+    out.coolant_temp = coolant_temp;
+    out.intake_temp = intake_temp;
+    out.fuel_level = fuel_level;
+    out.fuel_consumption = fuel_consumption;
+    out.engine_wear = engine_wear;
+    out.acceleration_start_time = acceleration_start_time;
+    out.quarter_mile_start_time = quarter_mile_start_time;
+    out.timing_0_100 = timing_0_100;
+    out.timing_quarter_mile = timing_quarter_mile;
+    out.best_0_100_time = best_0_100_time;
+    out.best_quarter_mile_time = best_quarter_mile_time;
+    out.total_distance = total_distance;
+    out.runtime = runtime;
+    out.fluctuation_counter = fluctuation_counter;
+    out.rng_state = rng_state;
+}
+
+bool EnginePhysics::loadState(const EngineCheckpoint& in) {
+    if (in.magic != EngineCheckpoint::MAGIC || in.version != EngineCheckpoint::VERSION) {
+        return false;
     }
     
-    // Update subsystems
-    updateTemperatures(delta_time);
-    updateEngineWear(delta_time);
-    updateBoost(delta_time);
+    engine.name.assign(in.name, strnlen(in.name, sizeof(in.name)));
+    engine.fuel_type.assign(in.fuel_type, strnlen(in.fuel_type, sizeof(in.fuel_type)));
+    engine.displacement = in.displacement;
+    engine.cylinders = in.cylinders;
+    engine.idle_rpm = in.idle_rpm;
+    engine.redline_rpm = in.redline_rpm;
+    engine.peak_torque = in.peak_torque;
+    engine.peak_torque_rpm = in.peak_torque_rpm;
+    engine.peak_power = in.peak_power;
+    engine.peak_power_rpm = in.peak_power_rpm;
+    engine.engine_inertia = in.engine_inertia;
+    engine.fuel_base = in.fuel_base;
     
-    // Performance tracking
-    if (current_speed >= 100.0 && !timing_0_100 && current_speed > 5.0) {
-        if (acceleration_start_time > 0) {
-            double time_0_100 = runtime - acceleration_start_time;
-            if (best_0_100_time == 0 || time_0_100 < best_0_100_time) {
-                best_0_100_time = time_0_100;
-            }
-            timing_0_100 = true;
-        }
-    }
+    int gear_count = std::max(0, std::min<int>(in.gear_count, static_cast<int>(EngineCheckpoint::MAX_GEARS)));
+    transmission.gear_ratios.assign(in.gear_ratios, in.gear_ratios + gear_count);
+    transmission.final_drive = in.final_drive;
+    transmission.wheel_diameter = in.wheel_diameter;
+    forced_induction.type = static_cast<ForcedInductionConfig::Type>(in.forced_induction_type);
+    forced_induction.max_boost = in.max_boost;
+    forced_induction.spool_rate = in.spool_rate;
+    vehicle.vehicle_mass = in.vehicle_mass;
+    vehicle.drivetrain_loss = in.drivetrain_loss;
+    vehicle.drag_coefficient = in.drag_coefficient;
+    vehicle.rolling_resistance = in.rolling_resistance;
+    compileConfig();
     
-    if (current_speed > 5.0 && acceleration_start_time == 0) {
-        acceleration_start_time = runtime;
-        timing_0_100 = false;
-    } else if (current_speed < 2.0) {
-        acceleration_start_time = 0;
-        timing_0_100 = false;
+    integration_mode = in.integration_mode;
+    for (int s = 0; s < SUBSYSTEM_COUNT; s++) {
+        schedule.interval[s] = in.subsystem_interval[s];
+        schedule.pending[s] = in.subsystem_pending[s];
     }
+    accumulated = in.subsystem_accumulated;
     
-    // Quarter mile timing
-    if (total_distance >= 0.402 && !timing_quarter_mile && quarter_mile_start_time > 0) {
-        double quarter_time = runtime - quarter_mile_start_time;
-        if (best_quarter_mile_time == 0 || quarter_time < best_quarter_mile_time) {
-            best_quarter_mile_time = quarter_time;
-        }
-        timing_quarter_mile = true;
+    current_rpm = in.current_rpm;
+    target_rpm = in.target_rpm;
+    throttle_position = in.throttle_position;
+    current_gear = in.current_gear;
+    clutch_engaged = in.clutch_engaged != 0;
+    engine_running = in.engine_running != 0;
+    is_shifting = in.is_shifting != 0;
+    shift_timer = in.shift_timer;
+    current_speed = in.current_speed;
+    current_torque = in.current_torque;
+    current_power = in.current_power;
+    current_boost = in.current_boost;
+    oil_temp = in.oil_temp;
+    coolant_temp = in.coolant_temp;
+    intake_temp = in.intake_temp;
+    fuel_level = in.fuel_level;
+    fuel_consumption = in.fuel_consumption;
+    engine_wear = in.engine_wear;
+    acceleration_start_time = in.acceleration_start_time;
+    quarter_mile_start_time = in.quarter_mile_start_time;
+    timing_0_100 = in.timing_0_100 != 0;
+    timing_quarter_mile = in.timing_quarter_mile != 0;
+    best_0_100_time = in.best_0_100_time;
+    best_quarter_mile_time = in.best_quarter_mile_time;
+    total_distance = in.total_distance;
+    runtime = in.runtime;
+    fluctuation_counter = in.fluctuation_counter;
+    rng_state = in.rng_state;
+    return true;
+}
+
+void EnginePhysics::compileConfig() {
+    torque_table.build(engine);
+    compiled.build(engine, transmission, forced_induction, vehicle);
+}
+
+void EnginePhysics::setIntegrationMode(int mode) {
+    if (mode >= INTEGRATION_EULER && mode <= INTEGRATION_EXPONENTIAL_FAST) {
+        integration_mode = mode;
     }
 }
 
+void EnginePhysics::setSubsystemRate(int subsystem, double hz) {
+    schedule.setRate(subsystem, hz);
+}
+
+void EnginePhysics::setSeed(uint64_t seed) {
+    rng_state = mixSeed(seed);
+}
+
 void EnginePhysics::setEngineConfig(const EngineConfig& config) {
     engine = config;
+    compileConfig();
 }
 
 void EnginePhysics::setTransmissionConfig(const TransmissionConfig& config) {
     transmission = config;
+    compileConfig();
 }
 
 void EnginePhysics::setForcedInduction(const ForcedInductionConfig& config) {
     forced_induction = config;
+    compileConfig();
 }
 
 void EnginePhysics::setRevLimiter(int rpm) {
     engine.redline_rpm = std::max(3000, std::min(12000, rpm));
+    compileConfig();
 }
 
 void EnginePhysics::setBoostPressure(double psi) {
     forced_induction.max_boost = std::max(0.0, std::min(25.0, psi));
+    compileConfig();
 }
 
 // Engine presets
@@ -551,4 +990,361 @@ void EnginePhysics::resetSession() {
     timing_quarter_mile = false;
     engine_wear = 0;
     fuel_level = 100;
-}
\ No newline at end of file
+    accumulated.fuel = 0;
+    accumulated.wear = 0;
+}
+
+// ============================================================================
+// EngineFleet - struct-of-arrays multi-instance simulator
+// ============================================================================
+
+EngineFleet::EngineFleet(int count) {
+    engine = EnginePhysics::getInline4Turbo();
+    transmission = EnginePhysics::getDefault6Speed();
+    forced_induction = {ForcedInductionConfig::TURBO, 15.0, 0.1};
+    vehicle = {1400.0, 0.15, 0.32, 0.015};
+    compileConfig();
+    integration_mode = INTEGRATION_EULER;
+    schedule.reset();
+    thread_count = 0;
+    
+    size_t n = static_cast<size_t>(std::max(0, count));
+    brake.assign(n, 0.0);
+    requested_gear.assign(n, 0);
+    
+    current_rpm.assign(n, 0.0);
+    target_rpm.assign(n, engine.idle_rpm);
+    throttle_position.assign(n, 0.0);
+    current_gear.assign(n, 0);
+    clutch_engaged.assign(n, 1);
+    engine_running.assign(n, 0);
+    shift_timer.assign(n, 0.0);
+    is_shifting.assign(n, 0);
+    
+    current_speed.assign(n, 0.0);
+    current_torque.assign(n, 0.0);
+    current_power.assign(n, 0.0);
+    current_boost.assign(n, 0.0);
+    
+    oil_temp.assign(n, 20.0);
+    coolant_temp.assign(n, 20.0);
+    intake_temp.assign(n, 20.0);
+    fuel_level.assign(n, 100.0);
+    fuel_consumption.assign(n, 0.0);
+    engine_wear.assign(n, 0.0);
+    SubsystemAccumulator nothing_accumulated;
+    nothing_accumulated.reset();
+    accumulated.assign(n, nothing_accumulated);
+    
+    acceleration_start_time.assign(n, 0.0);
+    quarter_mile_start_time.assign(n, 0.0);
+    timing_0_100.assign(n, 0);
+    timing_quarter_mile.assign(n, 0);
+    best_0_100_time.assign(n, 0.0);
+    best_quarter_mile_time.assign(n, 0.0);
+    total_distance.assign(n, 0.0);
+    runtime.assign(n, 0.0);
+    
+    fluctuation_counter.assign(n, 0);
+    rng_state.assign(n, 0);
+    setSeed(0);
+    
+    pool_generation = 0;
+    pool_pending = 0;
+    pool_stop = false;
+    job_delta_time = 0.0;
+    job_steps = 0;
+    job_chunk = 0;
+}
+
+EngineFleet::~EngineFleet() {
+    stopPool();
+}
+
+void EngineFleet::setThreadCount(int threads) {
+    thread_count = std::max(0, threads);
+}
+
+void EngineFleet::startPool(size_t count) {
+    stopPool();
+    workers.reserve(count);
+    for (size_t t = 1; t <= count; t++) {
+        workers.emplace_back(&EngineFleet::workerLoop, this, t);
+    }
+}
+
+void EngineFleet::stopPool() {
+    if (workers.empty()) return;
+    {
+        std::lock_guard<std::mutex> lock(pool_mutex);
+        pool_stop = true;
+    }
+    pool_wake.notify_all();
+    for (auto& worker : workers) {
+        worker.join();
+    }
+    workers.clear();
+    pool_stop = false;
+}
+
+void EngineFleet::workerLoop(size_t slice) {
+    uint64_t seen = 0;
+    std::unique_lock<std::mutex> lock(pool_mutex);
+    for (;;) {
+        pool_wake.wait(lock, [&] { return pool_stop || pool_generation != seen; });
+        if (pool_stop) return;
+        seen = pool_generation;
+        
+        const size_t n = current_rpm.size();
+        const size_t begin = std::min(n, slice * job_chunk);
+        const size_t end = std::min(n, begin + job_chunk);
+        const double delta_time = job_delta_time;
+        const int steps = job_steps;
+        lock.unlock();
+        stepRange(begin, end, delta_time, steps, due.data());
+        lock.lock();
+        
+        if (--pool_pending == 0) {
+            pool_done.notify_one();
+        }
+    }
+}
+
+void EngineFleet::setSeed(uint64_t seed) {
+    for (size_t i = 0; i < rng_state.size(); i++) {
+        rng_state[i] = mixSeed(seed + i);
+    }
+}
+
+void EngineFleet::compileConfig() {
+    torque_table.build(engine);
+    compiled.build(engine, transmission, forced_induction, vehicle);
+}
+
+void EngineFleet::setIntegrationMode(int mode) {
+    if (mode >= INTEGRATION_EULER && mode <= INTEGRATION_EXPONENTIAL_FAST) {
+        integration_mode = mode;
+    }
+}
+
+void EngineFleet::setSubsystemRate(int subsystem, double hz) {
+    schedule.setRate(subsystem, hz);
+}
+
+void EngineFleet::setEngineConfig(const EngineConfig& config) {
+    engine = config;
+    compileConfig();
+}
+
+void EngineFleet::setTransmissionConfig(const TransmissionConfig& config) {
+    transmission = config;
+    compileConfig();
+}
+
+void EngineFleet::setForcedInduction(const ForcedInductionConfig& config) {
+    forced_induction = config;
+    compileConfig();
+}
+
+void EngineFleet::setRevLimiter(int rpm) {
+    engine.redline_rpm = std::max(3000, std::min(12000, rpm));
+    compileConfig();
+}
+
+void EngineFleet::setBoostPressure(double psi) {
+    forced_induction.max_boost = std::max(0.0, std::min(25.0, psi));
+    compileConfig();
+}
+
+void EngineFleet::startEngines(const uint8_t* mask) {
+    for (size_t i = 0; i < current_rpm.size(); i++) {
+        if ((mask && !mask[i]) || engine_running[i] || fuel_level[i] <= 0) continue;
+        engine_running[i] = 1;
+        current_rpm[i] = engine.idle_rpm;
+        target_rpm[i] = engine.idle_rpm;
+    }
+}
+
+void EngineFleet::stopEngines(const uint8_t* mask) {
+    for (size_t i = 0; i < current_rpm.size(); i++) {
+        if (mask && !mask[i]) continue;
+        engine_running[i] = 0;
+        current_rpm[i] = 0;
+        target_rpm[i] = 0;
+        throttle_position[i] = 0;
+    }
+}
+
+void EngineFleet::setInputs(const double* throttle, const double* brake_in, const int32_t* gear) {
+    for (size_t i = 0; i < current_rpm.size(); i++) {
+        if (throttle) applyThrottle(i, throttle[i]);
+        if (brake_in) brake[i] = std::max(0.0, std::min(1.0, brake_in[i]));
+        if (gear && gear[i] >= -1 && gear[i] <= 6) requested_gear[i] = gear[i];
+    }
+}
+
+// Same as EnginePhysics::setThrottle
+void EngineFleet::applyThrottle(size_t i, double throttle) {
+    throttle_position[i] = std::max(0.0, std::min(1.0, throttle));
+    if (engine_running[i]) {
+        target_rpm[i] = throttleTargetRPM(engine, current_gear[i], throttle_position[i]);
+    }
+}
+
+// Same as EnginePhysics::setGear
+void EngineFleet::applyGear(size_t i, int gear) {
+    if (!clutch_engaged[i] || is_shifting[i]) return;
+    
+    is_shifting[i] = 1;
+    shift_timer[i] = 0.2;
+    
+    int old_gear = current_gear[i];
+    current_gear[i] = gear;
+    
+    if (old_gear > 0 && gear > 0) {
+        double rpm_factor = transmission.gear_ratios[gear - 1] / transmission.gear_ratios[old_gear - 1];
+        current_rpm[i] *= rpm_factor;
+        target_rpm[i] = current_rpm[i];
+        
+        if (gear > old_gear) {
+            current_rpm[i] *= 0.95;
+        }
+        if (current_rpm[i] > engine.redline_rpm) {
+            current_rpm[i] = engine.redline_rpm;
+            target_rpm[i] = engine.redline_rpm;
+        }
+    } else if (gear == 0) {
+        target_rpm[i] = engine.idle_rpm;
+    }
+}
+
+// One tick of instance i: its held inputs, then the shared stepEngine kernel
+void EngineFleet::stepInstance(size_t i, double delta_time, const double* due) {
+    // Held inputs
+    if (requested_gear[i] != current_gear[i]) {
+        applyGear(i, requested_gear[i]);
+    }
+    if (brake[i] > 0 && current_speed[i] > 0) {
+        current_speed[i] = std::max(0.0, current_speed[i] - brake[i] * 50.0 * delta_time);
+    }
+    
+    const TickConfig config = {engine, forced_induction, torque_table, compiled, integration_mode};
+    TickState<uint8_t> state = {
+        current_rpm[i], target_rpm[i], shift_timer[i], is_shifting[i],
+        current_speed[i], current_torque[i], current_power[i], current_boost[i],
+        oil_temp[i], coolant_temp[i], intake_temp[i], fuel_level[i], fuel_consumption[i], engine_wear[i],
+        accumulated[i],
+        acceleration_start_time[i], quarter_mile_start_time[i], timing_0_100[i], timing_quarter_mile[i],
+        best_0_100_time[i], best_quarter_mile_time[i], total_distance[i], runtime[i],
+        fluctuation_counter[i], rng_state[i],
+        throttle_position[i], current_gear[i], clutch_engaged[i] != 0, engine_running[i] != 0,
+    };
+    stepEngine(config, state, delta_time, due);
+}
+
+void EngineFleet::stepRange(size_t begin, size_t end, double delta_time, int steps, const double* due) {
+    for (int s = 0; s < steps; s++) {
+        const double* step_due = due + s * SUBSYSTEM_COUNT;
+        for (size_t i = begin; i < end; i++) {
+            stepInstance(i, delta_time, step_due);
+        }
+    }
+}
+
+void EngineFleet::step(double delta_time, int steps) {
+    const size_t n = current_rpm.size();
+    if (n == 0 || steps <= 0) return;
+    
+    // Every instance steps in lockstep, so one schedule serves them all:
+    // work out which subsystems are due on each step up front
+    due.resize(static_cast<size_t>(steps) * SUBSYSTEM_COUNT);
+    for (int s = 0; s < steps; s++) {
+        schedule.advance(delta_time, &due[static_cast<size_t>(s) * SUBSYSTEM_COUNT]);
+    }
+    
+    // Instances are independent, so each thread runs all steps for its own
+    // contiguous slice with no synchronisation until every slice is done
+    const size_t min_per_thread = 256;
+    size_t threads = thread_count > 0 ? thread_count : std::max(1u, std::thread::hardware_concurrency());
+    threads = std::max<size_t>(1, std::min(threads, n / min_per_thread));
+    
+    if (threads == 1) {
+        stepRange(0, n, delta_time, steps, due.data());
+        return;
+    }
+    
+    if (workers.size() != threads - 1) {
+        startPool(threads - 1);
+    }
+    
+    size_t chunk = (n + threads - 1) / threads;
+    {
+        std::lock_guard<std::mutex> lock(pool_mutex);
+        job_delta_time = delta_time;
+        job_steps = steps;
+        job_chunk = chunk;
+        pool_pending = workers.size();
+        pool_generation++;
+    }
+    pool_wake.notify_all();
+    
+    stepRange(0, std::min(n, chunk), delta_time, steps, due.data());
+    
+    std::unique_lock<std::mutex> lock(pool_mutex);
+    pool_done.wait(lock, [&] { return pool_pending == 0; });
+}
+
+bool EngineFleet::copyField(int field, double* out) const {
+    const std::vector<double>* source = nullptr;
+    switch (field) {
+        case FLEET_RPM: source = &current_rpm; break;
+        case FLEET_TARGET_RPM: source = &target_rpm; break;
+        case FLEET_SPEED: source = &current_speed; break;
+        case FLEET_TORQUE: source = &current_torque; break;
+        case FLEET_POWER: source = &current_power; break;
+        case FLEET_BOOST: source = &current_boost; break;
+        case FLEET_THROTTLE: source = &throttle_position; break;
+        case FLEET_OIL_TEMP: source = &oil_temp; break;
+        case FLEET_COOLANT_TEMP: source = &coolant_temp; break;
+        case FLEET_INTAKE_TEMP: source = &intake_temp; break;
+        case FLEET_FUEL_LEVEL: source = &fuel_level; break;
+        case FLEET_FUEL_CONSUMPTION: source = &fuel_consumption; break;
+        case FLEET_ENGINE_WEAR: source = &engine_wear; break;
+        case FLEET_TOTAL_DISTANCE: source = &total_distance; break;
+        case FLEET_RUNTIME: source = &runtime; break;
+        default: return false;
+    }
+    std::copy(source->begin(), source->end(), out);
+    return true;
+}
+
+void EngineFleet::copyGears(int32_t* out) const {
+    std::copy(current_gear.begin(), current_gear.end(), out);
+}
+
+void EngineFleet::getState(EngineState* out) const {
+    for (size_t i = 0; i < current_rpm.size(); i++) {
+        EngineState& s = out[i];
+        s.rpm = current_rpm[i];
+        s.target_rpm = target_rpm[i];
+        s.speed = current_speed[i];
+        s.torque = current_torque[i];
+        s.power = current_power[i];
+        s.boost = current_boost[i];
+        s.throttle_position = throttle_position[i];
+        s.oil_temp = oil_temp[i];
+        s.coolant_temp = coolant_temp[i];
+        s.intake_temp = intake_temp[i];
+        s.fuel_level = fuel_level[i];
+        s.fuel_consumption = fuel_consumption[i];
+        s.engine_wear = engine_wear[i];
+        s.best_0_100_time = best_0_100_time[i];
+        s.best_quarter_mile_time = best_quarter_mile_time[i];
+        s.total_distance = total_distance[i];
+        s.runtime = runtime[i];
+        s.current_gear = current_gear[i];
+        s.clutch_engaged = clutch_engaged[i];
+        s.engine_running = engine_running[i];
+        s.is_shifting = is_shifting[i];
+    }
+}
@@ -5,6 +5,10 @@
 #include <string>
 #include <cmath>
 #include <algorithm>
+#include <cstdint>
+#include <thread>
+#include <mutex>
+#include <condition_variable>
 
 // Engine configuration structure
 struct EngineConfig {
@@ -45,6 +49,207 @@ struct ForcedInductionConfig {
     double spool_rate;          // Response rate for turbo
 };
 
+// Dense torque-multiplier table (normalised torque curve vs RPM), rebuilt
+// whenever the engine config or rev limiter changes. Covers 0 to 125% of
+// redline; lookups outside that range fall back to the analytic curve.
+struct TorqueTable {
+    static const int SIZE = 1024;
+    double rpm_max;
+    double inv_step;            // table cells per RPM
+    double inv_peak_rpm;        // 1 / peak_torque_rpm
+    double fall_slope;          // 0.6 / fall_rate, torque lost per peak-RPM past the peak
+    double values[SIZE + 1];
+    
+    void build(const EngineConfig& engine);
+    double curve(double rpm) const;
+    double lookup(double rpm) const;
+};
+
+// How the first-order lags (RPM, boost, temperatures, road speed) advance
+// each tick. Euler is the original update and needs rate * dt well below 1;
+// the exponential modes use the exact step x += (target - x) * (1 - exp(-rate * dt)),
+// which stays stable and converges to the same values at any timestep.
+enum IntegrationMode {
+    INTEGRATION_EULER = 0,
+    INTEGRATION_EXPONENTIAL = 1,        // std::expm1
+    INTEGRATION_EXPONENTIAL_FAST = 2    // polynomial exp approximation (<5e-8 relative error)
+};
+
+// Slow subsystems that can run below the physics tick rate
+enum Subsystem {
+    SUBSYSTEM_THERMAL = 0,      // oil, coolant and intake temperatures
+    SUBSYSTEM_WEAR = 1,         // engine wear
+    SUBSYSTEM_FUEL = 2,         // fuel consumption and tank level
+    SUBSYSTEM_COUNT
+};
+
+// Multi-rate schedule for the slow subsystems. Each one accumulates the
+// simulated time since it last ran and, once its interval has elapsed, runs
+// once over the whole accumulated span from the inputs its engine gathered
+// every tick (SubsystemAccumulator). An interval of 0 (the default) runs it
+// every tick, which is identical to single-rate stepping.
+struct SubsystemSchedule {
+    double interval[SUBSYSTEM_COUNT];   // seconds between runs
+    double pending[SUBSYSTEM_COUNT];    // simulated time since the last run
+    
+    void reset();
+    void setRate(int subsystem, double hz);     // hz <= 0 = every tick
+    // Advance by delta_time and fill due[] with the span each subsystem
+    // should integrate this tick (0 = not due)
+    void advance(double delta_time, double* due);
+};
+
+// Temperature channels of the thermal subsystem
+enum ThermalChannel {
+    THERMAL_OIL = 0,
+    THERMAL_COOLANT = 1,
+    THERMAL_INTAKE = 2,
+    THERMAL_CHANNEL_COUNT
+};
+
+// What one engine's slow subsystems have gathered since they last ran. Fuel
+// burn and wear are summed every tick, and each temperature lag sums its
+// rate * dt and rate * target * dt, so a subsystem at a reduced rate still
+// integrates every tick's inputs; only the tank, wear and lag updates wait
+// for its turn.
+struct SubsystemAccumulator {
+    double fuel;                                // sum of consumption (L/h) * dt
+    double wear;                                // sum of the per-tick wear increments
+    double heat_rate[THERMAL_CHANNEL_COUNT];    // sum of lag rate * dt
+    double heat_target[THERMAL_CHANNEL_COUNT];  // sum of lag rate * target temperature * dt
+    
+    void reset();
+};
+
+// Per-tick constants derived from the engine, transmission, forced induction
+// and vehicle configs. Rebuilt by every config setter so the step itself only
+// multiplies and adds. Per-gear arrays are indexed by |gear| (reverse uses 1).
+struct CompiledConfig {
+    static const int MAX_GEAR = 6;
+    double redline;                         // redline_rpm as double
+    double inv_redline;                     // 1 / redline_rpm
+    double rpm_wear_threshold;              // 90% of redline
+    double neutral_accel_rate;              // RPM response per second in neutral
+    double gear_accel_rate[MAX_GEAR + 1];   // RPM response in gear (mass and gear load)
+    double engine_braking[MAX_GEAR + 1];    // km/h/s of engine braking per RPM
+    double speed_per_rpm[MAX_GEAR + 1];     // km/h per engine RPM in each forward gear
+    double reverse_speed_per_rpm;
+    double fuel_per_rpm;                    // L/h per RPM before throttle, load and boost
+    double fuel_load[MAX_GEAR + 1];         // gear load factor on fuel consumption
+    double boost_fuel_gain;                 // fuel factor per PSI of boost
+    double boost_wear_threshold;            // 90% of max boost
+    double inv_turbo_span;                  // 1 / (redline - 2000), turbo spool range
+    
+    void build(const EngineConfig& engine, const TransmissionConfig& transmission,
+               const ForcedInductionConfig& forced_induction, const VehicleConfig& vehicle);
+};
+
+// Telemetry snapshot filled by EnginePhysics::getState in a single call.
+// Packed with fixed-width fields so it can be mirrored byte-for-byte by
+// ctypes.Structure (_pack_ = 1) and a NumPy structured dtype on the Python side.
+// Append new fields at the end only - the Python mirrors depend on this layout.
+#pragma pack(push, 1)
+struct EngineState {
+    double rpm;
+    double target_rpm;
+    double speed;               // km/h
+    double torque;              // Nm
+    double power;               // HP
+    double boost;               // PSI
+    double throttle_position;   // 0.0 to 1.0
+    double oil_temp;            // °C
+    double coolant_temp;        // °C
+    double intake_temp;         // °C
+    double fuel_level;          // Percentage (0-100)
+    double fuel_consumption;    // L/h
+    double engine_wear;         // Percentage (0-100)
+    double best_0_100_time;     // seconds
+    double best_quarter_mile_time; // seconds
+    double total_distance;      // km
+    double runtime;             // seconds
+    int32_t current_gear;       // -1=Reverse, 0=Neutral, 1-6=Gears
+    int32_t clutch_engaged;     // 0 or 1
+    int32_t engine_running;     // 0 or 1
+    int32_t is_shifting;        // 0 or 1
+};
+
+// Complete EnginePhysics state for checkpoint/restore: configuration, the
+// simulation state and the generator/scheduler state, so a restored engine
+// continues exactly like the original. Fixed size; the string fields of the
+// engine config are truncated to fit. Derived tables are rebuilt on load.
+struct EngineCheckpoint {
+    static const uint32_t MAGIC = 0x43474E45;     // "ENGC"
+    static const uint32_t VERSION = 2;
+    static const int MAX_GEARS = 8;
+    
+    uint32_t magic;
+    uint32_t version;
+    
+    // Engine config
+    char name[48];
+    char fuel_type[16];
+    double displacement;
+    int32_t cylinders;
+    int32_t idle_rpm;
+    int32_t redline_rpm;
+    double peak_torque;
+    int32_t peak_torque_rpm;
+    double peak_power;
+    int32_t peak_power_rpm;
+    double engine_inertia;
+    double fuel_base;
+    
+    // Transmission, forced induction and vehicle config
+    int32_t gear_count;
+    double gear_ratios[MAX_GEARS];
+    double final_drive;
+    double wheel_diameter;
+    int32_t forced_induction_type;
+    double max_boost;
+    double spool_rate;
+    double vehicle_mass;
+    double drivetrain_loss;
+    double drag_coefficient;
+    double rolling_resistance;
+    
+    // Simulation settings
+    int32_t integration_mode;
+    double subsystem_interval[SUBSYSTEM_COUNT];
+    double subsystem_pending[SUBSYSTEM_COUNT];
+    SubsystemAccumulator subsystem_accumulated;
+    
+    // Engine state
+    double current_rpm;
+    double target_rpm;
+    double throttle_position;
+    int32_t current_gear;
+    uint8_t clutch_engaged;
+    uint8_t engine_running;
+    uint8_t is_shifting;
+    double shift_timer;
+    double current_speed;
+    double current_torque;
+    double current_power;
+    double current_boost;
+    double oil_temp;
+    double coolant_temp;
+    double intake_temp;
+    double fuel_level;
+    double fuel_consumption;
+    double engine_wear;
+    double acceleration_start_time;
+    double quarter_mile_start_time;
+    uint8_t timing_0_100;
+    uint8_t timing_quarter_mile;
+    double best_0_100_time;
+    double best_quarter_mile_time;
+    double total_distance;
+    double runtime;
+    uint32_t fluctuation_counter;
+    uint64_t rng_state;
+};
+#pragma pack(pop)
+
 class EnginePhysics {
 private:
     // Configuration
@@ -52,6 +257,11 @@ private:
     TransmissionConfig transmission;
     ForcedInductionConfig forced_induction;
     VehicleConfig vehicle;
+    TorqueTable torque_table;   // Derived from `engine`, see TorqueTable
+    CompiledConfig compiled;    // Derived from all of the above, see CompiledConfig
+    int integration_mode;       // IntegrationMode
+    SubsystemSchedule schedule; // Rates of the slow subsystems
+    SubsystemAccumulator accumulated;   // Their inputs since they last ran
     
     // Engine state
     double current_rpm;
@@ -91,13 +301,15 @@ private:
     double total_distance;      // km
     double runtime;             // seconds
     
+    // Idle fluctuation (per instance, so engines on different threads share nothing)
+    uint32_t fluctuation_counter;
+    uint64_t rng_state;
+    
     // Internal physics calculations
     double calculateTorqueAtRPM(double rpm);
     double calculatePowerAtRPM(double rpm);
-    double calculateFuelConsumption();
-    void updateTemperatures(double delta_time);
-    void updateEngineWear(double delta_time);
-    void updateBoost(double delta_time);
+    void applyBrake(double brake, double delta_time);
+    void compileConfig();
     
 public:
     EnginePhysics();
@@ -119,10 +331,23 @@ public:
     void setForcedInduction(const ForcedInductionConfig& config);
     void setRevLimiter(int rpm);
     void setBoostPressure(double psi);
+    void setIntegrationMode(int mode);
+    int getIntegrationMode() const { return integration_mode; }
+    void setSubsystemRate(int subsystem, double hz);
+    void setSeed(uint64_t seed);    // Same stream as instance 0 of an EngineFleet with this seed
     
     // Main simulation update
     void update(double delta_time);
     
+    // Batched fast-forward: runs n update() ticks inside the library.
+    // Optional per-step schedules (nullptr = leave unchanged):
+    //   throttle is applied when the commanded value changes (like a key event),
+    //   gear is requested until engaged (shifts in progress are not interrupted),
+    //   brake is applied every step it is non-zero, scaled by delta_time.
+    // If out is non-null it receives one EngineState per step (n entries).
+    int stepN(int n, double delta_time, const double* throttle, const double* brake,
+              const int* gear, EngineState* out);
+    
     // State getters
     double getRPM() const { return current_rpm; }
     double getSpeed() const { return current_speed; }
@@ -150,6 +375,15 @@ public:
     double getTotalDistance() const { return total_distance; }
     double getRuntime() const { return runtime; }
     
+    // Fill a complete telemetry snapshot in one call
+    void getState(EngineState& out) const;
+    
+    // Checkpoint/restore of the complete state (config included).
+    // loadState returns false, leaving the engine untouched, if the
+    // checkpoint has the wrong magic or version.
+    void saveState(EngineCheckpoint& out) const;
+    bool loadState(const EngineCheckpoint& in);
+    
     // Engine presets
     static EngineConfig getInline4Turbo();
     static EngineConfig getV6NA();
@@ -165,4 +399,146 @@ public:
     void resetSession();
 };
 
+// Field identifiers for EngineFleet::copyField
+enum EngineFleetField {
+    FLEET_RPM = 0,
+    FLEET_TARGET_RPM,
+    FLEET_SPEED,
+    FLEET_TORQUE,
+    FLEET_POWER,
+    FLEET_BOOST,
+    FLEET_THROTTLE,
+    FLEET_OIL_TEMP,
+    FLEET_COOLANT_TEMP,
+    FLEET_INTAKE_TEMP,
+    FLEET_FUEL_LEVEL,
+    FLEET_FUEL_CONSUMPTION,
+    FLEET_ENGINE_WEAR,
+    FLEET_TOTAL_DISTANCE,
+    FLEET_RUNTIME,
+    FLEET_FIELD_COUNT
+};
+
+// Struct-of-arrays simulator for many engines sharing one configuration.
+// Every instance is stepped with the same per-tick kernel as EnginePhysics::update;
+// state lives in contiguous per-field arrays and the work is split across
+// threads in contiguous index ranges (instances are fully independent).
+class EngineFleet {
+private:
+    // Shared configuration
+    EngineConfig engine;
+    TransmissionConfig transmission;
+    TorqueTable torque_table;
+    ForcedInductionConfig forced_induction;
+    VehicleConfig vehicle;
+    CompiledConfig compiled;
+    int integration_mode;
+    SubsystemSchedule schedule;
+    int thread_count;
+    
+    // Held inputs
+    std::vector<double> brake;
+    std::vector<int32_t> requested_gear;
+    
+    // Engine state (one entry per instance)
+    std::vector<double> current_rpm;
+    std::vector<double> target_rpm;
+    std::vector<double> throttle_position;
+    std::vector<int32_t> current_gear;
+    std::vector<uint8_t> clutch_engaged;
+    std::vector<uint8_t> engine_running;
+    std::vector<double> shift_timer;
+    std::vector<uint8_t> is_shifting;
+    
+    // Performance metrics
+    std::vector<double> current_speed;
+    std::vector<double> current_torque;
+    std::vector<double> current_power;
+    std::vector<double> current_boost;
+    
+    // Temperatures, fuel and wear
+    std::vector<double> oil_temp;
+    std::vector<double> coolant_temp;
+    std::vector<double> intake_temp;
+    std::vector<double> fuel_level;
+    std::vector<double> fuel_consumption;
+    std::vector<double> engine_wear;
+    std::vector<SubsystemAccumulator> accumulated;  // slow-subsystem inputs since they last ran
+    
+    // Performance tracking
+    std::vector<double> acceleration_start_time;
+    std::vector<double> quarter_mile_start_time;
+    std::vector<uint8_t> timing_0_100;
+    std::vector<uint8_t> timing_quarter_mile;
+    std::vector<double> best_0_100_time;
+    std::vector<double> best_quarter_mile_time;
+    std::vector<double> total_distance;
+    std::vector<double> runtime;
+    
+    // Idle fluctuation (per instance, so threads never share state)
+    std::vector<uint32_t> fluctuation_counter;
+    std::vector<uint64_t> rng_state;
+    
+    // Subsystems due on each step of the current step() call, reused across calls
+    std::vector<double> due;
+    
+    // Persistent worker pool: started on the first threaded step(), restarted
+    // when the thread count changes and joined in the destructor. Worker t
+    // runs slice t of each job; the calling thread runs slice 0.
+    std::vector<std::thread> workers;
+    std::mutex pool_mutex;
+    std::condition_variable pool_wake;
+    std::condition_variable pool_done;
+    uint64_t pool_generation;
+    size_t pool_pending;
+    bool pool_stop;
+    double job_delta_time;
+    int job_steps;
+    size_t job_chunk;
+    
+    void applyThrottle(size_t i, double throttle);
+    void applyGear(size_t i, int gear);
+    void stepInstance(size_t i, double delta_time, const double* due);
+    void stepRange(size_t begin, size_t end, double delta_time, int steps, const double* due);
+    void workerLoop(size_t slice);
+    void startPool(size_t count);
+    void stopPool();
+    void compileConfig();
+    
+public:
+    explicit EngineFleet(int count);
+    ~EngineFleet();
+    EngineFleet(const EngineFleet&) = delete;
+    EngineFleet& operator=(const EngineFleet&) = delete;
+    
+    int size() const { return static_cast<int>(current_rpm.size()); }
+    void setThreadCount(int threads);   // 0 = one per hardware thread
+    void setSeed(uint64_t seed);
+    
+    // Fleet-wide configuration
+    void setEngineConfig(const EngineConfig& config);
+    void setTransmissionConfig(const TransmissionConfig& config);
+    void setForcedInduction(const ForcedInductionConfig& config);
+    void setRevLimiter(int rpm);
+    void setBoostPressure(double psi);
+    void setIntegrationMode(int mode);
+    void setSubsystemRate(int subsystem, double hz);
+    
+    // Control (mask may be nullptr = every instance)
+    void startEngines(const uint8_t* mask);
+    void stopEngines(const uint8_t* mask);
+    // Per-instance inputs, each array has size() entries or is nullptr.
+    // Throttle is applied immediately, gear is requested until it engages,
+    // brake is held and applied every step scaled by delta_time.
+    void setInputs(const double* throttle, const double* brake, const int32_t* gear);
+    
+    // Advance every instance by `steps` ticks of delta_time
+    void step(double delta_time, int steps = 1);
+    
+    // State readout
+    bool copyField(int field, double* out) const;
+    void copyGears(int32_t* out) const;
+    void getState(EngineState* out) const;
+};
+
 #endif // ENGINE_PHYSICS_H
\ No newline at end of file
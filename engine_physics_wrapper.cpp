@@ -4,6 +4,7 @@
  */
 
 #include "engine_physics.h"
+#include <cstring>
 
 #ifdef _WIN32
     #define EXPORT __declspec(dllexport)
@@ -95,6 +96,33 @@ extern "C" {
         }
     }
     
+    // mode: 0 = Euler, 1 = exponential, 2 = exponential with fast exp (see IntegrationMode)
+    EXPORT void EnginePhysics_setIntegrationMode(void* engine, int mode) {
+        if (engine) {
+            static_cast<EnginePhysics*>(engine)->setIntegrationMode(mode);
+        }
+    }
+    
+    EXPORT int EnginePhysics_getIntegrationMode(void* engine) {
+        if (engine) {
+            return static_cast<EnginePhysics*>(engine)->getIntegrationMode();
+        }
+        return 0;
+    }
+    
+    EXPORT void EnginePhysics_setSeed(void* engine, uint64_t seed) {
+        if (engine) {
+            static_cast<EnginePhysics*>(engine)->setSeed(seed);
+        }
+    }
+    
+    // subsystem: 0 = thermal, 1 = wear, 2 = fuel (see Subsystem); hz <= 0 = every tick
+    EXPORT void EnginePhysics_setSubsystemRate(void* engine, int subsystem, double hz) {
+        if (engine) {
+            static_cast<EnginePhysics*>(engine)->setSubsystemRate(subsystem, hz);
+        }
+    }
+    
     // ============================================================================
     // Simulation Update
     // ============================================================================
@@ -105,6 +133,15 @@ extern "C" {
         }
     }
     
+    EXPORT int EnginePhysics_stepN(void* engine, int n, double delta_time,
+                                   const double* throttle, const double* brake,
+                                   const int* gear, EngineState* out) {
+        if (engine) {
+            return static_cast<EnginePhysics*>(engine)->stepN(n, delta_time, throttle, brake, gear, out);
+        }
+        return 0;
+    }
+    
     // ============================================================================
     // State Getters
     // ============================================================================
@@ -240,6 +277,57 @@ extern "C" {
         return 0.0;
     }
     
+    // ============================================================================
+    // Telemetry Snapshot
+    // ============================================================================
+    
+    EXPORT int EnginePhysics_getStateSize() {
+        return static_cast<int>(sizeof(EngineState));
+    }
+    
+    EXPORT void EnginePhysics_getState(void* engine, EngineState* out) {
+        if (engine && out) {
+            static_cast<EnginePhysics*>(engine)->getState(*out);
+        }
+    }
+    
+    // ============================================================================
+    // Checkpoint / Restore
+    // ============================================================================
+    
+    EXPORT int EnginePhysics_getCheckpointSize() {
+        return static_cast<int>(sizeof(EngineCheckpoint));
+    }
+    
+    // Returns bytes written, or 0 if size is too small
+    EXPORT int EnginePhysics_saveState(void* engine, void* buffer, int size) {
+        if (!engine || !buffer || size < static_cast<int>(sizeof(EngineCheckpoint))) {
+            return 0;
+        }
+        EngineCheckpoint checkpoint;
+        static_cast<EnginePhysics*>(engine)->saveState(checkpoint);
+        std::memcpy(buffer, &checkpoint, sizeof(checkpoint));
+        return static_cast<int>(sizeof(checkpoint));
+    }
+    
+    // Returns 1 on success, 0 if the blob is the wrong size, magic or version
+    EXPORT int EnginePhysics_loadState(void* engine, const void* buffer, int size) {
+        if (!engine || !buffer || size != static_cast<int>(sizeof(EngineCheckpoint))) {
+            return 0;
+        }
+        EngineCheckpoint checkpoint;
+        std::memcpy(&checkpoint, buffer, sizeof(checkpoint));
+        return static_cast<EnginePhysics*>(engine)->loadState(checkpoint) ? 1 : 0;
+    }
+    
+    // Independent copy of an engine (same state, config and RNG position)
+    EXPORT void* EnginePhysics_clone(void* engine) {
+        if (engine) {
+            return new EnginePhysics(*static_cast<EnginePhysics*>(engine));
+        }
+        return nullptr;
+    }
+    
     // ============================================================================
     // Session Management
     // ============================================================================
@@ -249,4 +337,105 @@ extern "C" {
             static_cast<EnginePhysics*>(engine)->resetSession();
         }
     }
+    
+    // ============================================================================
+    // Fleet Simulation (struct-of-arrays, multi-threaded)
+    // ============================================================================
+    
+    EXPORT void* EngineFleet_new(int count) {
+        return new EngineFleet(count);
+    }
+    
+    EXPORT void EngineFleet_delete(void* fleet) {
+        if (fleet) {
+            delete static_cast<EngineFleet*>(fleet);
+        }
+    }
+    
+    EXPORT int EngineFleet_size(void* fleet) {
+        if (fleet) {
+            return static_cast<EngineFleet*>(fleet)->size();
+        }
+        return 0;
+    }
+    
+    EXPORT void EngineFleet_setThreadCount(void* fleet, int threads) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setThreadCount(threads);
+        }
+    }
+    
+    EXPORT void EngineFleet_setSeed(void* fleet, uint64_t seed) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setSeed(seed);
+        }
+    }
+    
+    EXPORT void EngineFleet_setRevLimiter(void* fleet, int rpm) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setRevLimiter(rpm);
+        }
+    }
+    
+    EXPORT void EngineFleet_setBoostPressure(void* fleet, double psi) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setBoostPressure(psi);
+        }
+    }
+    
+    EXPORT void EngineFleet_setIntegrationMode(void* fleet, int mode) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setIntegrationMode(mode);
+        }
+    }
+    
+    EXPORT void EngineFleet_setSubsystemRate(void* fleet, int subsystem, double hz) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setSubsystemRate(subsystem, hz);
+        }
+    }
+    
+    EXPORT void EngineFleet_startEngines(void* fleet, const uint8_t* mask) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->startEngines(mask);
+        }
+    }
+    
+    EXPORT void EngineFleet_stopEngines(void* fleet, const uint8_t* mask) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->stopEngines(mask);
+        }
+    }
+    
+    EXPORT void EngineFleet_setInputs(void* fleet, const double* throttle,
+                                      const double* brake, const int32_t* gear) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->setInputs(throttle, brake, gear);
+        }
+    }
+    
+    EXPORT void EngineFleet_step(void* fleet, double delta_time, int steps) {
+        if (fleet) {
+            static_cast<EngineFleet*>(fleet)->step(delta_time, steps);
+        }
+    }
+    
+    EXPORT int EngineFleet_copyField(void* fleet, int field, double* out) {
+        if (fleet && out) {
+            return static_cast<EngineFleet*>(fleet)->copyField(field, out) ? 1 : 0;
+        }
+        return 0;
+    }
+    
+    EXPORT void EngineFleet_copyGears(void* fleet, int32_t* out) {
+        if (fleet && out) {
+            static_cast<EngineFleet*>(fleet)->copyGears(out);
+        }
+    }
+    
+    EXPORT void EngineFleet_getState(void* fleet, EngineState* out) {
+        if (fleet && out) {
+            static_cast<EngineFleet*>(fleet)->getState(out);
+        }
+    }
 }
\ No newline at end of file
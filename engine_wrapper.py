@@ -2,221 +2,500 @@
 Python wrapper for C++ Engine Physics using ctypes
 """
 import ctypes
+import functools
+import math
 import os
-from ctypes import c_double, c_int, c_bool, c_void_p, POINTER
+import random
+import struct
+from ctypes import c_double
 from pathlib import Path
 
+import numpy as np
+
+from engine_bindings import EngineState, load_library
+
+
+# Same layout as a NumPy structured dtype (packed, no alignment padding)
+ENGINE_STATE_DTYPE = np.dtype([
+    (name, np.float64 if ctype is c_double else np.int32)
+    for name, ctype in EngineState._fields_
+])
+assert ENGINE_STATE_DTYPE.itemsize == ctypes.sizeof(EngineState)
+
+# First-order lag integration modes (IntegrationMode in engine_physics.h).
+# 'euler' is the original per-tick update; the exponential modes are exact
+# for any timestep, so long headless runs can take much larger steps.
+INTEGRATION_MODES = {'euler': 0, 'exponential': 1, 'fast': 2}
+
+# Slow subsystems that can run below the physics tick rate (Subsystem in engine_physics.h)
+SUBSYSTEMS = {'thermal': 0, 'wear': 1, 'fuel': 2}
+
+# Temperature lags of the thermal subsystem (ThermalChannel in engine_physics.h)
+THERMAL_CHANNELS = {'oil': 0, 'coolant': 1, 'intake': 2}
+
+
+def integration_mode_id(mode):
+    """Integration mode number from a name in INTEGRATION_MODES or a number"""
+    if isinstance(mode, str):
+        if mode not in INTEGRATION_MODES:
+            raise ValueError(f"unknown integration mode {mode!r}, expected one of {', '.join(INTEGRATION_MODES)}")
+        return INTEGRATION_MODES[mode]
+    if mode not in INTEGRATION_MODES.values():
+        raise ValueError(f"unknown integration mode {mode!r}")
+    return int(mode)
+
 # Determine the path to the compiled DLL
 current_dir = Path(__file__).parent
 dll_path = current_dir / "engine_physics.dll"
 
 try:
-    engine_lib = ctypes.CDLL(str(dll_path))
+    library = load_library(dll_path)
 except OSError:
     print(f"Warning: Could not load {dll_path}")
     print("Make sure to compile engine_physics.cpp to engine_physics.dll")
+    library = None
+
+# Function prototypes come from engine_bindings.PROTOTYPES; engine_lib is the
+# prototyped CDLL for the fleet and checkpoint call sites
+if library:
+    engine_lib = library.dll
+    HAS_INTEGRATION_MODE = library.has_integration_mode
+    HAS_SUBSYSTEM_RATES = library.has_subsystem_rates
+    HAS_SEED = library.has_seed
+    HAS_CHECKPOINT = library.has_checkpoint
+    CHECKPOINT_SIZE = library.checkpoint_size
+    HAS_STATE_SNAPSHOT = library.has_state_snapshot
+    HAS_STEP_N = library.has_step_n
+    HAS_FLEET = library.has_fleet
+else:
     engine_lib = None
+    HAS_INTEGRATION_MODE = False
+    HAS_SUBSYSTEM_RATES = False
+    HAS_SEED = False
+    HAS_CHECKPOINT = False
+    HAS_STATE_SNAPSHOT = False
+    HAS_STEP_N = False
+    HAS_FLEET = False
 
-# Define the return types and argument types for C++ functions
-if engine_lib:
-    # Constructor and destructor
-    engine_lib.EnginePhysics_new.restype = c_void_p
-    engine_lib.EnginePhysics_delete.argtypes = [c_void_p]
-    
-    # Core control methods
-    engine_lib.EnginePhysics_startEngine.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_stopEngine.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_setThrottle.argtypes = [c_void_p, c_double]
-    engine_lib.EnginePhysics_setBrake.argtypes = [c_void_p, c_double]
-    engine_lib.EnginePhysics_shiftUp.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_shiftDown.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_toggleClutch.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_setGear.argtypes = [c_void_p, c_int]
-    
-    # Configuration methods
-    engine_lib.EnginePhysics_setRevLimiter.argtypes = [c_void_p, c_int]
-    engine_lib.EnginePhysics_setBoostPressure.argtypes = [c_void_p, c_double]
-    
-    # Update simulation
-    engine_lib.EnginePhysics_update.argtypes = [c_void_p, c_double]
-    
-    # Getters (all return double or int)
-    engine_lib.EnginePhysics_getRPM.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getRPM.restype = c_double
-    
-    engine_lib.EnginePhysics_getSpeed.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getSpeed.restype = c_double
-    
-    engine_lib.EnginePhysics_getTorque.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getTorque.restype = c_double
-    
-    engine_lib.EnginePhysics_getPower.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getPower.restype = c_double
-    
-    engine_lib.EnginePhysics_getBoost.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getBoost.restype = c_double
-    
-    engine_lib.EnginePhysics_getCurrentGear.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getCurrentGear.restype = c_int
-    
-    engine_lib.EnginePhysics_isEngineRunning.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_isEngineRunning.restype = c_bool
-    
-    engine_lib.EnginePhysics_getOilTemp.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getOilTemp.restype = c_double
-    
-    engine_lib.EnginePhysics_getCoolantTemp.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getCoolantTemp.restype = c_double
-    
-    engine_lib.EnginePhysics_getIntakeTemp.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getIntakeTemp.restype = c_double
-    
-    engine_lib.EnginePhysics_getFuelLevel.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getFuelLevel.restype = c_double
-    
-    engine_lib.EnginePhysics_getFuelConsumption.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getFuelConsumption.restype = c_double
-    
-    engine_lib.EnginePhysics_getEngineWear.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getEngineWear.restype = c_double
-    
-    engine_lib.EnginePhysics_getBest0To100Time.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getBest0To100Time.restype = c_double
-    
-    engine_lib.EnginePhysics_getTotalDistance.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getTotalDistance.restype = c_double
-    
-    engine_lib.EnginePhysics_getRuntime.argtypes = [c_void_p]
-    engine_lib.EnginePhysics_getRuntime.restype = c_double
+
+def _step_schedule(values, n, dtype):
+    """Normalise a scalar or per-step command array for step_n (None = unused)"""
+    if values is None:
+        return None
+    return np.ascontiguousarray(np.broadcast_to(np.asarray(values, dtype=dtype), (n,)))
+
+
+def _step_output(n, out, record):
+    """Telemetry buffer for step_n: caller-owned `out`, a new array, or None"""
+    if out is not None:
+        if out.dtype != ENGINE_STATE_DTYPE or len(out) < n or not out.flags.c_contiguous:
+            raise ValueError("out must be a contiguous ENGINE_STATE_DTYPE array with at least n entries")
+        return out
+    return np.empty(n, dtype=ENGINE_STATE_DTYPE) if record else None
+
+
+class _SubsystemSchedule:
+    """Python mirror of SubsystemSchedule (engine_physics.h) for the fallback physics"""
     
-    engine_lib.EnginePhysics_resetSession.argtypes = [c_void_p]
+    def __init__(self):
+        self.interval = [0.0] * len(SUBSYSTEMS)   # seconds between runs
+        self.pending = [0.0] * len(SUBSYSTEMS)    # simulated time since the last run
+    
+    def set_rate(self, subsystem, hz):
+        self.interval[SUBSYSTEMS[subsystem]] = 1.0 / hz if hz > 0 else 0.0
+    
+    def advance(self, delta_time):
+        """Span each subsystem integrates this tick, in SUBSYSTEMS order (0 = not due)"""
+        due = []
+        for s, interval in enumerate(self.interval):
+            pending = self.pending[s] + delta_time
+            # Same tolerance as the C++ schedule for whole-tick intervals
+            if pending >= interval * (1.0 - 1e-9):
+                due.append(pending)
+                pending = 0.0
+            else:
+                due.append(0.0)
+            self.pending[s] = pending
+        return due
+
+
+class _SubsystemAccumulator:
+    """
+    Python mirror of SubsystemAccumulator (engine_physics.h): the fuel burn
+    and thermal lag inputs gathered every tick since the subsystems last ran
+    (the Python physics has no wear model). Plain floats for one engine, one
+    array entry per engine for a batch.
+    """
+    
+    def __init__(self, count=None):
+        zero = (lambda: 0.0) if count is None else (lambda: np.zeros(count))
+        self.fuel = zero()                                          # sum of consumption (L/h) * dt
+        self.heat_rate = [zero() for _ in THERMAL_CHANNELS]         # sum of lag rate * dt
+        self.heat_target = [zero() for _ in THERMAL_CHANNELS]       # sum of lag rate * target * dt
+    
+    def values(self):
+        """Flat list for a checkpoint (single engine)"""
+        return [self.fuel, *self.heat_rate, *self.heat_target]
+    
+    def set_values(self, values):
+        channels = len(THERMAL_CHANNELS)
+        self.fuel = values[0]
+        self.heat_rate = list(values[1:1 + channels])
+        self.heat_target = list(values[1 + channels:1 + 2 * channels])
 
 
 class EnginePhysics:
     """Python wrapper for C++ EnginePhysics class"""
     
-    def __init__(self):
+    def __init__(self, seed=None):
         if engine_lib is None:
             raise RuntimeError("Engine library not loaded. Using pure Python implementation.")
         try:
             self.engine = engine_lib.EnginePhysics_new()
         except Exception as e:
             raise RuntimeError(f"Failed to create engine instance: {e}")
+        self._bind()
+        if seed is not None:
+            self.set_seed(seed)
+    
+    def _bind(self):
+        # Library calls with this engine's handle pre-bound (engine_bindings.BoundEngine);
+        # tight loops can hoist e.g. `update = engine.calls.update` to skip the method frame
+        self.calls = library.bind(self.engine)
+        
+        # Persistent snapshot buffer, refilled in place by get_state()
+        self._state = EngineState()
+        self._state_ref = ctypes.byref(self._state)
+        self._fill_state = functools.partial(self.calls.getState, self._state_ref) if HAS_STATE_SNAPSHOT else None
+        # Zero-copy NumPy view of the same memory (shape (1,), ENGINE_STATE_DTYPE)
+        self.state_view = np.frombuffer(self._state, dtype=ENGINE_STATE_DTYPE)
     
     def __del__(self):
-        if hasattr(self, 'engine') and engine_lib:
-            engine_lib.EnginePhysics_delete(self.engine)
+        if getattr(self, 'calls', None) is not None:
+            self.calls.delete()
     
     # Control methods
     def start_engine(self):
-        engine_lib.EnginePhysics_startEngine(self.engine)
+        self.calls.startEngine()
     
     def stop_engine(self):
-        engine_lib.EnginePhysics_stopEngine(self.engine)
+        self.calls.stopEngine()
     
     def set_throttle(self, throttle):
-        engine_lib.EnginePhysics_setThrottle(self.engine, c_double(throttle))
+        self.calls.setThrottle(throttle)
     
     def set_brake(self, brake):
-        engine_lib.EnginePhysics_setBrake(self.engine, c_double(brake))
+        self.calls.setBrake(brake)
     
     def shift_up(self):
-        engine_lib.EnginePhysics_shiftUp(self.engine)
+        self.calls.shiftUp()
     
     def shift_down(self):
-        engine_lib.EnginePhysics_shiftDown(self.engine)
+        self.calls.shiftDown()
     
     def toggle_clutch(self):
-        engine_lib.EnginePhysics_toggleClutch(self.engine)
+        self.calls.toggleClutch()
     
     def set_gear(self, gear):
-        engine_lib.EnginePhysics_setGear(self.engine, c_int(gear))
+        self.calls.setGear(int(gear))
     
     # Configuration
     def set_rev_limiter(self, rpm):
-        engine_lib.EnginePhysics_setRevLimiter(self.engine, c_int(rpm))
+        self.calls.setRevLimiter(int(rpm))
     
     def set_boost_pressure(self, psi):
-        engine_lib.EnginePhysics_setBoostPressure(self.engine, c_double(psi))
+        self.calls.setBoostPressure(psi)
+    
+    def set_integration_mode(self, mode):
+        """Select how the lags integrate: 'euler', 'exponential' or 'fast' (see INTEGRATION_MODES)"""
+        if not HAS_INTEGRATION_MODE:
+            raise RuntimeError("EnginePhysics_setIntegrationMode not available, rebuild engine_physics.dll")
+        self.calls.setIntegrationMode(integration_mode_id(mode))
+    
+    @property
+    def integration_mode(self):
+        return self.calls.getIntegrationMode() if HAS_INTEGRATION_MODE else 0
+    
+    # Checkpoint / restore
+    def save_state(self):
+        """Complete engine state (config, simulation, RNG) as a fixed-size bytes blob"""
+        if not HAS_CHECKPOINT:
+            raise RuntimeError("EnginePhysics_saveState not available, rebuild engine_physics.dll")
+        buffer = ctypes.create_string_buffer(CHECKPOINT_SIZE)
+        self.calls.saveState(buffer, CHECKPOINT_SIZE)
+        return buffer.raw
+    
+    def load_state(self, blob):
+        """Restore a save_state() blob; the engine continues exactly as the saved one would"""
+        if not HAS_CHECKPOINT:
+            raise RuntimeError("EnginePhysics_loadState not available, rebuild engine_physics.dll")
+        if not self.calls.loadState(blob, len(blob)):
+            raise ValueError("not a checkpoint from this version of engine_physics.dll")
+    
+    def clone(self):
+        """Independent copy of this engine, e.g. to fork what-if runs from a warm state"""
+        if not HAS_CHECKPOINT:
+            raise RuntimeError("EnginePhysics_clone not available, rebuild engine_physics.dll")
+        twin = EnginePhysics.__new__(EnginePhysics)
+        twin.engine = self.calls.clone()
+        twin._bind()
+        return twin
+    
+    def set_seed(self, seed):
+        """Reseed this instance's idle-jitter generator (same stream as EngineFleet instance 0)"""
+        if not HAS_SEED:
+            raise RuntimeError("EnginePhysics_setSeed not available, rebuild engine_physics.dll")
+        self.calls.setSeed(seed)
+    
+    def set_subsystem_rate(self, subsystem, hz):
+        """Run 'thermal', 'wear' or 'fuel' at hz instead of every tick (hz <= 0 = every tick)"""
+        if not HAS_SUBSYSTEM_RATES:
+            raise RuntimeError("EnginePhysics_setSubsystemRate not available, rebuild engine_physics.dll")
+        self.calls.setSubsystemRate(SUBSYSTEMS[subsystem], float(hz))
     
     # Simulation
     def update(self, delta_time):
-        engine_lib.EnginePhysics_update(self.engine, c_double(delta_time))
+        self.calls.update(delta_time)
+    
+    def step_n(self, n, delta_time, throttle=None, brake=None, gear=None, out=None, record=True):
+        """
+        Advance n fixed ticks in a single library call.
+        
+        throttle/brake/gear are scalars or length-n arrays (None leaves the
+        input alone). Returns the per-step ENGINE_STATE_DTYPE telemetry, or
+        None when record=False and no out buffer is given.
+        """
+        if not HAS_STEP_N:
+            raise RuntimeError("EnginePhysics_stepN not available, rebuild engine_physics.dll")
+        throttle = _step_schedule(throttle, n, np.float64)
+        brake = _step_schedule(brake, n, np.float64)
+        gear = _step_schedule(gear, n, np.int32)
+        out = _step_output(n, out, record)
+        self.calls.stepN(
+            n, delta_time,
+            None if throttle is None else throttle.ctypes.data,
+            None if brake is None else brake.ctypes.data,
+            None if gear is None else gear.ctypes.data,
+            None if out is None else out.ctypes.data)
+        return out
     
     # Getters
     @property
     def rpm(self):
-        return engine_lib.EnginePhysics_getRPM(self.engine)
+        return self.calls.getRPM()
     
     @property
     def speed(self):
-        return engine_lib.EnginePhysics_getSpeed(self.engine)
+        return self.calls.getSpeed()
     
     @property
     def torque(self):
-        return engine_lib.EnginePhysics_getTorque(self.engine)
+        return self.calls.getTorque()
     
     @property
     def power(self):
-        return engine_lib.EnginePhysics_getPower(self.engine)
+        return self.calls.getPower()
     
     @property
     def boost(self):
-        return engine_lib.EnginePhysics_getBoost(self.engine)
+        return self.calls.getBoost()
     
     @property
     def current_gear(self):
-        return engine_lib.EnginePhysics_getCurrentGear(self.engine)
+        return self.calls.getCurrentGear()
     
     @property
     def is_running(self):
-        return engine_lib.EnginePhysics_isEngineRunning(self.engine)
+        return self.calls.isEngineRunning()
+    
+    @property
+    def throttle_position(self):
+        return self.calls.getThrottlePosition()
     
     @property
     def oil_temp(self):
-        return engine_lib.EnginePhysics_getOilTemp(self.engine)
+        return self.calls.getOilTemp()
     
     @property
     def coolant_temp(self):
-        return engine_lib.EnginePhysics_getCoolantTemp(self.engine)
+        return self.calls.getCoolantTemp()
     
     @property
     def intake_temp(self):
-        return engine_lib.EnginePhysics_getIntakeTemp(self.engine)
+        return self.calls.getIntakeTemp()
     
     @property
     def fuel_level(self):
-        return engine_lib.EnginePhysics_getFuelLevel(self.engine)
+        return self.calls.getFuelLevel()
     
     @property
     def fuel_consumption(self):
-        return engine_lib.EnginePhysics_getFuelConsumption(self.engine)
+        return self.calls.getFuelConsumption()
     
     @property
     def engine_wear(self):
-        return engine_lib.EnginePhysics_getEngineWear(self.engine)
+        return self.calls.getEngineWear()
     
     @property
     def best_0_100_time(self):
-        return engine_lib.EnginePhysics_getBest0To100Time(self.engine)
+        return self.calls.getBest0To100Time()
     
     @property
     def total_distance(self):
-        return engine_lib.EnginePhysics_getTotalDistance(self.engine)
+        return self.calls.getTotalDistance()
     
     @property
     def runtime(self):
-        return engine_lib.EnginePhysics_getRuntime(self.engine)
+        return self.calls.getRuntime()
+    
+    def get_state(self):
+        """Refresh and return the persistent EngineState snapshot with one call"""
+        if self._fill_state is not None:
+            self._fill_state()
+        else:
+            fill_state_from_getters(self, self._state)
+        return self._state
     
     def reset_session(self):
-        engine_lib.EnginePhysics_resetSession(self.engine)
+        self.calls.resetSession()
+
+
+# Column order of EngineFleetField (engine_physics.h)
+FLEET_FIELDS = ('rpm', 'target_rpm', 'speed', 'torque', 'power', 'boost',
+                'throttle_position', 'oil_temp', 'coolant_temp', 'intake_temp',
+                'fuel_level', 'fuel_consumption', 'engine_wear', 'total_distance',
+                'runtime')
+
+
+class EngineFleet:
+    """
+    Python wrapper for the C++ EngineFleet struct-of-arrays simulator.
+    
+    All instances share one engine configuration and are stepped natively,
+    split across `threads` worker threads (0 = one per hardware thread).
+    """
+    
+    def __init__(self, count, threads=0, seed=None):
+        if not HAS_FLEET:
+            raise RuntimeError("EngineFleet not available, rebuild engine_physics.dll")
+        self.count = int(count)
+        self.fleet = engine_lib.EngineFleet_new(self.count)
+        engine_lib.EngineFleet_setThreadCount(self.fleet, threads)
+        if seed is not None:
+            self.set_seed(seed)
+    
+    def __del__(self):
+        if getattr(self, 'fleet', None) and engine_lib:
+            engine_lib.EngineFleet_delete(self.fleet)
+    
+    def __len__(self):
+        return self.count
+    
+    def _mask(self, index):
+        """uint8 mask buffer for `index` (None = every instance)"""
+        if index is None:
+            return None
+        mask = np.zeros(self.count, dtype=np.uint8)
+        mask[index] = 1
+        return mask
+    
+    def _column(self, values, dtype):
+        if values is None:
+            return None
+        return np.ascontiguousarray(np.broadcast_to(np.asarray(values, dtype=dtype), (self.count,)))
+    
+    # Configuration
+    def set_thread_count(self, threads):
+        engine_lib.EngineFleet_setThreadCount(self.fleet, threads)
+    
+    def set_seed(self, seed):
+        engine_lib.EngineFleet_setSeed(self.fleet, seed)
+    
+    def set_rev_limiter(self, rpm):
+        engine_lib.EngineFleet_setRevLimiter(self.fleet, int(rpm))
+    
+    def set_boost_pressure(self, psi):
+        engine_lib.EngineFleet_setBoostPressure(self.fleet, float(psi))
+    
+    def set_integration_mode(self, mode):
+        if not HAS_INTEGRATION_MODE:
+            raise RuntimeError("EngineFleet_setIntegrationMode not available, rebuild engine_physics.dll")
+        engine_lib.EngineFleet_setIntegrationMode(self.fleet, integration_mode_id(mode))
+    
+    def set_subsystem_rate(self, subsystem, hz):
+        if not HAS_SUBSYSTEM_RATES:
+            raise RuntimeError("EngineFleet_setSubsystemRate not available, rebuild engine_physics.dll")
+        engine_lib.EngineFleet_setSubsystemRate(self.fleet, SUBSYSTEMS[subsystem], float(hz))
+    
+    # Control
+    def start_engines(self, index=None):
+        mask = self._mask(index)
+        engine_lib.EngineFleet_startEngines(self.fleet, None if mask is None else mask.ctypes.data)
+    
+    def stop_engines(self, index=None):
+        mask = self._mask(index)
+        engine_lib.EngineFleet_stopEngines(self.fleet, None if mask is None else mask.ctypes.data)
+    
+    def set_inputs(self, throttle=None, brake=None, gear=None):
+        """Per-instance inputs (scalars broadcast, None leaves an input unchanged)"""
+        throttle = self._column(throttle, np.float64)
+        brake = self._column(brake, np.float64)
+        gear = self._column(gear, np.int32)
+        engine_lib.EngineFleet_setInputs(
+            self.fleet,
+            None if throttle is None else throttle.ctypes.data,
+            None if brake is None else brake.ctypes.data,
+            None if gear is None else gear.ctypes.data)
+    
+    # Simulation
+    def step(self, delta_time, steps=1):
+        engine_lib.EngineFleet_step(self.fleet, delta_time, steps)
+    
+    # State readout
+    def field(self, name, out=None):
+        """Copy one state column (see FLEET_FIELDS) into a float64 array"""
+        if out is None:
+            out = np.empty(self.count)
+        elif out.dtype != np.float64 or len(out) < self.count or not out.flags.c_contiguous:
+            raise ValueError("out must be a contiguous float64 array with at least one entry per instance")
+        engine_lib.EngineFleet_copyField(self.fleet, FLEET_FIELDS.index(name), out.ctypes.data)
+        return out
+    
+    @property
+    def gears(self):
+        out = np.empty(self.count, dtype=np.int32)
+        engine_lib.EngineFleet_copyGears(self.fleet, out.ctypes.data)
+        return out
+    
+    def get_state(self, out=None):
+        """Every instance's state as an ENGINE_STATE_DTYPE array"""
+        out = _step_output(self.count, out, True)
+        engine_lib.EngineFleet_getState(self.fleet, out.ctypes.data)
+        return out
 
 
 # Fallback pure-Python implementation for testing without C++ compilation
 class EnginePhysicsPython:
     """Pure Python fallback implementation for engine physics"""
     
-    def __init__(self):
+    # save_state() layout: every attribute that update() reads or writes,
+    # the subsystem schedule and accumulator, then the Mersenne Twister state of self.rng
+    CHECKPOINT_MAGIC = b'ENGP'
+    CHECKPOINT_VERSION = 3
+    CHECKPOINT_FIELDS = (
+        ('rpm', 'd'), ('target_rpm', 'd'), ('speed', 'd'), ('throttle', 'd'), ('gear', 'i'),
+        ('clutch_engaged', '?'), ('is_running', '?'), ('is_shifting', '?'), ('shift_timer', 'd'),
+        ('torque', 'd'), ('power', 'd'), ('boost', 'd'), ('target_boost', 'd'), ('max_boost', 'd'),
+        ('oil_temp', 'd'), ('coolant_temp', 'd'), ('intake_temp', 'd'),
+        ('fuel_level', 'd'), ('fuel_consumption', 'd'), ('engine_wear', 'd'),
+        ('best_0_100_time', 'd'), ('total_distance', 'd'), ('runtime', 'd'),
+        ('redline', 'd'), ('peak_torque', 'd'), ('peak_power', 'd'), ('idle_rpm', 'd'),
+        ('vehicle_mass', 'd'), ('integration_mode', 'i'),
+    )
+    _CHECKPOINT = struct.Struct('<4sI' + ''.join(code for _, code in CHECKPOINT_FIELDS)
+                                + '%dd' % (2 * len(SUBSYSTEMS) + 1 + 2 * len(THERMAL_CHANNELS)) + '625I?d')
+    
+    def __init__(self, seed=0):
         self.rpm = 0
         self.target_rpm = 800
         self.speed = 0
@@ -251,6 +530,12 @@ class EnginePhysicsPython:
         self.peak_power = 250
         self.idle_rpm = 800
         self.vehicle_mass = 1400
+        
+        self.integration_mode = 0
+        self.schedule = _SubsystemSchedule()
+        self.accumulated = _SubsystemAccumulator()
+        self.rng = random.Random(seed)
+        self._state = EngineState()
     
     def start_engine(self):
         if self.fuel_level > 0:
@@ -272,9 +557,12 @@ class EnginePhysicsPython:
                 self.target_rpm = self.idle_rpm + self.throttle * (self.redline - self.idle_rpm)
     
     def set_brake(self, brake):
+        self._apply_brake(brake, 0.016)
+    
+    def _apply_brake(self, brake, delta_time):
         brake = max(0, min(1, brake))
         if brake > 0:
-            self.speed = max(0, self.speed - brake * 50 * 0.016)
+            self.speed = max(0, self.speed - brake * 50 * delta_time)
     
     def shift_up(self):
         if self.clutch_engaged and self.gear < 6 and not self.is_shifting:
@@ -316,6 +604,37 @@ class EnginePhysicsPython:
     def set_boost_pressure(self, psi):
         self.max_boost = max(0, min(25, psi))
     
+    def set_integration_mode(self, mode):
+        self.integration_mode = integration_mode_id(mode)
+    
+    def set_seed(self, seed):
+        self.rng.seed(seed)
+    
+    def set_subsystem_rate(self, subsystem, hz):
+        """Run 'thermal', 'wear' or 'fuel' at hz instead of every tick (hz <= 0 = every tick; wear is not modelled here)"""
+        self.schedule.set_rate(subsystem, float(hz))
+    
+    def _lag(self, rate, delta_time):
+        """Fraction of the gap to a lag target closed in one step"""
+        if self.integration_mode:
+            return -math.expm1(-rate * delta_time)
+        return rate * delta_time
+    
+    def _thermal_lag(self, channel, temp, target, rate, delta_time, due):
+        """One temperature lag of the thermal subsystem, as stepThermalLag in engine_physics.cpp"""
+        acc = self.accumulated
+        if due and acc.heat_rate[channel] == 0.0:
+            return temp + (target - temp) * self._lag(rate, delta_time)
+        acc.heat_rate[channel] += rate * delta_time
+        acc.heat_target[channel] += rate * target * delta_time
+        if not due:
+            return temp
+        lag = acc.heat_rate[channel]
+        mean_target = acc.heat_target[channel] / lag
+        acc.heat_rate[channel] = acc.heat_target[channel] = 0.0
+        # Exact gain for the catch-up, whatever the mode
+        return temp + (mean_target - temp) * -math.expm1(-lag)
+    
     def update(self, delta_time):
         # Handle gear shift delay
         if self.is_shifting:
@@ -325,21 +644,21 @@ class EnginePhysicsPython:
                 self.shift_timer = 0
         
         if not self.is_running and self.rpm > 0:
-            spindown_rate = 300 + (self.rpm * 0.2)
-            self.rpm = max(0, self.rpm - spindown_rate * delta_time)
+            # 300 + 0.2 * rpm per second: a lag towards -1500 RPM, stopped at zero
+            self.rpm = max(0, self.rpm - (self.rpm + 1500) * self._lag(0.2, delta_time))
         elif self.is_running:
             rpm_diff = self.target_rpm - self.rpm
             
             if self.gear == 0:
-                self.rpm += rpm_diff * 6.0 * delta_time
+                self.rpm += rpm_diff * self._lag(6.0, delta_time)
             else:
                 mass_factor = self.vehicle_mass / 1000.0
                 accel_rate = 2.5 / mass_factor
-                self.rpm += rpm_diff * accel_rate * delta_time
+                self.rpm += rpm_diff * self._lag(accel_rate, delta_time)
             
             # Idle stability
             if self.throttle < 0.05 and abs(self.rpm - self.idle_rpm) < 50:
-                self.rpm = self.idle_rpm + (hash(str(self.runtime)) % 20 - 10)
+                self.rpm = self.idle_rpm + self.rng.randrange(-10, 10)
             
             if self.rpm > self.redline:
                 self.rpm = self.redline
@@ -347,6 +666,8 @@ class EnginePhysicsPython:
             
             self.runtime += delta_time
         
+        due_thermal, _, due_fuel = self.schedule.advance(delta_time)
+        
         # Gradual boost update
         if self.is_running and self.throttle > 0.1:
             rpm_factor = max(0, (self.rpm - 2000) / (self.redline - 2000))
@@ -355,7 +676,7 @@ class EnginePhysicsPython:
             self.target_boost = 0
         
         boost_rate = 3.0 if self.target_boost > self.boost else 6.0
-        self.boost += (self.target_boost - self.boost) * boost_rate * delta_time
+        self.boost += (self.target_boost - self.boost) * self._lag(boost_rate, delta_time)
         self.boost = max(0, min(self.max_boost, self.boost))
         
         # Update torque and power with boost
@@ -368,14 +689,19 @@ class EnginePhysicsPython:
             power_kw = (self.torque * self.rpm) / 9549.0
             self.power = power_kw * 1.341
         
-        # Realistic fuel consumption
+        # Realistic fuel consumption, burned every tick and taken from the
+        # tank when the fuel subsystem is due
+        acc = self.accumulated
         if self.is_running:
             rpm_factor = self.rpm / self.redline
             throttle_factor = 0.2 + self.throttle * self.throttle * 0.8
             boost_factor = 1.0 + (self.boost / self.max_boost) * 0.6
             self.fuel_consumption = 8.0 * rpm_factor * throttle_factor * boost_factor
-            fuel_used = (self.fuel_consumption * delta_time) / 3600.0
+            acc.fuel += self.fuel_consumption * delta_time
+        if due_fuel and acc.fuel > 0:
+            fuel_used = acc.fuel / 3600.0
             self.fuel_level = max(0, self.fuel_level - (fuel_used / 50.0) * 100.0)
+            acc.fuel = 0.0
         
         # Gradual temperature update
         if self.is_running:
@@ -383,14 +709,13 @@ class EnginePhysicsPython:
             target_oil = 20 + load_factor * 80 + (self.rpm / self.redline) * 20
             target_coolant = 20 + load_factor * 60 + (self.rpm / self.redline) * 15
             target_intake = 20 + load_factor * 25 + self.boost * 3.5
-            
-            self.oil_temp += (target_oil - self.oil_temp) * 0.15 * delta_time
-            self.coolant_temp += (target_coolant - self.coolant_temp) * 0.12 * delta_time
-            self.intake_temp += (target_intake - self.intake_temp) * 0.25 * delta_time
+            oil_rate, coolant_rate, intake_rate = 0.15, 0.12, 0.25
         else:
-            self.oil_temp += (20 - self.oil_temp) * 0.1 * delta_time
-            self.coolant_temp += (20 - self.coolant_temp) * 0.15 * delta_time
-            self.intake_temp += (20 - self.intake_temp) * 0.3 * delta_time
+            target_oil = target_coolant = target_intake = 20
+            oil_rate, coolant_rate, intake_rate = 0.1, 0.15, 0.3
+        self.oil_temp = self._thermal_lag(0, self.oil_temp, target_oil, oil_rate, delta_time, due_thermal)
+        self.coolant_temp = self._thermal_lag(1, self.coolant_temp, target_coolant, coolant_rate, delta_time, due_thermal)
+        self.intake_temp = self._thermal_lag(2, self.intake_temp, target_intake, intake_rate, delta_time, due_thermal)
         
         # Speed update (simplified)
         if self.gear > 0 and self.clutch_engaged and self.is_running:
@@ -401,12 +726,402 @@ class EnginePhysicsPython:
         if self.speed > 0:
             self.total_distance += (self.speed * delta_time) / 3600.0
     
+    def step_n(self, n, delta_time, throttle=None, brake=None, gear=None, out=None, record=True):
+        """Python-loop equivalent of the native stepN (same schedule semantics)"""
+        throttle = _step_schedule(throttle, n, np.float64)
+        brake = _step_schedule(brake, n, np.float64)
+        gear = _step_schedule(gear, n, np.int32)
+        out = _step_output(n, out, record)
+        state_view = np.frombuffer(self._state, dtype=ENGINE_STATE_DTYPE)
+        
+        last_throttle = self.throttle
+        for i in range(n):
+            if throttle is not None and throttle[i] != last_throttle:
+                self.set_throttle(float(throttle[i]))
+                last_throttle = throttle[i]
+            if gear is not None and gear[i] != self.gear and not self.is_shifting:
+                self.set_gear(int(gear[i]))
+            if brake is not None and brake[i] > 0:
+                self._apply_brake(float(brake[i]), delta_time)
+            
+            self.update(delta_time)
+            
+            if out is not None:
+                self.get_state()
+                out[i] = state_view[0]
+        return out
+    
     def reset_session(self):
         self.total_distance = 0
         self.runtime = 0
         self.best_0_100_time = 0
         self.engine_wear = 0
         self.fuel_level = 100
+        self.accumulated.fuel = 0.0
+    
+    # Checkpoint / restore
+    def save_state(self):
+        """Complete engine state as a fixed-size bytes blob (see CHECKPOINT_FIELDS)"""
+        _, mt_state, gauss_next = self.rng.getstate()
+        values = [getattr(self, name) for name, _ in self.CHECKPOINT_FIELDS]
+        return self._CHECKPOINT.pack(self.CHECKPOINT_MAGIC, self.CHECKPOINT_VERSION, *values,
+                                     *self.schedule.interval, *self.schedule.pending,
+                                     *self.accumulated.values(), *mt_state,
+                                     gauss_next is not None, gauss_next or 0.0)
+    
+    def load_state(self, blob):
+        """Restore a save_state() blob; the engine continues exactly as the saved one would"""
+        if len(blob) != self._CHECKPOINT.size:
+            raise ValueError("not an EnginePhysicsPython checkpoint")
+        values = self._CHECKPOINT.unpack(blob)
+        if values[0] != self.CHECKPOINT_MAGIC or values[1] != self.CHECKPOINT_VERSION:
+            raise ValueError("not an EnginePhysicsPython checkpoint of this version")
+        
+        count = len(self.CHECKPOINT_FIELDS)
+        for (name, _), value in zip(self.CHECKPOINT_FIELDS, values[2:2 + count]):
+            setattr(self, name, value)
+        start = 2 + count
+        subsystems = len(SUBSYSTEMS)
+        self.schedule.interval = list(values[start:start + subsystems])
+        self.schedule.pending = list(values[start + subsystems:start + 2 * subsystems])
+        start += 2 * subsystems
+        accumulated = 1 + 2 * len(THERMAL_CHANNELS)
+        self.accumulated.set_values(values[start:start + accumulated])
+        start += accumulated
+        mt_state = values[start:start + 625]
+        has_gauss, gauss_next = values[-2:]
+        self.rng.setstate((3, mt_state, gauss_next if has_gauss else None))
+    
+    def clone(self):
+        """Independent copy of this engine"""
+        twin = EnginePhysicsPython()
+        twin.load_state(self.save_state())
+        return twin
+    
+    def get_state(self):
+        """Fill and return an EngineState snapshot, same as the C++ version"""
+        s = self._state
+        s.rpm = self.rpm
+        s.target_rpm = self.target_rpm
+        s.speed = self.speed
+        s.torque = self.torque
+        s.power = self.power
+        s.boost = self.boost
+        s.throttle_position = self.throttle
+        s.oil_temp = self.oil_temp
+        s.coolant_temp = self.coolant_temp
+        s.intake_temp = self.intake_temp
+        s.fuel_level = self.fuel_level
+        s.fuel_consumption = self.fuel_consumption
+        s.engine_wear = self.engine_wear
+        s.best_0_100_time = self.best_0_100_time
+        s.best_quarter_mile_time = 0.0
+        s.total_distance = self.total_distance
+        s.runtime = self.runtime
+        s.current_gear = self.gear
+        s.clutch_engaged = self.clutch_engaged
+        s.engine_running = self.is_running
+        s.is_shifting = self.is_shifting
+        return s
+    
+    @property
+    def current_gear(self):
+        return self.gear
+    
+    @property
+    def throttle_position(self):
+        return self.throttle
+
+
+def fill_state_from_getters(engine, state):
+    """Fill an EngineState through per-field getters (libraries without getState)"""
+    for name, _ in EngineState._fields_:
+        if name == 'engine_running':
+            value = engine.is_running
+        elif name == 'clutch_engaged':
+            value = True  # not exposed by the per-field API
+        else:
+            value = getattr(engine, name, 0)
+        setattr(state, name, value)
+    return state
+
+
+# Gear ratios used by the Python physics (1st..6th)
+GEAR_RATIOS = np.array([3.36, 2.07, 1.43, 1.00, 0.84, 0.56])
+
+
+class EnginePhysicsBatch:
+    """
+    Vectorized version of EnginePhysicsPython for N independent engines.
+    
+    State is kept as struct-of-arrays NumPy columns (one entry per engine) and
+    update() advances every engine with masked, branch-free array math that
+    mirrors EnginePhysicsPython.update. Control methods take an optional
+    `index` (int array, slice or boolean mask) selecting which engines to
+    command; scalar values are broadcast across the selection.
+    """
+    
+    def __init__(self, count, seed=None):
+        self.count = n = int(count)
+        self.rng = np.random.default_rng(seed)
+        
+        self.rpm = np.zeros(n)
+        self.target_rpm = np.full(n, 800.0)
+        self.speed = np.zeros(n)
+        self.throttle = np.zeros(n)
+        self.gear = np.zeros(n, dtype=np.int32)  # 0=neutral, 1-6=forward, -1=reverse
+        self.clutch_engaged = np.ones(n, dtype=bool)
+        self.is_running = np.zeros(n, dtype=bool)
+        self.is_shifting = np.zeros(n, dtype=bool)
+        self.shift_timer = np.zeros(n)
+        
+        self.torque = np.zeros(n)
+        self.power = np.zeros(n)
+        self.boost = np.zeros(n)
+        self.target_boost = np.zeros(n)
+        self.max_boost = np.full(n, 15.0)
+        
+        self.oil_temp = np.full(n, 20.0)
+        self.coolant_temp = np.full(n, 20.0)
+        self.intake_temp = np.full(n, 20.0)
+        
+        self.fuel_level = np.full(n, 100.0)
+        self.fuel_consumption = np.zeros(n)
+        self.engine_wear = np.zeros(n)
+        
+        self.best_0_100_time = np.zeros(n)
+        self.total_distance = np.zeros(n)
+        self.runtime = np.zeros(n)
+        
+        # Engine characteristics (per engine so fleets can mix rev limits)
+        self.redline = np.full(n, 7200.0)
+        self.peak_torque = 280
+        self.peak_power = 250
+        self.idle_rpm = 800
+        self.vehicle_mass = 1400
+        self.integration_mode = 0
+        self.schedule = _SubsystemSchedule()  # engines step in lockstep, so one serves them all
+        self.accumulated = _SubsystemAccumulator(n)
+    
+    def _select(self, index):
+        """Boolean mask for `index` (None = every engine)"""
+        if index is None:
+            return np.ones(self.count, dtype=bool)
+        mask = np.zeros(self.count, dtype=bool)
+        mask[index] = True
+        return mask
+    
+    def _retarget(self, mask):
+        """Recompute target_rpm from throttle for running engines in mask"""
+        mask = mask & self.is_running
+        target = np.where(self.throttle < 0.05, self.idle_rpm,
+                          self.idle_rpm + self.throttle * (self.redline - self.idle_rpm))
+        np.copyto(self.target_rpm, target, where=mask)
+    
+    # Control methods
+    def start_engine(self, index=None):
+        mask = self._select(index) & (self.fuel_level > 0)
+        self.is_running |= mask
+        self.rpm[mask] = 800
+        self.target_rpm[mask] = 800
+    
+    def stop_engine(self, index=None):
+        mask = self._select(index)
+        self.is_running &= ~mask
+        self.rpm[mask] = 0
+        self.throttle[mask] = 0
+    
+    def set_throttle(self, throttle, index=None):
+        mask = self._select(index)
+        self.throttle[mask] = np.clip(throttle, 0, 1)
+        self._retarget(mask)
+    
+    def set_brake(self, brake, index=None):
+        self._apply_brake(brake, 0.016, index)
+    
+    def _apply_brake(self, brake, delta_time, index=None):
+        mask = self._select(index)
+        brake = np.clip(np.broadcast_to(brake, self.rpm[mask].shape), 0, 1)
+        self.speed[mask] = np.maximum(0, self.speed[mask] - brake * 50 * delta_time)
+    
+    def _shift(self, mask, new_gear):
+        """Engage new_gear where mask is set, scaling RPM by the ratio change"""
+        old_gear = self.gear.copy()
+        self.gear = np.where(mask, new_gear, self.gear).astype(np.int32)
+        self.is_shifting |= mask
+        self.shift_timer[mask] = 0.2
+        
+        geared = mask & (old_gear > 0) & (self.gear > 0)
+        factor = np.where(geared,
+                          GEAR_RATIOS[np.clip(self.gear - 1, 0, 5)] / GEAR_RATIOS[np.clip(old_gear - 1, 0, 5)],
+                          1.0)
+        self.rpm *= factor
+        self.target_rpm *= factor
+        return geared
+    
+    def shift_up(self, index=None):
+        mask = self._select(index) & self.clutch_engaged & (self.gear < 6) & ~self.is_shifting
+        self._shift(mask, self.gear + 1)
+    
+    def shift_down(self, index=None):
+        mask = self._select(index) & self.clutch_engaged & (self.gear > -1) & ~self.is_shifting
+        geared = self._shift(mask, self.gear - 1)
+        over = geared & (self.rpm > self.redline)
+        np.copyto(self.rpm, self.redline, where=over)
+        np.copyto(self.target_rpm, self.redline, where=over)
+    
+    def toggle_clutch(self, index=None):
+        self.clutch_engaged ^= self._select(index)
+    
+    def set_gear(self, gear, index=None):
+        mask = self._select(index)
+        gear = np.broadcast_to(np.asarray(gear, dtype=np.int32), self.gear[mask].shape)
+        valid = (gear >= -1) & (gear <= 6)
+        self.gear[mask] = np.where(valid, gear, self.gear[mask])
+    
+    def set_rev_limiter(self, rpm, index=None):
+        self.redline[self._select(index)] = np.clip(rpm, 3000, 12000)
+    
+    def set_boost_pressure(self, psi, index=None):
+        self.max_boost[self._select(index)] = np.clip(psi, 0, 25)
+    
+    def set_integration_mode(self, mode):
+        self.integration_mode = integration_mode_id(mode)
+    
+    def set_seed(self, seed):
+        self.rng = np.random.default_rng(seed)
+    
+    def set_subsystem_rate(self, subsystem, hz):
+        """Run 'thermal', 'wear' or 'fuel' at hz instead of every tick (hz <= 0 = every tick; wear is not modelled here)"""
+        self.schedule.set_rate(subsystem, float(hz))
+    
+    def _lag(self, rate, dt):
+        """Fraction of the gap to a lag target closed in one step (rate may be an array)"""
+        if self.integration_mode:
+            return -np.expm1(-np.multiply(rate, dt))
+        return np.multiply(rate, dt)
+    
+    def _thermal_lag(self, channel, temp, target, rate, dt, due):
+        """One temperature lag for every engine (mirrors EnginePhysicsPython._thermal_lag)"""
+        acc = self.accumulated
+        # The schedule is shared, so every engine has accumulated or none has
+        if due and not acc.heat_rate[channel].any():
+            return temp + (target - temp) * self._lag(rate, dt)
+        acc.heat_rate[channel] += rate * dt
+        acc.heat_target[channel] += rate * target * dt
+        if not due:
+            return temp
+        lag = acc.heat_rate[channel]
+        mean_target = acc.heat_target[channel] / lag
+        acc.heat_rate[channel] = np.zeros(self.count)
+        acc.heat_target[channel] = np.zeros(self.count)
+        return temp + (mean_target - temp) * -np.expm1(-lag)
+    
+    def update(self, delta_time):
+        """Advance every engine by delta_time (mirrors EnginePhysicsPython.update)"""
+        dt = delta_time
+        running = self.is_running
+        
+        # Handle gear shift delay
+        self.shift_timer -= np.where(self.is_shifting, dt, 0.0)
+        shift_done = self.is_shifting & (self.shift_timer <= 0)
+        self.is_shifting &= ~shift_done
+        self.shift_timer[shift_done] = 0
+        
+        # Spin down engines that are off, chase target RPM on running ones
+        spindown = np.maximum(0, self.rpm - (self.rpm + 1500) * self._lag(0.2, dt))
+        accel_rate = np.where(self.gear == 0, 6.0, 2.5 / (self.vehicle_mass / 1000.0))
+        rpm_run = self.rpm + (self.target_rpm - self.rpm) * self._lag(accel_rate, dt)
+        
+        # Idle stability
+        idle = (self.throttle < 0.05) & (np.abs(rpm_run - self.idle_rpm) < 50)
+        jitter = self.rng.integers(-10, 10, self.count)
+        rpm_run = np.where(idle, self.idle_rpm + jitter, rpm_run)
+        
+        # Rev limiter
+        over = rpm_run > self.redline
+        rpm_run = np.where(over, self.redline, rpm_run)
+        np.copyto(self.target_rpm, self.redline * 0.95, where=running & over)
+        
+        self.rpm = np.where(running, rpm_run, np.where(self.rpm > 0, spindown, self.rpm))
+        self.runtime += np.where(running, dt, 0.0)
+        
+        due_thermal, _, due_fuel = self.schedule.advance(dt)
+        
+        # Gradual boost update
+        spool = np.maximum(0, (self.rpm - 2000) / (self.redline - 2000))
+        self.target_boost = np.where(running & (self.throttle > 0.1),
+                                     self.max_boost * spool * self.throttle, 0.0)
+        boost_rate = np.where(self.target_boost > self.boost, 3.0, 6.0)
+        self.boost += (self.target_boost - self.boost) * self._lag(boost_rate, dt)
+        np.clip(self.boost, 0, self.max_boost, out=self.boost)
+        
+        # Torque and power with boost (held where the engine is stopped)
+        spinning = self.rpm > 0
+        torque_mult = 0.3 + 0.7 * np.minimum(self.rpm / 3500, 1.0)
+        boost_mult = 1.0 + (self.boost / 14.7) * 0.6
+        torque = self.peak_torque * torque_mult * self.throttle * boost_mult
+        self.torque = np.where(spinning, torque, self.torque)
+        self.power = np.where(spinning, (torque * self.rpm) / 9549.0 * 1.341, self.power)
+        
+        # Fuel consumption, burned every tick and taken from the tank when
+        # the fuel subsystem is due
+        acc = self.accumulated
+        rpm_factor = self.rpm / self.redline
+        throttle_factor = 0.2 + self.throttle * self.throttle * 0.8
+        boost_ratio = np.divide(self.boost, self.max_boost,
+                                out=np.zeros(self.count), where=self.max_boost > 0)
+        consumption = 8.0 * rpm_factor * throttle_factor * (1.0 + boost_ratio * 0.6)
+        self.fuel_consumption = np.where(running, consumption, self.fuel_consumption)
+        acc.fuel += np.where(running, consumption * dt, 0.0)
+        if due_fuel:
+            self.fuel_level = np.maximum(0, self.fuel_level - (acc.fuel / 3600.0 / 50.0) * 100.0)
+            acc.fuel[:] = 0
+        
+        # Temperatures: load-based targets while running, ambient when off
+        load_factor = rpm_factor * self.throttle
+        target_oil = np.where(running, 20 + load_factor * 80 + rpm_factor * 20, 20.0)
+        target_coolant = np.where(running, 20 + load_factor * 60 + rpm_factor * 15, 20.0)
+        target_intake = np.where(running, 20 + load_factor * 25 + self.boost * 3.5, 20.0)
+        self.oil_temp = self._thermal_lag(0, self.oil_temp, target_oil, np.where(running, 0.15, 0.1), dt, due_thermal)
+        self.coolant_temp = self._thermal_lag(1, self.coolant_temp, target_coolant,
+                                              np.where(running, 0.12, 0.15), dt, due_thermal)
+        self.intake_temp = self._thermal_lag(2, self.intake_temp, target_intake,
+                                             np.where(running, 0.25, 0.3), dt, due_thermal)
+        
+        # Speed update (simplified)
+        driven = (self.gear > 0) & self.clutch_engaged & running
+        gear_ratio = GEAR_RATIOS[np.clip(self.gear - 1, 0, 5)]
+        road_speed = (self.rpm * 0.65 * 3.14159 * 60) / (1000 * gear_ratio * 3.73)
+        self.speed = np.where(driven, road_speed, self.speed)
+        
+        # Distance tracking
+        self.total_distance += np.where(self.speed > 0, self.speed * dt / 3600.0, 0.0)
+    
+    def get_state(self, out=None):
+        """Copy every engine's state into an ENGINE_STATE_DTYPE array"""
+        if out is None:
+            out = np.zeros(self.count, dtype=ENGINE_STATE_DTYPE)
+        for name in ('rpm', 'target_rpm', 'speed', 'torque', 'power', 'boost',
+                     'oil_temp', 'coolant_temp', 'intake_temp', 'fuel_level',
+                     'fuel_consumption', 'engine_wear', 'best_0_100_time',
+                     'total_distance', 'runtime'):
+            out[name] = getattr(self, name)
+        out['throttle_position'] = self.throttle
+        out['current_gear'] = self.gear
+        out['clutch_engaged'] = self.clutch_engaged
+        out['engine_running'] = self.is_running
+        out['is_shifting'] = self.is_shifting
+        return out
+    
+    def reset_session(self, index=None):
+        mask = self._select(index)
+        self.total_distance[mask] = 0
+        self.runtime[mask] = 0
+        self.best_0_100_time[mask] = 0
+        self.engine_wear[mask] = 0
+        self.fuel_level[mask] = 100
+        self.accumulated.fuel[mask] = 0
     
     @property
     def current_gear(self):
@@ -414,9 +1129,9 @@ class EnginePhysicsPython:
 
 
 # Try to use C++ version, fall back to Python
-def get_engine_physics():
+def get_engine_physics(seed=None):
     try:
-        return EnginePhysics()
+        return EnginePhysics(seed)
     except:
         print("Using pure Python engine physics (compile C++ for better performance)")
-        return EnginePhysicsPython()
+        return EnginePhysicsPython(0 if seed is None else seed)
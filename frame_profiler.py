@@ -0,0 +1,114 @@
+"""
+Frame-time profiler for the simulation loop
+Records the frame interval and per-stage durations into a fixed-size ring buffer
+and summarizes them as percentiles
+"""
+import time
+
+import numpy as np
+
+
+# Column 0 is the interval since the previous frame started; the rest are
+# durations of the stages timed inside the frame
+STAGES = ('interval', 'physics', 'display', 'audio')
+
+
+class FrameProfiler:
+    """
+    Ring buffer of per-frame timings.
+    
+    Usage per frame:
+        profiler.begin_frame()
+        ...physics...
+        profiler.mark('physics')
+        ...display...
+        profiler.mark('display')
+        profiler.end_frame()
+    
+    mark() charges the time since the previous mark (or begin_frame) to the
+    named stage. Stages that are not marked in a frame record 0.
+    """
+    
+    def __init__(self, capacity=1024, target_interval=0.016):
+        self.capacity = capacity
+        self.target_interval = target_interval
+        self.samples = np.zeros((capacity, len(STAGES)))
+        self.index = 0
+        self.count = 0
+        self._columns = {name: i for i, name in enumerate(STAGES)}
+        self._row = np.zeros(len(STAGES))
+        self._frame_start = None
+        self._last_mark = 0.0
+    
+    def begin_frame(self):
+        """Start timing a frame (also records the interval since the previous one)"""
+        now = time.perf_counter()
+        self._row.fill(0.0)
+        if self._frame_start is not None:
+            self._row[0] = now - self._frame_start
+        self._frame_start = now
+        self._last_mark = now
+    
+    def mark(self, stage):
+        """Charge the time since the last mark to `stage`"""
+        now = time.perf_counter()
+        self._row[self._columns[stage]] += now - self._last_mark
+        self._last_mark = now
+    
+    def end_frame(self):
+        """Commit the current frame to the ring buffer"""
+        # The very first frame has no interval; leave it out of the stats
+        if self._row[0] == 0.0:
+            return
+        self.samples[self.index] = self._row
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def history(self):
+        """Recorded frames in chronological order (seconds)"""
+        if self.count < self.capacity:
+            return self.samples[:self.count]
+        return np.roll(self.samples, -self.index, axis=0)
+    
+    def summary(self):
+        """Per-stage p50/p95/p99/max in milliseconds, plus late-frame counts"""
+        data = self.history() * 1000.0
+        result = {'frames': self.count, 'target_ms': self.target_interval * 1000.0}
+        if not self.count:
+            return result
+        p50, p95, p99 = np.percentile(data, (50, 95, 99), axis=0)
+        peak = data.max(axis=0)
+        for i, name in enumerate(STAGES):
+            result[name] = {'p50': p50[i], 'p95': p95[i], 'p99': p99[i], 'max': peak[i]}
+        
+        # Late frames: interval more than 50% over the scheduler target
+        result['late_frames'] = int(np.count_nonzero(data[:, 0] > result['target_ms'] * 1.5))
+        # Busy frames: the timed work alone exceeded the target
+        result['busy_frames'] = int(np.count_nonzero(data[:, 1:].sum(axis=1) > result['target_ms']))
+        return result
+    
+    def format_summary(self):
+        """Summary as fixed-width text lines (for the overlay and dumps)"""
+        summary = self.summary()
+        lines = [f"frames {summary['frames']}  target {summary['target_ms']:.1f} ms"]
+        if not summary['frames']:
+            return lines
+        lines.append(f"{'stage':<9}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}")
+        for name in STAGES:
+            s = summary[name]
+            lines.append(f"{name:<9}{s['p50']:7.2f}{s['p95']:7.2f}{s['p99']:7.2f}{s['max']:7.2f}")
+        lines.append(f"late {summary['late_frames']}  busy {summary['busy_frames']}")
+        return lines
+    
+    def dump(self, path):
+        """Write the summary (as comments) and the raw per-frame history in ms as CSV"""
+        with open(path, 'w') as f:
+            for line in self.format_summary():
+                f.write(f"# {line}\n")
+            f.write(','.join(f"{name}_ms" for name in STAGES) + '\n')
+            np.savetxt(f, self.history() * 1000.0, delimiter=',', fmt='%.4f')
+    
+    def reset(self):
+        self.index = 0
+        self.count = 0
+        self._frame_start = None
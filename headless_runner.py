@@ -0,0 +1,269 @@
+"""
+Headless simulation runner
+Drives the engine physics from scripted scenarios on a virtual clock (no Tkinter),
+stepping as fast as the CPU allows and reporting throughput
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from engine_wrapper import (get_engine_physics, EnginePhysics, EnginePhysicsPython,
+                            ENGINE_STATE_DTYPE, HAS_STEP_N, INTEGRATION_MODES, SUBSYSTEMS)
+
+
+# Built-in scenarios: events are [time_s, action] or [time_s, action, value]
+SCENARIOS = {
+    # Same run as test_engine.py: neutral, full throttle up to the limiter
+    'neutral_rev': {
+        'duration': 10.0,
+        'events': [
+            [0.0, 'start'],
+            [0.1, 'gear', 0],
+            [0.1, 'throttle', 1.0],
+        ],
+    },
+    # Standing start through the gears, then coast and brake to a stop
+    'launch': {
+        'duration': 60.0,
+        'events': [
+            [0.0, 'start'],
+            [0.5, 'gear', 1],
+            [0.8, 'throttle', 1.0],
+            [4.0, 'shift_up'],
+            [8.0, 'shift_up'],
+            [13.0, 'shift_up'],
+            [19.0, 'shift_up'],
+            [26.0, 'shift_up'],
+            [35.0, 'throttle', 0.0],
+            [40.0, 'brake', 1.0],
+            [55.0, 'brake', 0.0],
+        ],
+    },
+    # Long steady cruise for thermal and fuel endurance checks
+    'cruise': {
+        'duration': 600.0,
+        'events': [
+            [0.0, 'start'],
+            [0.5, 'gear', 1],
+            [0.5, 'throttle', 0.6],
+            [5.0, 'gear', 3],
+            [15.0, 'gear', 5],
+            [20.0, 'throttle', 0.4],
+        ],
+    },
+}
+
+ACTIONS = ('start', 'stop', 'throttle', 'brake', 'gear', 'shift_up', 'shift_down', 'clutch', 'reset')
+
+
+def load_scenario(name_or_path):
+    """Return a built-in scenario by name, or load one from a JSON file"""
+    if name_or_path in SCENARIOS:
+        scenario = SCENARIOS[name_or_path]
+    else:
+        with open(name_or_path) as f:
+            scenario = json.load(f)
+    
+    events = sorted((list(e) for e in scenario.get('events', [])), key=lambda e: e[0])
+    for event in events:
+        if event[1] not in ACTIONS:
+            raise ValueError(f"Unknown scenario action: {event[1]!r}")
+    return {'duration': float(scenario['duration']), 'events': events}
+
+
+def apply_event(engine, action, value=None):
+    """Apply one scenario event to an engine"""
+    if action == 'start':
+        engine.start_engine()
+    elif action == 'stop':
+        engine.stop_engine()
+    elif action == 'throttle':
+        engine.set_throttle(float(value))
+    elif action == 'gear':
+        engine.set_gear(int(value))
+    elif action == 'shift_up':
+        engine.shift_up()
+    elif action == 'shift_down':
+        engine.shift_down()
+    elif action == 'clutch':
+        engine.toggle_clutch()
+    elif action == 'reset':
+        engine.reset_session()
+
+
+def advance(engine, steps, dt, brake=0.0):
+    """Advance `steps` fixed ticks, natively in one call when the library allows it"""
+    if steps <= 0:
+        return
+    if HAS_STEP_N or not isinstance(engine, EnginePhysics):
+        engine.step_n(steps, dt, brake=brake if brake > 0 else None, record=False)
+    else:
+        for _ in range(steps):
+            if brake > 0:
+                # setBrake applies one 16 ms frame of braking
+                engine.set_brake(brake * dt / 0.016)
+            engine.update(dt)
+
+
+def run_scenario(engine, scenario, dt=0.001, sample_interval=None):
+    """
+    Run a scenario to completion on a virtual clock.
+    
+    Events fire on the first tick at or after their timestamp. Between events
+    the engine is advanced in whole batches. With sample_interval set, the
+    state is recorded every sample_interval seconds of simulated time.
+    Returns a result dict with throughput figures, the final state and the
+    optional trace.
+    """
+    total_steps = int(round(scenario['duration'] / dt))
+    event_steps = [(int(np.ceil(e[0] / dt - 1e-9)), e) for e in scenario['events']]
+    sample_steps = max(1, int(round(sample_interval / dt))) if sample_interval else 0
+    
+    samples = []
+    sample_times = []
+    brake = 0.0
+    step = 0
+    event_index = 0
+    
+    wall_start = time.perf_counter()
+    while step < total_steps:
+        # Fire every event due at this tick
+        while event_index < len(event_steps) and event_steps[event_index][0] <= step:
+            event = event_steps[event_index][1]
+            if event[1] == 'brake':
+                brake = float(event[2])
+            else:
+                apply_event(engine, event[1], event[2] if len(event) > 2 else None)
+            event_index += 1
+        
+        # Run up to the next event, sample point or the end of the scenario
+        stop = total_steps
+        if event_index < len(event_steps):
+            stop = min(stop, event_steps[event_index][0])
+        if sample_steps:
+            stop = min(stop, (step // sample_steps + 1) * sample_steps)
+        stop = max(stop, step + 1)
+        
+        advance(engine, stop - step, dt, brake)
+        step = stop
+        
+        if sample_steps and step % sample_steps == 0:
+            samples.append(np.frombuffer(engine.get_state(), dtype=ENGINE_STATE_DTYPE)[0].copy())
+            sample_times.append(step * dt)
+    wall_time = time.perf_counter() - wall_start
+    
+    final = engine.get_state()
+    result = {
+        'steps': total_steps,
+        'dt': dt,
+        'sim_time': total_steps * dt,
+        'wall_time': wall_time,
+        'steps_per_sec': total_steps / wall_time if wall_time > 0 else float('inf'),
+        'realtime_factor': total_steps * dt / wall_time if wall_time > 0 else float('inf'),
+        'final': {name: getattr(final, name) for name, _ in final._fields_},
+        'trace': None,
+    }
+    if samples:
+        result['trace'] = {'time': np.array(sample_times), 'state': np.array(samples)}
+    return result
+
+
+def parse_rate(text):
+    """argparse type for --rate SUBSYSTEM=HZ"""
+    name, sep, hz = text.partition('=')
+    if not sep or name not in SUBSYSTEMS:
+        raise argparse.ArgumentTypeError(f"expected SUBSYSTEM=HZ with SUBSYSTEM one of {', '.join(SUBSYSTEMS)}")
+    try:
+        return name, float(hz)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate {hz!r}")
+
+
+def write_trace(path, trace):
+    """Write a recorded trace as CSV (time column followed by EngineState fields)"""
+    state = trace['state']
+    columns = np.column_stack([trace['time']] + [state[name].astype(np.float64) for name in state.dtype.names])
+    header = ','.join(('time',) + state.dtype.names)
+    np.savetxt(path, columns, delimiter=',', header=header, comments='', fmt='%.6g')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run engine scenarios headless on a virtual clock")
+    parser.add_argument('scenario', nargs='?', default='launch',
+                        help=f"built-in scenario ({', '.join(SCENARIOS)}) or path to a JSON script")
+    parser.add_argument('--dt', type=float, default=0.001, help="physics timestep in seconds (default 0.001)")
+    parser.add_argument('--repeat', type=int, default=1, help="run the scenario N times on fresh engines")
+    parser.add_argument('--integration', choices=tuple(INTEGRATION_MODES), default='euler',
+                        help="lag integration: euler (default), or exponential/fast, which stay "
+                             "accurate at large --dt")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for the idle RPM jitter (every run uses the same seed)")
+    parser.add_argument('--rate', type=parse_rate, action='append', default=[], metavar='SUBSYSTEM=HZ',
+                        help=f"run a slow subsystem ({', '.join(SUBSYSTEMS)}) at HZ instead of every "
+                             "tick, e.g. --rate thermal=20 --rate wear=1 (repeatable)")
+    parser.add_argument('--backend', choices=('auto', 'python'), default='auto',
+                        help="auto = C++ library via get_engine_physics(), python = EnginePhysicsPython")
+    parser.add_argument('--sample', type=float, default=None, metavar='SECONDS',
+                        help="record the state every SECONDS of simulated time")
+    parser.add_argument('--trace', default=None, help="write the recorded trace of the last run to this CSV file")
+    parser.add_argument('--json', action='store_true', help="print results as JSON (for regression jobs)")
+    args = parser.parse_args(argv)
+    
+    scenario = load_scenario(args.scenario)
+    sample = args.sample if args.sample else (0.01 if args.trace else None)
+    
+    results = []
+    for _ in range(args.repeat):
+        engine = EnginePhysicsPython(args.seed or 0) if args.backend == 'python' else get_engine_physics(args.seed)
+        if args.integration != 'euler':
+            engine.set_integration_mode(args.integration)
+        for subsystem, hz in args.rate:
+            engine.set_subsystem_rate(subsystem, hz)
+        results.append(run_scenario(engine, scenario, args.dt, sample))
+    
+    if args.trace and results[-1]['trace'] is not None:
+        write_trace(args.trace, results[-1]['trace'])
+    
+    total_steps = sum(r['steps'] for r in results)
+    total_wall = sum(r['wall_time'] for r in results)
+    summary = {
+        'scenario': args.scenario,
+        'backend': type(engine).__name__,
+        'runs': len(results),
+        'dt': args.dt,
+        'integration': args.integration,
+        'rates': dict(args.rate),
+        'steps': total_steps,
+        'wall_time': total_wall,
+        'steps_per_sec': total_steps / total_wall if total_wall > 0 else float('inf'),
+        'realtime_factor': total_steps * args.dt / total_wall if total_wall > 0 else float('inf'),
+        'final': results[-1]['final'],
+    }
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    final = summary['final']
+    print("=" * 60)
+    print(f"HEADLESS RUN - {args.scenario} ({summary['backend']})")
+    print("=" * 60)
+    print(f"Runs:            {summary['runs']}")
+    print(f"Timestep:        {args.dt * 1000:.3f} ms ({args.integration})")
+    print(f"Steps:           {total_steps:,}")
+    print(f"Wall time:       {total_wall:.3f} s")
+    print(f"Throughput:      {summary['steps_per_sec']:,.0f} steps/s")
+    print(f"Realtime factor: {summary['realtime_factor']:,.0f}x")
+    print("-" * 60)
+    print(f"Final RPM {final['rpm']:.0f} | Speed {final['speed']:.1f} km/h | Gear {final['current_gear']}")
+    print(f"Oil {final['oil_temp']:.1f}°C | Coolant {final['coolant_temp']:.1f}°C | "
+          f"Fuel {final['fuel_level']:.2f}% | Distance {final['total_distance']:.2f} km")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
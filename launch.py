@@ -37,7 +37,7 @@ def check_python_dependencies():
     
     try:
         import pyaudio
-        print("  ✓ PyAudio found (audio will work)")
+        print("  ✓ PyAudio found (engine sound available with --audio)")
     except ImportError:
         print("  ⚠ PyAudio not found (audio disabled, install with: pip install pyaudio)")
     
@@ -99,9 +99,11 @@ def compile_cpp_engine(compiler_name, compiler_cmd):
     elif compiler_name == 'MinGW':
         cmd = [compiler_cmd, '-shared', '-fPIC', '-O3', '-o', 'engine_physics.dll'] + cpp_files
     elif compiler_name == 'Clang':
-        cmd = [compiler_cmd, '-shared', '-O3', '-o', 'engine_physics.dll'] + cpp_files
+        # -pthread: EngineFleet runs its workers on std::thread
+        cmd = [compiler_cmd, '-shared', '-fPIC', '-pthread', '-O3', '-o', 'engine_physics.dll'] + cpp_files
     else:
-        cmd = [compiler_cmd, '-shared', '-O3', '-o', 'engine_physics.dll'] + cpp_files
+        # -pthread: EngineFleet runs its workers on std::thread
+        cmd = [compiler_cmd, '-shared', '-fPIC', '-pthread', '-O3', '-o', 'engine_physics.dll'] + cpp_files
     
     try:
         # Change to project directory
@@ -146,6 +148,18 @@ def check_dll_exists():
     
     return False
 
+def find_stale_sources():
+    """List the engine_physics sources modified after the DLL was built"""
+    project_dir = Path(__file__).parent
+    dll_path = project_dir / 'engine_physics.dll'
+    
+    if not dll_path.exists():
+        return []
+    
+    built = dll_path.stat().st_mtime
+    sources = sorted(project_dir.glob('engine_physics*.cpp')) + sorted(project_dir.glob('engine_physics*.h'))
+    return [source.name for source in sources if source.stat().st_mtime > built]
+
 def launch_application():
     """Launch the main application"""
     print("\n[*] Launching Engine Simulator...")
@@ -158,7 +172,8 @@ def launch_application():
         return False
     
     try:
-        subprocess.run([sys.executable, str(main_app)], check=True)
+        # Options such as --audio are passed through to the application
+        subprocess.run([sys.executable, str(main_app)] + sys.argv[1:], check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"[!] Application failed: {e}")
@@ -181,9 +196,17 @@ def main():
     # Check for C++ compiler and DLL
     compiler_name, compiler_cmd = check_cpp_compiler()
     dll_exists = check_dll_exists()
+    stale_sources = find_stale_sources()
     
-    # Compile if needed
-    if not dll_exists and compiler_name:
+    # Compile if needed (a DLL older than its sources lacks their changes)
+    if stale_sources:
+        print(f"[*] DLL is older than: {', '.join(stale_sources)}")
+        if compiler_name:
+            if not compile_cpp_engine(compiler_name, compiler_cmd):
+                print("\n[!] Rebuild failed. App will use the outdated DLL")
+        else:
+            print("[!] No C++ compiler found to rebuild it. App will use the outdated DLL")
+    elif not dll_exists and compiler_name:
         user_input = input("\n[?] Would you like to compile the C++ physics engine? (y/n): ").lower()
         if user_input == 'y':
             if not compile_cpp_engine(compiler_name, compiler_cmd):
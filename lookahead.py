@@ -0,0 +1,130 @@
+"""
+Look-ahead predictor
+Forks the live engine state into a private twin, fast-forwards it natively at a
+coarse timestep under the current inputs and reports fuel range and time to
+overheat, cached until the inputs change
+"""
+import time
+
+import numpy as np
+
+from engine_wrapper import ENGINE_STATE_DTYPE
+
+
+# Tank capacity the physics converts fuel_level percent against (litres)
+TANK_LITRES = 50.0
+
+
+class LookaheadPredictor:
+    """
+    Fuel range and time-to-overheat projections for a running engine.
+    
+    `twin` is a spare engine owned by the predictor (anything with
+    load_state, set_integration_mode and step_n(..., out=...)). Each
+    projection loads a checkpoint of the live engine into it and steps it
+    `horizon` seconds ahead at `dt` with the exact exponential lags, so the
+    coarse step stays stable. Usage per dashboard frame:
+    
+        if predictor.needs_refresh(state):
+            predictor.project(engine.save_state())
+        predictor.projection    # latest result, or None before the first
+    
+    A projection is reused until the throttle moves by more than
+    `throttle_step`, the gear or running state changes, or it is older than
+    `max_age` seconds (temperatures and fuel drift even at fixed inputs).
+    """
+    
+    def __init__(self, twin, horizon=1800.0, dt=0.5, coolant_limit=105.0,
+                 throttle_step=0.05, max_age=2.0, chunk=600):
+        self.twin = twin
+        self.horizon = horizon
+        self.dt = dt
+        self.coolant_limit = coolant_limit
+        self.throttle_step = throttle_step
+        self.max_age = max_age
+        self.projection = None
+        self._key = None
+        self._expires = 0.0
+        self._records = np.zeros(chunk, dtype=ENGINE_STATE_DTYPE)
+    
+    def inputs_key(self, state):
+        """Inputs a projection depends on, quantized so small throttle wobble keeps the cache"""
+        return (bool(state.engine_running), int(state.current_gear),
+                int(round(state.throttle_position / self.throttle_step)))
+    
+    def needs_refresh(self, state):
+        """True when the cached projection no longer matches `state`'s inputs or has expired"""
+        return self.inputs_key(state) != self._key or time.perf_counter() >= self._expires
+    
+    def project(self, checkpoint):
+        """
+        Fast-forward a save_state() blob and cache the result.
+        
+        Returns a dict with time_to_empty (s), range_km, time_to_overheat (s),
+        each None when it does not happen (overheat is only searched within
+        the horizon), plus the coolant temperature at the end of the horizon
+        and the wall time the projection took. The cache is keyed on the
+        inputs stored in the checkpoint itself.
+        """
+        wall_start = time.perf_counter()
+        twin = self.twin
+        twin.load_state(checkpoint)
+        twin.set_integration_mode('exponential')
+        
+        records = self._records
+        start = twin.get_state()
+        key = self.inputs_key(start)
+        start_distance = start.total_distance
+        start_coolant = start.coolant_temp
+        total_steps = int(round(self.horizon / self.dt))
+        done = 0
+        time_to_overheat = None
+        time_to_empty = None
+        range_km = None
+        while done < total_steps and (time_to_overheat is None or time_to_empty is None):
+            n = min(len(records), total_steps - done)
+            block = twin.step_n(n, self.dt, out=records[:n])
+            if time_to_overheat is None:
+                hot = np.flatnonzero(block['coolant_temp'] >= self.coolant_limit)
+                if hot.size:
+                    time_to_overheat = (done + hot[0] + 1) * self.dt
+            if time_to_empty is None:
+                dry = np.flatnonzero(block['fuel_level'] <= 0.0)
+                if dry.size:
+                    time_to_empty = (done + dry[0] + 1) * self.dt
+                    range_km = float(block['total_distance'][dry[0]]) - start_distance
+            done += n
+        
+        last = block[-1] if done else None
+        if time_to_empty is None and last is not None and last['fuel_consumption'] > 0:
+            # Still fuelled at the horizon: carry on at the final burn rate and speed
+            remaining = float(last['fuel_level']) / 100.0 * TANK_LITRES / float(last['fuel_consumption']) * 3600.0
+            time_to_empty = done * self.dt + remaining
+            range_km = (float(last['total_distance']) - start_distance
+                        + abs(float(last['speed'])) * remaining / 3600.0)
+        
+        self.projection = {
+            'time_to_empty': time_to_empty,
+            'range_km': range_km,
+            'time_to_overheat': time_to_overheat,
+            'coolant_temp': float(last['coolant_temp']) if last is not None else start_coolant,
+            'horizon': done * self.dt,
+            'compute_time': time.perf_counter() - wall_start,
+        }
+        self._key = key
+        self._expires = time.perf_counter() + self.max_age
+        return self.projection
+    
+    def invalidate(self):
+        """Drop the cached projection so the next needs_refresh() is True"""
+        self._key = None
+        self._expires = 0.0
+
+
+def format_duration(seconds):
+    """Seconds as h:mm:ss (or m:ss under an hour), '--' for None"""
+    if seconds is None:
+        return '--'
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02d}:{secs:02d}' if hours else f'{minutes}:{secs:02d}'
@@ -6,199 +6,220 @@ High-performance engine physics simulation with real-time visualization
 import tkinter as tk
 from tkinter import ttk
 import ctypes
-import os
 import time
 import math
+import argparse
+from concurrent.futures import Future
+
+import numpy as np
+
+from engine_bindings import EngineState, load_library
+from engine_wrapper import ENGINE_STATE_DTYPE, fill_state_from_getters, integration_mode_id
+from simulation_clock import FixedStepAccumulator, interpolate_state
+from physics_thread import PhysicsThread, AudioClockedPhysics
+from frame_profiler import FrameProfiler
+from lookahead import LookaheadPredictor, format_duration
+from audio_engine import get_audio_engine
 
 
 class EnginePhysicsDLL:
     """Wrapper for C++ engine physics DLL"""
     
     def __init__(self, dll_path="engine_physics.dll"):
-        self.dll_path = os.path.abspath(dll_path)
-        self.dll = ctypes.CDLL(self.dll_path)
-        self._setup_function_signatures()
-        self.engine = self.dll.EnginePhysics_new()
-        
-    def _setup_function_signatures(self):
-        """Define all function signatures for ctypes"""
-        # Constructor/Destructor
-        self.dll.EnginePhysics_new.restype = ctypes.c_void_p
-        self.dll.EnginePhysics_delete.argtypes = [ctypes.c_void_p]
-        
-        # Control functions
-        self.dll.EnginePhysics_startEngine.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_stopEngine.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_setThrottle.argtypes = [ctypes.c_void_p, ctypes.c_double]
-        self.dll.EnginePhysics_setBrake.argtypes = [ctypes.c_void_p, ctypes.c_double]
-        self.dll.EnginePhysics_shiftUp.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_shiftDown.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_toggleClutch.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_setGear.argtypes = [ctypes.c_void_p, ctypes.c_int]
-        
-        # Configuration
-        self.dll.EnginePhysics_setRevLimiter.argtypes = [ctypes.c_void_p, ctypes.c_int]
-        self.dll.EnginePhysics_setBoostPressure.argtypes = [ctypes.c_void_p, ctypes.c_double]
-        
-        # Update
-        self.dll.EnginePhysics_update.argtypes = [ctypes.c_void_p, ctypes.c_double]
-        
-        # Getters
-        self.dll.EnginePhysics_getRPM.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getRPM.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getSpeed.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getSpeed.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getTorque.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getTorque.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getPower.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getPower.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getBoost.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getBoost.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getCurrentGear.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getCurrentGear.restype = ctypes.c_int
-        
-        self.dll.EnginePhysics_isEngineRunning.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_isEngineRunning.restype = ctypes.c_bool
-        
-        self.dll.EnginePhysics_getThrottlePosition.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getThrottlePosition.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getOilTemp.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getOilTemp.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getCoolantTemp.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getCoolantTemp.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getIntakeTemp.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getIntakeTemp.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getFuelLevel.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getFuelLevel.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getFuelConsumption.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getFuelConsumption.restype = ctypes.c_double
+        # Prototypes and feature flags are shared with engine_wrapper (engine_bindings)
+        self.library = load_library(dll_path)
+        self.dll_path = self.library.path
+        self.dll = self.library.dll
+        self.has_state_snapshot = self.library.has_state_snapshot
+        self.has_step_n = self.library.has_step_n
+        self.has_checkpoint = self.library.has_checkpoint
+        self.has_integration_mode = self.library.has_integration_mode
+        self.checkpoint_size = self.library.checkpoint_size
         
-        self.dll.EnginePhysics_getEngineWear.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getEngineWear.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getTotalDistance.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getTotalDistance.restype = ctypes.c_double
-        
-        self.dll.EnginePhysics_getRuntime.argtypes = [ctypes.c_void_p]
-        self.dll.EnginePhysics_getRuntime.restype = ctypes.c_double
+        self.engine = self.dll.EnginePhysics_new()
+        self.calls = self.library.bind(self.engine)
         
-        self.dll.EnginePhysics_resetSession.argtypes = [ctypes.c_void_p]
+        # Persistent snapshot buffer refilled by get_state()
+        self._state = EngineState()
+        self._state_ref = ctypes.byref(self._state)
+        # Per-step brake schedule for step_n, grown to the largest batch seen
+        self._brake_buf = np.zeros(0)
     
     # Control methods
     def start_engine(self):
-        self.dll.EnginePhysics_startEngine(self.engine)
+        self.calls.startEngine()
     
     def stop_engine(self):
-        self.dll.EnginePhysics_stopEngine(self.engine)
+        self.calls.stopEngine()
     
     def set_throttle(self, value):
-        self.dll.EnginePhysics_setThrottle(self.engine, float(value))
+        self.calls.setThrottle(value)
     
     def set_brake(self, value):
-        self.dll.EnginePhysics_setBrake(self.engine, float(value))
+        self.calls.setBrake(value)
     
     def shift_up(self):
-        self.dll.EnginePhysics_shiftUp(self.engine)
+        self.calls.shiftUp()
     
     def shift_down(self):
-        self.dll.EnginePhysics_shiftDown(self.engine)
+        self.calls.shiftDown()
     
     def toggle_clutch(self):
-        self.dll.EnginePhysics_toggleClutch(self.engine)
+        self.calls.toggleClutch()
     
     def set_gear(self, gear):
-        self.dll.EnginePhysics_setGear(self.engine, int(gear))
+        self.calls.setGear(int(gear))
     
     def set_rev_limiter(self, rpm):
-        self.dll.EnginePhysics_setRevLimiter(self.engine, int(rpm))
+        self.calls.setRevLimiter(int(rpm))
     
     def set_boost_pressure(self, psi):
-        self.dll.EnginePhysics_setBoostPressure(self.engine, float(psi))
+        self.calls.setBoostPressure(float(psi))
+    
+    def set_integration_mode(self, mode):
+        self.calls.setIntegrationMode(integration_mode_id(mode))
+    
+    def save_state(self):
+        """Complete engine state as a bytes blob for load_state()"""
+        buffer = ctypes.create_string_buffer(self.checkpoint_size)
+        self.calls.saveState(buffer, self.checkpoint_size)
+        return buffer.raw
+    
+    def load_state(self, blob):
+        if not self.calls.loadState(blob, len(blob)):
+            raise ValueError("not a checkpoint from this version of engine_physics.dll")
     
     def update(self, delta_time):
-        self.dll.EnginePhysics_update(self.engine, float(delta_time))
+        self.calls.update(delta_time)
+    
+    def step_n(self, n, delta_time, brake=None, out=None):
+        """
+        Advance n fixed ticks, holding `brake` (0-1) for the whole batch.
+        With `out` (ENGINE_STATE_DTYPE array, at least n long) the state after
+        every tick is recorded there.
+        """
+        if n <= 0:
+            return out
+        if self.has_step_n:
+            brake_ptr = None
+            if brake:
+                if len(self._brake_buf) < n:
+                    self._brake_buf = np.empty(n)
+                self._brake_buf[:n] = brake
+                brake_ptr = self._brake_buf.ctypes.data
+            self.calls.stepN(n, float(delta_time), None, brake_ptr,
+                             None, None if out is None else out.ctypes.data)
+        else:
+            for i in range(n):
+                if brake:
+                    # setBrake applies one 16 ms frame of braking
+                    self.set_brake(brake * delta_time / 0.016)
+                self.update(delta_time)
+                if out is not None:
+                    out[i] = np.frombuffer(self.get_state(), dtype=ENGINE_STATE_DTYPE)[0]
+        return out
     
     # Property getters
     @property
     def rpm(self):
-        return self.dll.EnginePhysics_getRPM(self.engine)
+        return self.calls.getRPM()
     
     @property
     def speed(self):
-        return self.dll.EnginePhysics_getSpeed(self.engine)
+        return self.calls.getSpeed()
     
     @property
     def torque(self):
-        return self.dll.EnginePhysics_getTorque(self.engine)
+        return self.calls.getTorque()
     
     @property
     def power(self):
-        return self.dll.EnginePhysics_getPower(self.engine)
+        return self.calls.getPower()
     
     @property
     def boost(self):
-        return self.dll.EnginePhysics_getBoost(self.engine)
+        return self.calls.getBoost()
     
     @property
     def current_gear(self):
-        return self.dll.EnginePhysics_getCurrentGear(self.engine)
+        return self.calls.getCurrentGear()
     
     @property
     def is_running(self):
-        return self.dll.EnginePhysics_isEngineRunning(self.engine)
+        return self.calls.isEngineRunning()
     
     @property
     def throttle_position(self):
-        return self.dll.EnginePhysics_getThrottlePosition(self.engine)
+        return self.calls.getThrottlePosition()
     
     @property
     def oil_temp(self):
-        return self.dll.EnginePhysics_getOilTemp(self.engine)
+        return self.calls.getOilTemp()
     
     @property
     def coolant_temp(self):
-        return self.dll.EnginePhysics_getCoolantTemp(self.engine)
+        return self.calls.getCoolantTemp()
     
     @property
     def intake_temp(self):
-        return self.dll.EnginePhysics_getIntakeTemp(self.engine)
+        return self.calls.getIntakeTemp()
     
     @property
     def fuel_level(self):
-        return self.dll.EnginePhysics_getFuelLevel(self.engine)
+        return self.calls.getFuelLevel()
     
     @property
     def fuel_consumption(self):
-        return self.dll.EnginePhysics_getFuelConsumption(self.engine)
+        return self.calls.getFuelConsumption()
     
     @property
     def engine_wear(self):
-        return self.dll.EnginePhysics_getEngineWear(self.engine)
+        return self.calls.getEngineWear()
     
     @property
     def total_distance(self):
-        return self.dll.EnginePhysics_getTotalDistance(self.engine)
+        return self.calls.getTotalDistance()
     
     @property
     def runtime(self):
-        return self.dll.EnginePhysics_getRuntime(self.engine)
+        return self.calls.getRuntime()
+    
+    def get_state(self):
+        """Refresh and return the persistent EngineState snapshot"""
+        if self.has_state_snapshot:
+            self.calls.getState(self._state_ref)
+        else:
+            fill_state_from_getters(self, self._state)
+        return self._state
     
     def reset_session(self):
-        self.dll.EnginePhysics_resetSession(self.engine)
+        self.calls.resetSession()
     
     def __del__(self):
         if hasattr(self, 'engine') and self.engine:
-            self.dll.EnginePhysics_delete(self.engine)
+            self.calls.delete()
+
+
+class LiveLabel(tk.Label):
+    """Label that remembers what it shows and only calls into Tk on a change"""
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._text = kwargs.get('text')
+        self._fg = kwargs.get('fg')
+    
+    def set(self, text, fg=None):
+        """Show text (and optionally a new fg color), skipping redundant updates"""
+        if text != self._text:
+            self._text = text
+            if fg is not None and fg != self._fg:
+                self._fg = fg
+                self.config(text=text, fg=fg)
+            else:
+                self.config(text=text)
+        elif fg is not None and fg != self._fg:
+            self._fg = fg
+            self.config(fg=fg)
 
 
 class DigitalGauge(tk.Frame):
@@ -219,8 +240,8 @@ class DigitalGauge(tk.Frame):
         title_label.pack(anchor='w', padx=5, pady=2)
         
         # Value display
-        self.value_label = tk.Label(self, text='0', font=('Arial', 28, 'bold'),
-                                   bg='#1a1a1a', fg='#00ff00')
+        self.value_label = LiveLabel(self, text='0', font=('Arial', 28, 'bold'),
+                                    bg='#1a1a1a', fg='#00ff00')
         self.value_label.pack(anchor='w', padx=5)
         
         # Unit label
@@ -234,17 +255,26 @@ class DigitalGauge(tk.Frame):
         self.canvas = tk.Canvas(self, width=self.bar_width, height=self.bar_height,
                                bg='#0a0a0a', highlightthickness=1, highlightbackground='#00ff00')
         self.canvas.pack(pady=5, padx=5)
+        
+        # Persistent bar item, resized and recolored in place
+        self.bar = self.canvas.create_rectangle(0, 0, 0, self.bar_height,
+                                                fill='#00ff00', outline='')
+        self._shown_value = 0
+        self._bar_pixels = 0
+        self._bar_color = '#00ff00'
     
     def update(self, value):
         """Update gauge value and color"""
         self.current_value = value
-        self.value_label.config(text=f'{int(value)}')
+        shown = int(value)
+        if shown != self._shown_value:
+            self._shown_value = shown
+            self.value_label.set(f'{shown}')
         
-        # Update progress bar
-        self.canvas.delete('bar')
+        # Update progress bar (only when its pixel width or color changes)
         if self.max_value > 0:
-            ratio = min(1.0, value / self.max_value)
-            bar_width = ratio * self.bar_width
+            ratio = max(0.0, min(1.0, value / self.max_value))
+            bar_pixels = int(ratio * self.bar_width)
             
             # Color based on threshold
             if ratio < self.warning_threshold:
@@ -254,15 +284,19 @@ class DigitalGauge(tk.Frame):
             else:
                 color = '#ff0000'
             
-            if bar_width > 0:
-                self.canvas.create_rectangle(0, 0, bar_width, self.bar_height,
-                                            fill=color, outline='', tags='bar')
+            if bar_pixels != self._bar_pixels:
+                self._bar_pixels = bar_pixels
+                self.canvas.coords(self.bar, 0, 0, bar_pixels, self.bar_height)
+            if color != self._bar_color:
+                self._bar_color = color
+                self.canvas.itemconfig(self.bar, fill=color)
 
 
 class EngineSimulatorApp:
     """Main application window"""
     
-    def __init__(self, root):
+    def __init__(self, root, physics_rate=1000, threaded=False, audio=False, audio_clocked=False,
+                 audio_synthesis='additive', audio_stats_interval=None):
         self.root = root
         self.root.title("Engine Simulator v2.0 - C++ Physics Edition")
         self.root.geometry("1400x900")
@@ -279,10 +313,53 @@ class EngineSimulatorApp:
         
         # Application state
         self.running = True
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
         self.throttle_pressed = False
         self.brake_pressed = False
         
+        # Fixed-rate physics: each frame runs however many whole steps are due,
+        # and the display blends the last two physics states
+        self.clock = FixedStepAccumulator(physics_rate)
+        self._prev_state = EngineState()
+        self._curr_state = EngineState()
+        self._display_state = EngineState()
+        self._copy_state(self._prev_state)
+        self._copy_state(self._curr_state)
+        
+        # Engine sound
+        self.audio = get_audio_engine(synthesis=audio_synthesis) if audio else None
+        if audio_stats_interval and hasattr(self.audio, 'start_stats_log'):
+            self.audio.start_stats_log(audio_stats_interval)
+        self.audio_volume = 0.5
+        
+        # Optional off-GUI physics: either the audio callback or a dedicated
+        # thread owns the engine from here on, inputs go through its command
+        # slot and the display reads its snapshots
+        self.physics = None
+        self.audio_clocked = False
+        if audio_clocked:
+            if getattr(self.audio, 'is_running', False) and hasattr(self.audio, 'attach_physics'):
+                self.physics = AudioClockedPhysics(self.engine, physics_rate)
+                self.audio.attach_physics(self.physics)
+                self.audio_clocked = True
+            else:
+                print("Audio-clocked physics needs a running audio stream, using the GUI clock")
+        elif threaded:
+            self.physics = PhysicsThread(self.engine, physics_rate)
+            self.physics.start()
+        
+        # Fuel range / time to overheat, projected on a private twin engine
+        # from checkpoints of the live one
+        self.lookahead = None
+        self._lookahead_request = None
+        if self.engine.has_checkpoint and self.engine.has_integration_mode:
+            self.lookahead = LookaheadPredictor(EnginePhysicsDLL(self.engine.dll_path))
+        
+        # Frame timing (F3 toggles the overlay, F4 dumps to a file)
+        self.profiler = FrameProfiler(target_interval=0.016)
+        self.profiler_overlay = None
+        self._overlay_due = 0.0
+        
         # Build UI
         self.create_ui()
         self.setup_keybindings()
@@ -395,7 +472,9 @@ class EngineSimulatorApp:
             "↑ - Shift Up\n"
             "↓ - Shift Down\n"
             "C - Toggle Clutch\n"
-            "R - Reset Session"
+            "R - Reset Session\n"
+            "F3 - Frame Timing\n"
+            "F4 - Dump Timing"
         )
         shortcuts_label = tk.Label(shortcuts_frame, text=shortcuts_text, font=('Courier', 9),
                                   bg='#1a1a1a', fg='#00aa00', justify=tk.LEFT)
@@ -420,8 +499,8 @@ class EngineSimulatorApp:
         tk.Label(gear_display_frame, text='CURRENT GEAR', font=('Arial', 12),
                 bg='#1a1a1a', fg='#00ff00').pack()
         
-        self.gear_display = tk.Label(gear_display_frame, text='N', font=('Arial', 56, 'bold'),
-                                    bg='#1a1a1a', fg='#00ff00')
+        self.gear_display = LiveLabel(gear_display_frame, text='N', font=('Arial', 56, 'bold'),
+                                     bg='#1a1a1a', fg='#00ff00')
         self.gear_display.pack(pady=10)
     
     def create_info_panel(self, parent):
@@ -436,16 +515,16 @@ class EngineSimulatorApp:
                                   fg='#00ff00', font=('Arial', 11, 'bold'))
         perf_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.torque_label = tk.Label(perf_frame, text='Torque: 0 Nm',
-                                    font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.torque_label = LiveLabel(perf_frame, text='Torque: 0 Nm',
+                                     font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.torque_label.pack(anchor='w', padx=5, pady=2)
         
-        self.boost_display = tk.Label(perf_frame, text='Boost: 0.0 PSI',
-                                     font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.boost_display = LiveLabel(perf_frame, text='Boost: 0.0 PSI',
+                                      font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.boost_display.pack(anchor='w', padx=5, pady=2)
         
-        self.throttle_label = tk.Label(perf_frame, text='Throttle: 0%',
-                                      font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.throttle_label = LiveLabel(perf_frame, text='Throttle: 0%',
+                                       font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.throttle_label.pack(anchor='w', padx=5, pady=2)
         
         # Temperature section
@@ -453,46 +532,54 @@ class EngineSimulatorApp:
                                   fg='#00ff00', font=('Arial', 11, 'bold'))
         temp_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.oil_temp_label = tk.Label(temp_frame, text='Oil: 20°C',
-                                      font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.oil_temp_label = LiveLabel(temp_frame, text='Oil: 20°C',
+                                       font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.oil_temp_label.pack(anchor='w', padx=5, pady=2)
         
-        self.coolant_temp_label = tk.Label(temp_frame, text='Coolant: 20°C',
-                                          font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.coolant_temp_label = LiveLabel(temp_frame, text='Coolant: 20°C',
+                                           font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.coolant_temp_label.pack(anchor='w', padx=5, pady=2)
         
-        self.intake_temp_label = tk.Label(temp_frame, text='Intake: 20°C',
-                                         font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.intake_temp_label = LiveLabel(temp_frame, text='Intake: 20°C',
+                                          font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.intake_temp_label.pack(anchor='w', padx=5, pady=2)
         
+        self.overheat_label = LiveLabel(temp_frame, text='Overheat in: --',
+                                       font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.overheat_label.pack(anchor='w', padx=5, pady=2)
+        
         # Fuel section
         fuel_frame = tk.LabelFrame(parent, text='FUEL SYSTEM', bg='#1a1a1a',
                                   fg='#00ff00', font=('Arial', 11, 'bold'))
         fuel_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.fuel_level_label = tk.Label(fuel_frame, text='Level: 100.0%',
-                                        font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.fuel_level_label = LiveLabel(fuel_frame, text='Level: 100.0%',
+                                         font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.fuel_level_label.pack(anchor='w', padx=5, pady=2)
         
-        self.fuel_consumption_label = tk.Label(fuel_frame, text='Consumption: 0.0 L/h',
-                                              font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.fuel_consumption_label = LiveLabel(fuel_frame, text='Consumption: 0.0 L/h',
+                                               font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.fuel_consumption_label.pack(anchor='w', padx=5, pady=2)
         
+        self.fuel_range_label = LiveLabel(fuel_frame, text='Range: --',
+                                         font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.fuel_range_label.pack(anchor='w', padx=5, pady=2)
+        
         # Session statistics
         session_frame = tk.LabelFrame(parent, text='SESSION', bg='#1a1a1a',
                                      fg='#00ff00', font=('Arial', 11, 'bold'))
         session_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.distance_label = tk.Label(session_frame, text='Distance: 0.00 km',
-                                      font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.distance_label = LiveLabel(session_frame, text='Distance: 0.00 km',
+                                       font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.distance_label.pack(anchor='w', padx=5, pady=2)
         
-        self.runtime_label = tk.Label(session_frame, text='Runtime: 0.0 s',
-                                     font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.runtime_label = LiveLabel(session_frame, text='Runtime: 0.0 s',
+                                      font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.runtime_label.pack(anchor='w', padx=5, pady=2)
         
-        self.wear_label = tk.Label(session_frame, text='Engine Wear: 0.0%',
-                                  font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
+        self.wear_label = LiveLabel(session_frame, text='Engine Wear: 0.0%',
+                                   font=('Courier', 10), bg='#1a1a1a', fg='#00aa00')
         self.wear_label.pack(anchor='w', padx=5, pady=2)
         
         # Reset button
@@ -534,144 +621,284 @@ class EngineSimulatorApp:
         self.root.bind('<KeyRelease-B>', lambda e: self.on_brake_release())
         
         # Shifting
-        self.root.bind('<Up>', lambda e: self.engine.shift_up())
-        self.root.bind('<Down>', lambda e: self.engine.shift_down())
+        self.root.bind('<Up>', lambda e: self.send_command('shift_up'))
+        self.root.bind('<Down>', lambda e: self.send_command('shift_down'))
         
         # Clutch
-        self.root.bind('c', lambda e: self.engine.toggle_clutch())
-        self.root.bind('C', lambda e: self.engine.toggle_clutch())
+        self.root.bind('c', lambda e: self.send_command('toggle_clutch'))
+        self.root.bind('C', lambda e: self.send_command('toggle_clutch'))
         
         # Reset
         self.root.bind('r', lambda e: self.reset_session())
         self.root.bind('R', lambda e: self.reset_session())
+        
+        # Frame profiler
+        self.root.bind('<F3>', lambda e: self.toggle_profiler_overlay())
+        self.root.bind('<F4>', lambda e: self.dump_profile())
+    
+    def send_command(self, name, *args):
+        """Call an engine method, via the physics thread's command queue when threaded"""
+        if self.physics:
+            self.physics.commands.post(name, *args)
+        else:
+            getattr(self.engine, name)(*args)
+    
+    def request_command(self, name, *args):
+        """Like send_command, but returns a Future for the method's result"""
+        if self.physics:
+            return self.physics.commands.request(name, *args)
+        future = Future()
+        future.set_result(getattr(self.engine, name)(*args))
+        return future
     
     def toggle_engine(self):
         """Toggle engine on/off"""
-        if self.engine.is_running:
-            self.engine.stop_engine()
+        running = self._curr_state.engine_running if self.physics else self.engine.is_running
+        if running:
+            self.send_command('stop_engine')
             self.start_button.config(text='START ENGINE [E]', bg='#00ff00')
         else:
-            self.engine.start_engine()
+            self.send_command('start_engine')
             self.start_button.config(text='STOP ENGINE [E]', bg='#ff3333')
     
     def set_gear(self, gear):
         """Set transmission gear"""
-        self.engine.set_gear(gear)
+        self.send_command('set_gear', gear)
     
     def on_rev_limiter_change(self, value):
         """Update rev limiter"""
         rpm = int(float(value))
-        self.engine.set_rev_limiter(rpm)
+        self.send_command('set_rev_limiter', rpm)
         self.rev_label.config(text=f'{rpm} RPM')
     
     def on_boost_change(self, value):
         """Update boost pressure"""
         psi = float(value)
-        self.engine.set_boost_pressure(psi)
+        self.send_command('set_boost_pressure', psi)
         self.boost_label.config(text=f'{psi:.1f} PSI')
     
     def on_throttle_press(self):
         """Throttle pressed"""
         self.throttle_pressed = True
-        self.engine.set_throttle(1.0)
+        if self.physics:
+            self.physics.commands.throttle = 1.0
+        else:
+            self.engine.set_throttle(1.0)
     
     def on_throttle_release(self):
         """Throttle released"""
         self.throttle_pressed = False
-        self.engine.set_throttle(0.0)
+        if self.physics:
+            self.physics.commands.throttle = 0.0
+        else:
+            self.engine.set_throttle(0.0)
     
     def on_brake_press(self):
-        """Brake pressed"""
+        """Brake pressed (applied by every physics step while held)"""
         self.brake_pressed = True
-        self.engine.set_brake(1.0)
+        if self.physics:
+            self.physics.commands.brake = 1.0
     
     def on_brake_release(self):
         """Brake released"""
         self.brake_pressed = False
-        self.engine.set_brake(0.0)
+        if self.physics:
+            self.physics.commands.brake = 0.0
     
     def reset_session(self):
         """Reset session statistics"""
-        self.engine.reset_session()
+        self.send_command('reset_session')
     
-    def update_display(self):
+    def toggle_profiler_overlay(self):
+        """Show/hide the frame timing overlay"""
+        if self.profiler_overlay:
+            self.profiler_overlay.destroy()
+            self.profiler_overlay = None
+        else:
+            self.profiler_overlay = tk.Label(self.root, font=('Courier', 9), justify=tk.LEFT,
+                                             bg='#000000', fg='#00ff00', anchor='nw')
+            self.profiler_overlay.place(relx=1.0, rely=0.0, x=-10, y=10, anchor='ne')
+            self._overlay_due = 0.0
+    
+    def dump_profile(self, path=None):
+        """Write the frame timing history to a CSV file"""
+        path = path or time.strftime('frame_profile_%Y%m%d_%H%M%S.csv')
+        self.profiler.dump(path)
+        print(f"Frame timing written to {path}")
+        for line in self.profiler.format_summary():
+            print(f"  {line}")
+    
+    def push_audio(self, state):
+        """Send the current engine state to the audio engine"""
+        self.audio.update_parameters(state.rpm, state.boost, state.throttle_position, self.audio_volume)
+    
+    def update_display(self, state=None):
         """Update all display elements"""
+        # One library call for the whole frame's telemetry
+        if state is None:
+            state = self.engine.get_state()
+        
         # Update main gauges
-        self.rpm_gauge.update(self.engine.rpm)
-        self.speed_gauge.update(abs(self.engine.speed))
-        self.power_gauge.update(self.engine.power)
+        self.rpm_gauge.update(state.rpm)
+        self.speed_gauge.update(abs(state.speed))
+        self.power_gauge.update(state.power)
         
         # Update gear display
         gear_map = {-1: 'R', 0: 'N', 1: '1', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6'}
-        gear_text = gear_map.get(self.engine.current_gear, 'N')
-        self.gear_display.config(text=gear_text)
+        gear = state.current_gear
+        gear_text = gear_map.get(gear, 'N')
         
         # Color code gear display
-        if self.engine.current_gear == 0:
-            self.gear_display.config(fg='#ffaa00')  # Orange for neutral
-        elif self.engine.current_gear == -1:
-            self.gear_display.config(fg='#ff3333')  # Red for reverse
+        if gear == 0:
+            self.gear_display.set(gear_text, '#ffaa00')  # Orange for neutral
+        elif gear == -1:
+            self.gear_display.set(gear_text, '#ff3333')  # Red for reverse
         else:
-            self.gear_display.config(fg='#00ff00')  # Green for forward gears
+            self.gear_display.set(gear_text, '#00ff00')  # Green for forward gears
         
-        # Update performance labels
-        self.torque_label.config(text=f'Torque: {self.engine.torque:.0f} Nm')
-        self.boost_display.config(text=f'Boost: {self.engine.boost:.1f} PSI')
-        self.throttle_label.config(text=f'Throttle: {self.engine.throttle_position*100:.0f}%')
+        # Update performance labels (LiveLabel skips unchanged text)
+        self.torque_label.set(f'Torque: {state.torque:.0f} Nm')
+        self.boost_display.set(f'Boost: {state.boost:.1f} PSI')
+        self.throttle_label.set(f'Throttle: {state.throttle_position*100:.0f}%')
         
         # Update temperature labels with color coding
-        oil_temp = self.engine.oil_temp
+        oil_temp = state.oil_temp
         oil_color = '#00aa00' if oil_temp < 100 else ('#ffaa00' if oil_temp < 110 else '#ff3333')
-        self.oil_temp_label.config(text=f'Oil: {oil_temp:.0f}°C', fg=oil_color)
+        self.oil_temp_label.set(f'Oil: {oil_temp:.0f}°C', oil_color)
         
-        coolant_temp = self.engine.coolant_temp
+        coolant_temp = state.coolant_temp
         coolant_color = '#00aa00' if coolant_temp < 95 else ('#ffaa00' if coolant_temp < 105 else '#ff3333')
-        self.coolant_temp_label.config(text=f'Coolant: {coolant_temp:.0f}°C', fg=coolant_color)
+        self.coolant_temp_label.set(f'Coolant: {coolant_temp:.0f}°C', coolant_color)
         
-        self.intake_temp_label.config(text=f'Intake: {self.engine.intake_temp:.0f}°C')
+        self.intake_temp_label.set(f'Intake: {state.intake_temp:.0f}°C')
         
         # Update fuel labels
-        fuel_level = self.engine.fuel_level
+        fuel_level = state.fuel_level
         fuel_color = '#00aa00' if fuel_level > 25 else ('#ffaa00' if fuel_level > 10 else '#ff3333')
-        self.fuel_level_label.config(text=f'Level: {fuel_level:.1f}%', fg=fuel_color)
-        self.fuel_consumption_label.config(text=f'Consumption: {self.engine.fuel_consumption:.1f} L/h')
+        self.fuel_level_label.set(f'Level: {fuel_level:.1f}%', fuel_color)
+        self.fuel_consumption_label.set(f'Consumption: {state.fuel_consumption:.1f} L/h')
         
         # Update session labels
-        self.distance_label.config(text=f'Distance: {self.engine.total_distance:.2f} km')
-        self.runtime_label.config(text=f'Runtime: {self.engine.runtime:.1f} s')
-        self.wear_label.config(text=f'Engine Wear: {self.engine.engine_wear:.1f}%')
+        self.distance_label.set(f'Distance: {state.total_distance:.2f} km')
+        self.runtime_label.set(f'Runtime: {state.runtime:.1f} s')
+        self.wear_label.set(f'Engine Wear: {state.engine_wear:.1f}%')
+        
+        self.update_lookahead(state)
+    
+    def update_lookahead(self, state):
+        """Refresh the range/overheat projection when the inputs change (one checkpoint request in flight)"""
+        if self.lookahead is None:
+            return
+        if self._lookahead_request is None:
+            if self.lookahead.needs_refresh(state):
+                # The engine's owner (GUI, physics thread or audio callback) takes the checkpoint
+                self._lookahead_request = self.request_command('save_state')
+            return
+        if not self._lookahead_request.done():
+            return
+        
+        request, self._lookahead_request = self._lookahead_request, None
+        try:
+            projection = self.lookahead.project(request.result())
+        except Exception as e:
+            print(f"Look-ahead error: {e}")
+            self.lookahead = None
+            return
+        
+        if projection['range_km'] is None:
+            self.fuel_range_label.set('Range: --')
+        else:
+            self.fuel_range_label.set(f"Range: {projection['range_km']:.0f} km "
+                                      f"({format_duration(projection['time_to_empty'])})")
+        
+        overheat = projection['time_to_overheat']
+        if overheat is None:
+            self.overheat_label.set(f"Overheat in: > {format_duration(projection['horizon'])}", '#00aa00')
+        else:
+            color = '#ff3333' if overheat < 60 else ('#ffaa00' if overheat < 600 else '#00aa00')
+            self.overheat_label.set(f'Overheat in: {format_duration(overheat)}', color)
     
     def simulation_loop(self):
         """Main simulation loop"""
         if not self.running:
             return
         
-        # Calculate delta time
-        current_time = time.time()
-        delta_time = current_time - self.last_update_time
-        self.last_update_time = current_time
+        profiler = self.profiler
+        profiler.begin_frame()
+        
+        # Threaded mode: just show the physics thread's latest snapshot
+        if self.physics:
+            try:
+                self.physics.snapshots.read(self._curr_state)
+                profiler.mark('physics')
+                self.update_display(self._curr_state)
+                profiler.mark('display')
+            except Exception as e:
+                print(f"Display update error: {e}")
+            self.finish_frame(self._curr_state)
+            return
         
-        # Clamp delta time to prevent large jumps
-        delta_time = min(delta_time, 0.1)
+        # Feed elapsed wall time to the fixed-step accumulator
+        current_time = time.perf_counter()
+        frame_time = current_time - self.last_update_time
+        self.last_update_time = current_time
+        steps = self.clock.advance(frame_time)
         
-        # Update engine physics
+        # Update engine physics: all due sub-steps in one batch, with a
+        # snapshot before the final step for display interpolation
         try:
-            self.engine.update(delta_time)
+            if steps > 0:
+                brake = 1.0 if self.brake_pressed else None
+                self.engine.step_n(steps - 1, self.clock.dt, brake)
+                self._copy_state(self._prev_state)
+                self.engine.step_n(1, self.clock.dt, brake)
+                self._copy_state(self._curr_state)
         except Exception as e:
             print(f"Physics update error: {e}")
+        profiler.mark('physics')
         
         # Update display
         try:
-            self.update_display()
+            interpolate_state(self._prev_state, self._curr_state, self.clock.alpha, self._display_state)
+            self.update_display(self._display_state)
         except Exception as e:
             print(f"Display update error: {e}")
+        profiler.mark('display')
+        
+        self.finish_frame(self._display_state)
+    
+    def finish_frame(self, state):
+        """Audio push, profiler bookkeeping and scheduling of the next frame"""
+        # Without audio (the default) or with audio-clocked physics nothing is
+        # pushed here, and the unmarked audio stage records 0 for the frame
+        if self.audio and not self.audio_clocked:
+            try:
+                self.push_audio(state)
+            except Exception as e:
+                print(f"Audio update error: {e}")
+            self.profiler.mark('audio')
+        self.profiler.end_frame()
+        
+        # Refresh the overlay a few times a second, not every frame
+        if self.profiler_overlay and time.perf_counter() >= self._overlay_due:
+            self._overlay_due = time.perf_counter() + 0.5
+            self.profiler_overlay.config(text='\n'.join(self.profiler.format_summary()))
         
         # Schedule next update (target 60 FPS)
         self.root.after(16, self.simulation_loop)
     
+    def _copy_state(self, target):
+        """Copy the engine's current snapshot into target"""
+        ctypes.memmove(ctypes.addressof(target), ctypes.addressof(self.engine.get_state()),
+                       ctypes.sizeof(EngineState))
+    
     def on_closing(self):
         """Handle window close"""
         self.running = False
+        if self.physics:
+            self.physics.stop()
+        if self.audio:
+            self.audio.stop()
         try:
             self.engine.stop_engine()
         except:
@@ -681,6 +908,20 @@ class EngineSimulatorApp:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Engine Simulator")
+    parser.add_argument('--physics-rate', type=float, default=1000,
+                        help="fixed physics rate in Hz (e.g. 500-2000, default 1000)")
+    parser.add_argument('--threaded-physics', action='store_true',
+                        help="step the physics on a background thread instead of the Tk loop")
+    parser.add_argument('--audio', action='store_true', help="enable engine sound (off by default)")
+    parser.add_argument('--audio-clock', action='store_true',
+                        help="with --audio, step the physics inside the audio callback (audio is the master clock)")
+    parser.add_argument('--audio-synth', choices=('additive', 'granular'), default='additive',
+                        help="granular = play cached grains (lowest CPU when the engine holds steady)")
+    parser.add_argument('--audio-stats', type=float, default=None, metavar='SECONDS',
+                        help="log audio callback health (xruns, callback time vs budget) every SECONDS")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("ENGINE SIMULATOR v2.0 - C++ Physics Edition")
     print("=" * 60)
@@ -689,7 +930,10 @@ def main():
     root = tk.Tk()
     
     try:
-        app = EngineSimulatorApp(root)
+        app = EngineSimulatorApp(root, physics_rate=args.physics_rate,
+                                 threaded=args.threaded_physics, audio=args.audio,
+                                 audio_clocked=args.audio_clock, audio_synthesis=args.audio_synth,
+                                 audio_stats_interval=args.audio_stats)
         root.protocol("WM_DELETE_WINDOW", app.on_closing)
         print("✓ Application initialized successfully")
         print("=" * 60)
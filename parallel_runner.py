@@ -0,0 +1,159 @@
+"""
+Multi-instance scenario runner
+Steps many independent engines, each with its own scenario, on a thread pool.
+ctypes releases the GIL for the duration of every library call, so the batched
+native stepping of different instances runs on different cores in one process
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from engine_wrapper import EnginePhysics, EnginePhysicsPython, ENGINE_STATE_DTYPE, HAS_STEP_N
+from headless_runner import SCENARIOS, load_scenario, run_scenario
+
+
+# Telemetry fields summarised across instances
+SUMMARY_FIELDS = ('rpm', 'speed', 'oil_temp', 'coolant_temp', 'fuel_level', 'engine_wear', 'total_distance')
+
+
+def make_engine(seed, backend='native'):
+    """Fresh engine for one instance"""
+    if backend == 'python':
+        return EnginePhysicsPython(seed)
+    return EnginePhysics(seed)
+
+
+def run_shard(shard, dt=0.001, backend='native'):
+    """
+    Run one worker's share of instances back to back.
+    
+    shard is a list of (index, scenario, seed). Returns the worker's
+    throughput figures plus (index, final state) pairs.
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    steps = 0
+    finals = []
+    for index, scenario, seed in shard:
+        result = run_scenario(make_engine(seed, backend), scenario, dt)
+        steps += result['steps']
+        finals.append((index, tuple(result['final'][name] for name in ENGINE_STATE_DTYPE.names)))
+    wall_time = time.perf_counter() - wall_start
+    
+    return {
+        'worker': threading.current_thread().name,
+        'instances': len(shard),
+        'steps': steps,
+        'wall_time': wall_time,
+        'cpu_time': time.thread_time() - cpu_start,
+        'steps_per_sec': steps / wall_time if wall_time > 0 else float('inf'),
+        'final': finals,
+    }
+
+
+def run_instances(scenarios, workers=None, dt=0.001, seed=0, backend='native'):
+    """
+    Run one engine per entry of `scenarios` (loaded scenario dicts) on a thread pool.
+    
+    Instances are sharded longest first onto the worker with the least
+    simulated time so far, so a mix of long and short scenarios spreads
+    evenly. Instance i is seeded with seed + i,
+    which makes the results independent of the worker count. Returns the
+    per-worker figures, aggregate throughput and every instance's final state
+    as an ENGINE_STATE_DTYPE array in instance order.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(scenarios)))
+    jobs = [(i, scenario, seed + i) for i, scenario in enumerate(scenarios)]
+    shards = [[] for _ in range(workers)]
+    load = [0.0] * workers
+    for job in sorted(jobs, key=lambda job: -job[1]['duration']):
+        w = load.index(min(load))
+        shards[w].append(job)
+        load[w] += job[1]['duration']
+    
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='engine') as pool:
+        worker_results = list(pool.map(lambda shard: run_shard(shard, dt, backend), shards))
+    wall_time = time.perf_counter() - wall_start
+    
+    final = np.zeros(len(jobs), dtype=ENGINE_STATE_DTYPE)
+    for worker in worker_results:
+        for index, state in worker.pop('final'):
+            final[index] = state
+    
+    steps = sum(w['steps'] for w in worker_results)
+    return {
+        'instances': len(jobs),
+        'workers': worker_results,
+        'steps': steps,
+        'wall_time': wall_time,
+        'steps_per_sec': steps / wall_time if wall_time > 0 else float('inf'),
+        # Worker CPU time over elapsed time: the number of cores kept busy
+        'parallelism': sum(w['cpu_time'] for w in worker_results) / wall_time if wall_time > 0 else 0.0,
+        'final': final,
+    }
+
+
+def summarize_final(final):
+    """Mean/min/max of SUMMARY_FIELDS across instances"""
+    return {name: {'mean': float(final[name].mean()), 'min': float(final[name].min()),
+                   'max': float(final[name].max())}
+            for name in SUMMARY_FIELDS}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many engine instances in parallel threads")
+    parser.add_argument('scenarios', nargs='*', default=['launch'],
+                        help=f"built-in scenarios ({', '.join(SCENARIOS)}) or JSON scripts, "
+                             "assigned to instances round-robin")
+    parser.add_argument('--instances', type=int, default=16, help="number of engines to run (default 16)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker threads (default: CPU count)")
+    parser.add_argument('--dt', type=float, default=0.001, help="physics timestep in seconds (default 0.001)")
+    parser.add_argument('--seed', type=int, default=0, help="base seed, instance i uses seed + i")
+    parser.add_argument('--backend', choices=('native', 'python'), default='native',
+                        help="native = C++ library (threads scale), python = EnginePhysicsPython (GIL-bound)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    
+    if args.backend == 'native' and not HAS_STEP_N:
+        parser.error("the native backend needs engine_physics.dll with EnginePhysics_stepN")
+    
+    loaded = [load_scenario(name) for name in args.scenarios]
+    scenarios = [loaded[i % len(loaded)] for i in range(args.instances)]
+    result = run_instances(scenarios, args.workers, args.dt, args.seed, args.backend)
+    telemetry = summarize_final(result['final'])
+    
+    if args.json:
+        summary = {key: value for key, value in result.items() if key != 'final'}
+        summary.update(scenarios=args.scenarios, backend=args.backend, dt=args.dt, telemetry=telemetry)
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 60)
+    print(f"PARALLEL RUN - {result['instances']} instances of {', '.join(args.scenarios)} ({args.backend})")
+    print("=" * 60)
+    print(f"{'worker':<12}{'inst':>6}{'steps':>14}{'wall s':>9}{'cpu s':>9}{'steps/s':>14}")
+    for w in result['workers']:
+        print(f"{w['worker']:<12}{w['instances']:>6}{w['steps']:>14,}{w['wall_time']:>9.2f}"
+              f"{w['cpu_time']:>9.2f}{w['steps_per_sec']:>14,.0f}")
+    print("-" * 60)
+    print(f"Total:       {result['steps']:,} steps in {result['wall_time']:.3f} s "
+          f"= {result['steps_per_sec']:,.0f} steps/s")
+    print(f"Parallelism: {result['parallelism']:.2f} cores busy with {len(result['workers'])} workers")
+    print("-" * 60)
+    print(f"{'field':<16}{'mean':>12}{'min':>12}{'max':>12}")
+    for name, stats in telemetry.items():
+        print(f"{name:<16}{stats['mean']:>12.3f}{stats['min']:>12.3f}{stats['max']:>12.3f}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Background physics thread
+Owns an engine instance, steps it at a fixed rate and publishes state snapshots
+that the GUI thread can read without blocking
+"""
+import collections
+import ctypes
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from engine_wrapper import EngineState, ENGINE_STATE_DTYPE
+from simulation_clock import FixedStepAccumulator
+
+
+class CommandSlot:
+    """
+    Input channel from the GUI thread to the physics thread.
+    
+    Throttle and brake are latest-value slots: the GUI overwrites them and the
+    physics thread picks up whatever is current at its next batch. Discrete
+    commands (shifts, start/stop, config changes) go through a deque so none
+    are lost and they run in order. Plain attribute stores and deque
+    append/popleft are atomic in CPython, so no lock is taken on either side.
+    """
+    
+    def __init__(self):
+        self.throttle = 0.0
+        self.brake = 0.0
+        self._events = collections.deque()
+    
+    def post(self, name, *args):
+        """Queue an engine method call, e.g. post('shift_up') or post('set_gear', 2)"""
+        self._events.append((name, args, None))
+    
+    def request(self, name, *args):
+        """Queue an engine method call and return a Future for its result, e.g. request('save_state')"""
+        future = Future()
+        self._events.append((name, args, future))
+        return future
+    
+    def drain(self):
+        """Yield queued (name, args, future) commands in order (physics thread only)"""
+        events = self._events
+        while events:
+            yield events.popleft()
+    
+    def run(self, engine):
+        """Apply every queued command to `engine` (physics thread only)"""
+        for name, args, future in self.drain():
+            try:
+                result = getattr(engine, name)(*args)
+            except Exception as e:
+                if future is None:
+                    raise
+                future.set_exception(e)
+            else:
+                if future is not None:
+                    future.set_result(result)
+
+
+class SnapshotBuffer:
+    """
+    Double-buffered EngineState with a single writer.
+    
+    publish() fills the back buffer and then bumps the sequence number, which
+    flips it to the front. read() copies the front buffer and retries if a
+    publish landed meanwhile, since the next publish reuses that buffer.
+    """
+    
+    def __init__(self):
+        self._buffers = (EngineState(), EngineState())
+        self._addresses = tuple(ctypes.addressof(b) for b in self._buffers)
+        self._size = ctypes.sizeof(EngineState)
+        self.sequence = 0
+    
+    def publish(self, state):
+        """Publish a new snapshot (writer thread only)"""
+        ctypes.memmove(self._addresses[(self.sequence + 1) & 1], ctypes.addressof(state), self._size)
+        self.sequence += 1
+    
+    def read(self, out):
+        """Copy the latest snapshot into `out` and return its sequence number"""
+        target = ctypes.addressof(out)
+        while True:
+            sequence = self.sequence
+            ctypes.memmove(target, self._addresses[sequence & 1], self._size)
+            if self.sequence == sequence:
+                return sequence
+
+
+class PhysicsThread(threading.Thread):
+    """
+    Steps an engine on a fixed clock in a daemon thread.
+    
+    The engine needs step_n(n, dt, brake=...) and get_state(). Every call into
+    it must come from this thread once it is running; other threads talk to it
+    through `commands` and read its state from `snapshots`. ctypes drops the
+    GIL during library calls, so stepping overlaps with GUI work.
+    """
+    
+    def __init__(self, engine, rate_hz=1000, batch_time=0.002):
+        super().__init__(name='physics', daemon=True)
+        self.engine = engine
+        self.clock = FixedStepAccumulator(rate_hz)
+        self.batch_time = batch_time
+        self.commands = CommandSlot()
+        self.snapshots = SnapshotBuffer()
+        self.snapshots.publish(engine.get_state())
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        throttle = None
+        last_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            current_time = time.perf_counter()
+            steps = self.clock.advance(current_time - last_time)
+            last_time = current_time
+            
+            try:
+                self.commands.run(self.engine)
+                
+                if self.commands.throttle != throttle:
+                    throttle = self.commands.throttle
+                    self.engine.set_throttle(throttle)
+                
+                if steps > 0:
+                    brake = self.commands.brake
+                    self.engine.step_n(steps, self.clock.dt, brake=brake if brake > 0 else None)
+                    self.snapshots.publish(self.engine.get_state())
+            except Exception as e:
+                print(f"Physics thread error: {e}")
+            
+            self._stop_event.wait(self.batch_time)
+    
+    def stop(self, timeout=1.0):
+        """Ask the thread to exit and wait for it"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+class AudioClockedPhysics:
+    """
+    Physics stepped from the audio callback, with the sound card as the master clock.
+    
+    Each audio block calls advance() with the block duration; the due sub-steps
+    run in one batched step_n call and their per-step states are returned so
+    the synth can follow them within the block. Exposes the same `commands`
+    and `snapshots` as PhysicsThread, so the GUI talks to either the same way.
+    The engine needs step_n(n, dt, brake=..., out=...) and get_state().
+    """
+    
+    def __init__(self, engine, rate_hz=1000, max_block_time=0.25):
+        self.engine = engine
+        self.clock = FixedStepAccumulator(rate_hz, max_block_time)
+        self.commands = CommandSlot()
+        self.snapshots = SnapshotBuffer()
+        self.snapshots.publish(engine.get_state())
+        self.running = True
+        self._throttle = None
+        self._records = np.zeros(int(rate_hz * max_block_time) + 1, dtype=ENGINE_STATE_DTYPE)
+    
+    def advance(self, block_time):
+        """Run the sub-steps due for one audio block and return their states"""
+        steps = self.clock.advance(block_time) if self.running else 0
+        
+        self.commands.run(self.engine)
+        if self.commands.throttle != self._throttle:
+            self._throttle = self.commands.throttle
+            self.engine.set_throttle(self._throttle)
+        
+        records = self._records[:steps]
+        if steps > 0:
+            brake = self.commands.brake
+            self.engine.step_n(steps, self.clock.dt, brake=brake if brake > 0 else None, out=records)
+            self.snapshots.publish(self.engine.get_state())
+        return records
+    
+    def stop(self, timeout=None):
+        """Stop stepping (the audio callback keeps running but no longer advances physics)"""
+        self.running = False
@@ -0,0 +1,63 @@
+"""
+Fixed-timestep clock for the physics simulation
+Converts variable frame intervals into whole fixed-size physics steps
+"""
+
+# EngineState fields that are blended between physics steps for display
+INTERPOLATED_FIELDS = (
+    'rpm', 'target_rpm', 'speed', 'torque', 'power', 'boost', 'throttle_position',
+    'oil_temp', 'coolant_temp', 'intake_temp', 'fuel_level', 'fuel_consumption',
+    'engine_wear', 'total_distance', 'runtime',
+)
+
+
+class FixedStepAccumulator:
+    """
+    Fixed-dt accumulator: frame time goes in, an integer number of physics
+    steps comes out, and the remainder carries over to the next frame.
+    Frame time is capped at max_frame_time so a stalled frame cannot request
+    an unbounded burst of steps.
+    """
+    
+    def __init__(self, rate_hz=1000, max_frame_time=0.25):
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.total_steps = 0
+        self.set_rate(rate_hz)
+    
+    def set_rate(self, rate_hz):
+        """Change the physics rate (Hz)"""
+        if rate_hz <= 0:
+            raise ValueError("physics rate must be positive")
+        self.rate_hz = float(rate_hz)
+        self.dt = 1.0 / self.rate_hz
+    
+    def advance(self, frame_time):
+        """Add elapsed wall time and return how many physics steps are due"""
+        self.accumulator += min(max(frame_time, 0.0), self.max_frame_time)
+        steps = int(self.accumulator * self.rate_hz + 1e-9)
+        self.accumulator = max(0.0, self.accumulator - steps * self.dt)
+        self.total_steps += steps
+        return steps
+    
+    @property
+    def alpha(self):
+        """Fraction of a step left in the accumulator (display interpolation weight)"""
+        return min(1.0, self.accumulator * self.rate_hz)
+    
+    def reset(self):
+        self.accumulator = 0.0
+
+
+def interpolate_state(previous, current, alpha, out):
+    """
+    Blend two EngineState snapshots into `out`: continuous values are
+    interpolated, discrete ones (gear, flags) come from `current`.
+    """
+    for name, _ in out._fields_:
+        if name in INTERPOLATED_FIELDS:
+            a = getattr(previous, name)
+            setattr(out, name, a + (getattr(current, name) - a) * alpha)
+        else:
+            setattr(out, name, getattr(current, name))
+    return out
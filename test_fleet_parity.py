@@ -0,0 +1,122 @@
+import numpy as np
+
+from engine_wrapper import EngineFleet, EnginePhysics, HAS_CHECKPOINT, HAS_FLEET
+
+# EngineFleet and EnginePhysics step through the same per-tick kernel, so a
+# fleet instance seeded with SEED + i must match a single engine seeded the
+# same way bit for bit, and a checkpoint or clone must continue exactly as
+# the engine it was taken from.
+SEED = 7
+DT = 0.001
+
+# One row per instance: (throttle, brake, gear) held for `steps` ticks
+SEGMENTS = [
+    (1500, [(0.0, 0.0, 0), (0.8, 0.0, 0), (0.3, 0.0, 0), (0.0, 0.0, 0)]),
+    (4000, [(0.6, 0.0, 1), (1.0, 0.0, 1), (0.4, 0.0, 2), (0.9, 0.0, -1)]),
+    (6000, [(1.0, 0.0, 3), (0.7, 0.0, 2), (1.0, 0.0, 4), (0.0, 0.0, 0)]),
+    (3000, [(0.0, 0.5, 3), (0.0, 0.2, 2), (0.0, 0.0, 4), (0.5, 0.0, 0)]),
+    (4000, [(0.0, 0.0, 0), (0.2, 0.0, 1), (0.0, 1.0, 4), (0.0, 0.0, 0)]),
+]
+CHECKPOINT_AFTER = 2    # segments run before the engines are checkpointed
+COUNT = len(SEGMENTS[0][1])
+
+# (integration mode, subsystem rates in Hz)
+CONFIGS = [
+    ('euler', {}),
+    ('exponential', {'thermal': 20, 'wear': 1, 'fuel': 5}),
+]
+
+
+def configure(sim, mode, rates):
+    sim.set_integration_mode(mode)
+    for subsystem, hz in rates.items():
+        sim.set_subsystem_rate(subsystem, hz)
+
+
+def drive(engine, i, segments):
+    for steps, inputs in segments:
+        throttle, brake, gear = inputs[i]
+        engine.step_n(steps, DT, throttle=throttle, brake=brake, gear=gear, record=False)
+
+
+def drive_fleet(fleet, segments):
+    for steps, inputs in segments:
+        throttle, brake, gear = zip(*inputs)
+        fleet.set_inputs(throttle=throttle, brake=brake, gear=gear)
+        fleet.step(DT, steps)
+
+
+def snapshot(engine):
+    """Current state of a single engine as one ENGINE_STATE_DTYPE record"""
+    engine.get_state()
+    return engine.state_view[0].copy()
+
+
+def compare(label, expected, actual):
+    """Report whether two ENGINE_STATE_DTYPE records are bit-identical"""
+    if expected.tobytes() == actual.tobytes():
+        print(f"✓ {label}")
+        return True
+    print(f"✗ {label}")
+    for name in expected.dtype.names:
+        if expected[name] != actual[name]:
+            print(f"    {name}: {expected[name]!r} != {actual[name]!r}")
+    return False
+
+
+print("="*60)
+print("ENGINE SIMULATOR - FLEET / SINGLE ENGINE PARITY TEST")
+print("="*60)
+
+if not HAS_FLEET or not HAS_CHECKPOINT:
+    print("✗ engine_physics.dll lacks EngineFleet or checkpoints, rebuild it")
+    exit(1)
+
+passed = True
+for mode, rates in CONFIGS:
+    print("-"*60)
+    print(f"Integration: {mode}, subsystem rates: {rates or 'every tick'}")
+    print("-"*60)
+    
+    fleet = EngineFleet(COUNT, threads=2, seed=SEED)
+    configure(fleet, mode, rates)
+    fleet.start_engines()
+    
+    engines = []
+    for i in range(COUNT):
+        engine = EnginePhysics(seed=SEED + i)
+        configure(engine, mode, rates)
+        engine.start_engine()
+        engines.append(engine)
+    
+    # First half, then checkpoint instance 0 three ways
+    drive_fleet(fleet, SEGMENTS[:CHECKPOINT_AFTER])
+    for i, engine in enumerate(engines):
+        drive(engine, i, SEGMENTS[:CHECKPOINT_AFTER])
+    
+    blob = engines[0].save_state()
+    twin = engines[0].clone()
+    restored = EnginePhysics()
+    restored.load_state(blob)
+    
+    # Second half for everyone
+    drive_fleet(fleet, SEGMENTS[CHECKPOINT_AFTER:])
+    for i, engine in enumerate(engines):
+        drive(engine, i, SEGMENTS[CHECKPOINT_AFTER:])
+    drive(twin, 0, SEGMENTS[CHECKPOINT_AFTER:])
+    drive(restored, 0, SEGMENTS[CHECKPOINT_AFTER:])
+    
+    fleet_state = fleet.get_state()
+    for i, engine in enumerate(engines):
+        passed &= compare(f"fleet instance {i} matches EnginePhysics(seed={SEED + i})",
+                          snapshot(engine), fleet_state[i])
+    passed &= compare("clone() continues like the original", snapshot(engines[0]), snapshot(twin))
+    passed &= compare("load_state() continues like the original", snapshot(engines[0]), snapshot(restored))
+
+print("="*60)
+if passed:
+    print("✓ Fleet, single engine and checkpoints agree")
+else:
+    print("✗ Parity test failed")
+    exit(1)
+print("="*60)